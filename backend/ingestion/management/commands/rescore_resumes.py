@@ -0,0 +1,74 @@
+"""
+Management command to rescore every stored resume after a scoring-rule or weight change
+"""
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from ingestion.models import ResumeScore
+from placement_portal.ml_registry import MLRegistry, ResumeScorer
+
+UPDATE_FIELDS = ['overall_score', 'breakdown', 'recommendations', 'features']
+
+
+class Command(BaseCommand):
+    help = 'Rescore stored resumes in bulk from their saved features (or re-read the parsed text)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Resumes scored and written per batch')
+        parser.add_argument('--reextract', action='store_true',
+                            help="Re-read features from the parsed text and the student's current skills "
+                                 "(needed after the feature rules change, not after a weight change)")
+
+    def handle(self, *args, **options):
+        if not ResumeScorer:
+            raise CommandError('ML scorer not available')
+
+        from resume_scorer.scorer import FEATURES
+
+        scorer = MLRegistry.get_resume_scorer()
+        batch_size = options['batch_size']
+        queryset = ResumeScore.objects.select_related('student').only(
+            'id', 'features', 'parsed_text', 'student__skills'
+        ).order_by('id')
+        if not options['reextract']:
+            # Rows saved before features were stored load their text on demand
+            queryset = queryset.defer('parsed_text')
+
+        start = time.perf_counter()
+        rescored = reextracted = 0
+        batch = []
+        for score in queryset.iterator(chunk_size=batch_size):
+            batch.append(score)
+            if len(batch) >= batch_size:
+                reextracted += self.rescore(scorer, batch, FEATURES, options['reextract'])
+                rescored += len(batch)
+                batch = []
+        if batch:
+            reextracted += self.rescore(scorer, batch, FEATURES, options['reextract'])
+            rescored += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ Rescored {rescored} resumes ({reextracted} re-extracted) in {time.perf_counter() - start:.2f}s'
+        ))
+
+    def rescore(self, scorer, batch, feature_names, reextract):
+        """Score one batch with a single feature matrix and write it back with one bulk_update"""
+        features = []
+        reextracted = 0
+        for score in batch:
+            if reextract or not all(name in score.features for name in feature_names):
+                features.append(scorer.extract_features(score.parsed_text, score.student.skills or []))
+                reextracted += 1
+            else:
+                features.append(score.features)
+
+        results = scorer.score_feature_matrix(scorer.features_to_matrix(features))
+        for score, result in zip(batch, results):
+            score.overall_score = result['overall_score']
+            score.breakdown = result['breakdown']
+            score.recommendations = result['recommendations']
+            score.features = result['features']
+
+        with transaction.atomic():
+            ResumeScore.objects.bulk_update(batch, UPDATE_FIELDS, batch_size=len(batch))
+        return reextracted
@@ -0,0 +1,67 @@
+"""
+Management command that works through the resume ingest queue
+"""
+import os
+import signal
+import socket
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from ingestion.pipeline import process
+from placement_portal.ml_registry import MLRegistry, ResumeParser
+from ingestion.queue import IngestQueue
+
+
+class Command(BaseCommand):
+    help = 'Process queued resume uploads (parse, extract skills, score, update the student profile)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Exit once the queue is empty')
+        parser.add_argument('--max-jobs', type=int, default=None, help='Exit after this many jobs')
+        parser.add_argument('--sleep', type=float, default=None,
+                            help='Seconds to wait when the queue is empty (defaults to INGEST_POLL_INTERVAL)')
+        parser.add_argument('--worker-id', default=None, help='Name recorded on claimed jobs')
+
+    def handle(self, *args, **options):
+        worker_id = options['worker_id'] or f'{socket.gethostname()}:{os.getpid()}'
+        sleep = options['sleep'] if options['sleep'] is not None else settings.INGEST_POLL_INTERVAL
+        self.stopping = False
+
+        def stop(signum, frame):
+            # Finish the current job, then exit
+            self.stopping = True
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+
+        if ResumeParser:
+            # Loaded once here, so every forked parse reuses the spaCy model
+            MLRegistry.get_resume_parser().load_nlp()
+
+        self.stdout.write(f'Ingest worker {worker_id} started')
+        processed = 0
+        while not self.stopping:
+            close_old_connections()
+            requeued = IngestQueue.requeue_stale()
+            if requeued:
+                self.stdout.write(self.style.WARNING(f'Requeued {requeued} stale jobs'))
+
+            job = IngestQueue.claim(worker_id)
+            if job is None:
+                if options['once']:
+                    break
+                time.sleep(sleep)
+                continue
+
+            started = time.perf_counter()
+            if process(job):
+                self.stdout.write(f'Job {job.id}: done ({time.perf_counter() - started:.2f}s)')
+            else:
+                self.stdout.write(self.style.WARNING(f'Job {job.id}: {job.status.lower()} - {job.error}'))
+
+            processed += 1
+            if options['max_jobs'] and processed >= options['max_jobs']:
+                break
+
+        self.stdout.write(self.style.SUCCESS(f'✅ Processed {processed} jobs'))
@@ -0,0 +1,68 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:42
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('students', '0002_skill_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeIngestJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('resume_id', models.PositiveIntegerField(blank=True, null=True)),
+                ('file', models.FileField(upload_to='ingest/%Y/%m/')),
+                ('status', models.CharField(choices=[('QUEUED', 'Queued'), ('RUNNING', 'Running'), ('SUCCEEDED', 'Succeeded'), ('FAILED', 'Failed')], default='QUEUED', max_length=20)),
+                ('stage', models.CharField(choices=[('QUEUED', 'Queued'), ('PARSING', 'Parsing'), ('SCORING', 'Scoring'), ('SAVING', 'Saving'), ('DONE', 'Done')], default='QUEUED', max_length=20)),
+                ('progress', models.PositiveSmallIntegerField(default=0)),
+                ('priority', models.SmallIntegerField(default=0)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('max_attempts', models.PositiveSmallIntegerField(default=3)),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now)),
+                ('locked_by', models.CharField(blank=True, max_length=100, null=True)),
+                ('locked_at', models.DateTimeField(blank=True, null=True)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('result', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ingest_jobs', to='students.student')),
+            ],
+            options={
+                'db_table': 'resume_ingest_jobs',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ResumeScore',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('resume_id', models.PositiveIntegerField(blank=True, null=True)),
+                ('parsed_text', models.TextField(blank=True)),
+                ('skills', models.JSONField(blank=True, default=list)),
+                ('content_hash', models.CharField(blank=True, max_length=64)),
+                ('overall_score', models.FloatField(default=0)),
+                ('breakdown', models.JSONField(blank=True, default=dict)),
+                ('recommendations', models.JSONField(blank=True, default=list)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('ingest_job', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='score', to='ingestion.resumeingestjob')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='resume_scores', to='students.student')),
+            ],
+            options={
+                'db_table': 'resume_scores',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='resumeingestjob',
+            index=models.Index(fields=['status', '-priority', 'run_after'], name='ingest_job_claim_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ingestion', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumescore',
+            name='features',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,86 @@
+from django.db import models
+from django.utils import timezone
+from students.models import Student
+
+
+class ResumeIngestJob(models.Model):
+    """
+    One uploaded resume waiting for (or going through) parse -> extract skills -> score.
+    The table doubles as the queue: workers claim QUEUED rows, highest priority first
+    """
+    
+    student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name='ingest_jobs')
+    resume_id = models.PositiveIntegerField(null=True, blank=True)
+    file = models.FileField(upload_to='ingest/%Y/%m/')
+    
+    STATUS_CHOICES = (
+        ('QUEUED', 'Queued'),
+        ('RUNNING', 'Running'),
+        ('SUCCEEDED', 'Succeeded'),
+        ('FAILED', 'Failed'),
+    )
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='QUEUED')
+    
+    STAGE_CHOICES = (
+        ('QUEUED', 'Queued'),
+        ('PARSING', 'Parsing'),
+        ('SCORING', 'Scoring'),
+        ('SAVING', 'Saving'),
+        ('DONE', 'Done'),
+    )
+    stage = models.CharField(max_length=20, choices=STAGE_CHOICES, default='QUEUED')
+    progress = models.PositiveSmallIntegerField(default=0)
+    
+    # Higher runs first
+    priority = models.SmallIntegerField(default=0)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=3)
+    run_after = models.DateTimeField(default=timezone.now)
+    
+    locked_by = models.CharField(max_length=100, blank=True, null=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    
+    error = models.TextField(blank=True, null=True)
+    result = models.JSONField(default=dict, blank=True)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    
+    def __str__(self):
+        return f"Ingest job {self.id} - {self.student_id} ({self.status})"
+    
+    class Meta:
+        db_table = 'resume_ingest_jobs'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', '-priority', 'run_after'], name='ingest_job_claim_idx'),
+        ]
+
+
+class ResumeScore(models.Model):
+    """Outcome of a successful ingest: the parsed text, its skills and the resume score"""
+    
+    student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name='resume_scores')
+    resume_id = models.PositiveIntegerField(null=True, blank=True)
+    ingest_job = models.OneToOneField(ResumeIngestJob, on_delete=models.SET_NULL, null=True, blank=True,
+                                      related_name='score')
+    
+    parsed_text = models.TextField(blank=True)
+    skills = models.JSONField(default=list, blank=True)
+    content_hash = models.CharField(max_length=64, blank=True)
+    
+    overall_score = models.FloatField(default=0)
+    breakdown = models.JSONField(default=dict, blank=True)
+    recommendations = models.JSONField(default=list, blank=True)
+    # ResumeScorer.extract_features() output, so rescore_resumes can apply new weights without the text
+    features = models.JSONField(default=dict, blank=True)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    def __str__(self):
+        return f"{self.student_id} - {self.overall_score}"
+    
+    class Meta:
+        db_table = 'resume_scores'
+        ordering = ['-created_at']
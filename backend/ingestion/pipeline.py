@@ -0,0 +1,140 @@
+"""
+Resume Ingest Pipeline
+parse -> extract skills -> score -> update Student.skills for one claimed job
+"""
+from django.apps import apps
+from django.db import transaction
+from placement_portal.ml_registry import MLRegistry, ResumeParser, ResumeScorer
+from .models import ResumeScore
+from .queue import IngestQueue
+
+
+class IngestError(Exception):
+    """A job failed; reason is a guard failure reason (or None for unexpected errors)"""
+
+    def __init__(self, message, reason=None):
+        super().__init__(message)
+        self.reason = reason
+
+
+def merge_skills(current, found):
+    """Current skills followed by newly found ones, without case-insensitive duplicates"""
+    merged = list(current or [])
+    seen = {skill.lower() for skill in merged}
+    for skill in found:
+        if skill.lower() not in seen:
+            seen.add(skill.lower())
+            merged.append(skill)
+    return merged
+
+
+def resume_model():
+    """The Resume model when the resumes app is installed"""
+    try:
+        return apps.get_model('resumes', 'Resume')
+    except LookupError:
+        return None
+
+
+def create_score(student, text, profile_skills, **fields):
+    """Score a resume text (with the profile's skill list) once and store it as a ResumeScore"""
+    scored = MLRegistry.get_resume_scorer().score_resume({'text': text, 'skills': profile_skills})
+    return ResumeScore.objects.create(
+        student=student,
+        parsed_text=text,
+        overall_score=scored['overall_score'],
+        breakdown=scored['breakdown'],
+        recommendations=scored['recommendations'],
+        features=scored['features'],
+        **fields
+    )
+
+
+def refresh_score(score, student):
+    """
+    Rescore a stored ResumeScore when its inputs changed since it was computed
+    (the text is fixed, so only the student's skill count can); returns True if updated
+    """
+    skill_count = len(student.skills or [])
+    if score.features.get('skill_count') == skill_count or not ResumeScorer:
+        return False
+
+    scorer = MLRegistry.get_resume_scorer()
+    if score.features:
+        features = {**score.features, 'skill_count': skill_count}
+    else:
+        features = scorer.extract_features(score.parsed_text, student.skills or [])
+    [scored] = scorer.score_feature_matrix(scorer.features_to_matrix([features]))
+    score.overall_score = scored['overall_score']
+    score.breakdown = scored['breakdown']
+    score.recommendations = scored['recommendations']
+    score.features = scored['features']
+    score.save(update_fields=['overall_score', 'breakdown', 'recommendations', 'features'])
+    return True
+
+
+def run_job(job):
+    """Process a claimed job and return its result; raises IngestError on failure"""
+    if not ResumeParser or not ResumeScorer:
+        raise IngestError('ML modules not available')
+
+    parsed = MLRegistry.get_guarded_resume_parser().extract_skills(job.file.path)
+    if not parsed['ok']:
+        raise IngestError(parsed['error'], parsed['reason'])
+
+    IngestQueue.set_stage(job, 'SCORING')
+    student = job.student
+    # Only dictionary skills (the extractor's mention counts) reach the profile; NER
+    # ORG/PRODUCT entities are too noisy (employers, universities) and stay on the score
+    skills = merge_skills(student.skills, list(parsed['skill_mentions']))
+
+    # Checked again here (not only at upload) so a job can never write to another student's resume
+    Resume = resume_model()
+    resume_id = None
+    if Resume and job.resume_id and Resume.objects.filter(id=job.resume_id, student_id=job.student_id).exists():
+        resume_id = job.resume_id
+
+    IngestQueue.set_stage(job, 'SAVING')
+    with transaction.atomic():
+        # Scored once here; ResumeScoreView only rescores when the student's skills change
+        score = create_score(
+            student, parsed['cleaned_text'], skills,
+            resume_id=resume_id,
+            ingest_job=job,
+            skills=parsed['skills'],
+            content_hash=parsed['content_hash'] or ''
+        )
+        if skills != (student.skills or []):
+            student.skills = skills
+            # Through save() so the skill index and recommendation cache follow
+            student.save(update_fields=['skills', 'updated_at'])
+
+        if resume_id:
+            Resume.objects.filter(id=resume_id, student_id=job.student_id).update(
+                is_parsed=True, parsed_text=parsed['cleaned_text']
+            )
+
+    return {
+        'score_id': score.id,
+        'overall_score': score.overall_score,
+        'skills': parsed['skills'],
+        'skill_count': parsed['skill_count'],
+        'page_count': parsed['page_count'],
+        'cached': parsed['cached'],
+        'elapsed': parsed['elapsed'],
+    }
+
+
+def process(job):
+    """Run a claimed job and record the outcome on the queue; returns True on success"""
+    try:
+        result = run_job(job)
+    except IngestError as e:
+        IngestQueue.fail(job, str(e), e.reason)
+        return False
+    except Exception as e:
+        print(f"Resume ingest job {job.id} failed: {e}")
+        IngestQueue.fail(job, f'{type(e).__name__}: {e}')
+        return False
+    IngestQueue.succeed(job, result)
+    return True
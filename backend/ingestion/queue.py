@@ -0,0 +1,119 @@
+"""
+Resume Ingest Queue
+A job queue on top of the ResumeIngestJob table, so background parsing needs no
+broker service: workers claim rows with a conditional UPDATE, which only one of
+them can win, and failed jobs are retried with exponential backoff
+"""
+from datetime import timedelta
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+from .models import ResumeIngestJob
+
+# Guard failure reasons that won't change on a retry (the file itself is the problem)
+PERMANENT_FAILURES = {'timeout', 'memory_limit', 'too_many_pages', 'no_text'}
+
+# Progress reported when a stage starts
+STAGE_PROGRESS = {
+    'QUEUED': 0,
+    'PARSING': 10,
+    'SCORING': 60,
+    'SAVING': 85,
+    'DONE': 100,
+}
+
+
+class IngestQueue:
+    """Enqueue, claim and finish resume ingest jobs"""
+
+    @classmethod
+    def enqueue(cls, student, file, resume_id=None, priority=0):
+        return ResumeIngestJob.objects.create(
+            student=student,
+            file=file,
+            resume_id=resume_id,
+            priority=priority,
+            max_attempts=settings.INGEST_MAX_ATTEMPTS
+        )
+
+    @classmethod
+    def claim(cls, worker_id):
+        """
+        Lock the next due job for worker_id and return it (None if the queue is empty)
+        Another worker may take a candidate first; then the next one is tried
+        """
+        now = timezone.now()
+        candidates = ResumeIngestJob.objects.filter(
+            status='QUEUED', run_after__lte=now
+        ).order_by('-priority', 'run_after', 'id').values_list('id', flat=True)
+
+        for job_id in candidates[:10]:
+            claimed = ResumeIngestJob.objects.filter(id=job_id, status='QUEUED').update(
+                status='RUNNING',
+                stage='PARSING',
+                progress=STAGE_PROGRESS['PARSING'],
+                attempts=F('attempts') + 1,
+                locked_by=worker_id,
+                locked_at=now,
+                updated_at=now
+            )
+            if claimed:
+                return ResumeIngestJob.objects.select_related('student').get(id=job_id)
+        return None
+
+    @classmethod
+    def set_stage(cls, job, stage):
+        job.stage = stage
+        job.progress = STAGE_PROGRESS[stage]
+        job.save(update_fields=['stage', 'progress', 'updated_at'])
+
+    @classmethod
+    def succeed(cls, job, result):
+        job.status = 'SUCCEEDED'
+        job.stage = 'DONE'
+        job.progress = STAGE_PROGRESS['DONE']
+        job.result = result
+        job.error = None
+        job.locked_by = None
+        job.finished_at = timezone.now()
+        job.save(update_fields=['status', 'stage', 'progress', 'result', 'error', 'locked_by',
+                                'finished_at', 'updated_at'])
+
+    @classmethod
+    def fail(cls, job, error, reason=None):
+        """
+        Record a failed attempt. Transient failures go back on the queue after
+        INGEST_RETRY_BACKOFF_SECONDS * 2^(attempts - 1); a bad file or the last attempt fails the job
+        """
+        job.error = error
+        job.locked_by = None
+        if reason not in PERMANENT_FAILURES and job.attempts < job.max_attempts:
+            job.status = 'QUEUED'
+            job.stage = 'QUEUED'
+            job.progress = STAGE_PROGRESS['QUEUED']
+            delay = settings.INGEST_RETRY_BACKOFF_SECONDS * 2 ** max(job.attempts - 1, 0)
+            job.run_after = timezone.now() + timedelta(seconds=delay)
+        else:
+            job.status = 'FAILED'
+            job.finished_at = timezone.now()
+        job.result = {**job.result, 'reason': reason}
+        job.save(update_fields=['status', 'stage', 'progress', 'error', 'result', 'locked_by',
+                                'run_after', 'finished_at', 'updated_at'])
+
+    @classmethod
+    def requeue_stale(cls):
+        """
+        Put back RUNNING jobs whose worker has gone quiet (killed mid-job);
+        each still counts as a used attempt
+        """
+        cutoff = timezone.now() - timedelta(seconds=settings.INGEST_STALE_AFTER_SECONDS)
+        stale = ResumeIngestJob.objects.filter(status='RUNNING', updated_at__lt=cutoff)
+        failed = stale.filter(attempts__gte=F('max_attempts')).update(
+            status='FAILED', locked_by=None, error='Worker stopped responding',
+            finished_at=timezone.now(), updated_at=timezone.now()
+        )
+        requeued = stale.update(
+            status='QUEUED', stage='QUEUED', progress=0, locked_by=None,
+            error='Worker stopped responding', updated_at=timezone.now()
+        )
+        return requeued + failed
@@ -0,0 +1,26 @@
+from rest_framework import serializers
+from .models import ResumeIngestJob
+
+
+class ResumeUploadSerializer(serializers.Serializer):
+    """A resume PDF to queue for ingestion"""
+    
+    file = serializers.FileField()
+    resume_id = serializers.IntegerField(required=False, allow_null=True)
+    
+    def validate_file(self, value):
+        if not value.name.lower().endswith('.pdf'):
+            raise serializers.ValidationError('Only PDF files are allowed')
+        if value.size > 5 * 1024 * 1024:
+            raise serializers.ValidationError('File size must be under 5MB')
+        return value
+
+
+class ResumeIngestJobSerializer(serializers.ModelSerializer):
+    """Status of an ingest job, polled by the frontend"""
+    
+    class Meta:
+        model = ResumeIngestJob
+        fields = ['id', 'resume_id', 'status', 'stage', 'progress', 'priority', 'attempts', 'max_attempts',
+                  'run_after', 'error', 'result', 'created_at', 'updated_at', 'finished_at']
+        read_only_fields = fields
@@ -0,0 +1,295 @@
+"""
+Test suite for the resume ingest queue
+"""
+import shutil
+import tempfile
+import unittest
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from authentication.models import User
+from students.models import Student
+from placement_portal.ml_registry import MLRegistry, ResumeParser, ResumeScorer
+from .models import ResumeIngestJob, ResumeScore
+from .pipeline import create_score, process, refresh_score, resume_model
+from .queue import IngestQueue
+
+
+class StubGuardedParser:
+    """Stands in for GuardedResumeParser: returns a fixed parse for any file"""
+    
+    def __init__(self, **result):
+        self.result = {
+            'ok': True, 'reason': None, 'error': None, 'stage': 'skills',
+            'raw_text': '', 'cleaned_text': 'Education B.Tech, CGPA: 8.5 Experience - Developed APIs',
+            'skills': [], 'skill_count': 0, 'skill_mentions': {}, 'content_hash': 'abc123',
+            'page_count': 1, 'cached': False, 'elapsed': 0.01,
+            **result
+        }
+        self.result['skill_count'] = len(self.result['skills'])
+    
+    def extract_skills(self, pdf_path):
+        return dict(self.result)
+
+
+@override_settings(INGEST_MAX_ATTEMPTS=2, INGEST_RETRY_BACKOFF_SECONDS=30)
+class IngestQueueTestCase(TestCase):
+    """Test claiming, retrying and failing ingest jobs"""
+    
+    def setUp(self):
+        # Uploaded files go to a throwaway MEDIA_ROOT, not the project's media directory
+        self.media_root = tempfile.mkdtemp()
+        media = override_settings(MEDIA_ROOT=self.media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+        
+        user = User.objects.create_user(
+            username='student',
+            email='student@example.com',
+            password='testpass123',
+            first_name='John',
+            last_name='Student',
+            role='student'
+        )
+        self.student = Student.objects.create(
+            user=user, name='John Student', roll_number='CS2021001', branch='CSE', cgpa=8.5, year=4, phone='9999999999'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=user)
+    
+    def tearDown(self):
+        shutil.rmtree(self.media_root, ignore_errors=True)
+    
+    def enqueue(self, priority=0):
+        return IngestQueue.enqueue(self.student, SimpleUploadedFile('resume.pdf', b'%PDF-1.4'), priority=priority)
+    
+    def test_claim_takes_highest_priority_once(self):
+        """Higher priority jobs are claimed first and a job is only handed out once"""
+        low = self.enqueue()
+        high = self.enqueue(priority=5)
+        
+        self.assertEqual(IngestQueue.claim('w1').id, high.id)
+        self.assertEqual(IngestQueue.claim('w2').id, low.id)
+        self.assertIsNone(IngestQueue.claim('w3'))
+        
+        high.refresh_from_db()
+        self.assertEqual(high.status, 'RUNNING')
+        self.assertEqual(high.attempts, 1)
+        self.assertEqual(high.locked_by, 'w1')
+    
+    def test_transient_failure_is_retried_with_backoff(self):
+        """Errors requeue the job until max_attempts; a bad file fails at once"""
+        self.enqueue()
+        job = IngestQueue.claim('w1')
+        IngestQueue.fail(job, 'Parser process exited with code -9', 'crashed')
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'QUEUED')
+        self.assertGreater(job.run_after, timezone.now() + timedelta(seconds=20))
+        self.assertIsNone(IngestQueue.claim('w1'))
+        
+        ResumeIngestJob.objects.filter(id=job.id).update(run_after=timezone.now())
+        job = IngestQueue.claim('w1')
+        IngestQueue.fail(job, 'Parser process exited with code -9', 'crashed')
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'FAILED')
+        
+        self.enqueue()
+        job = IngestQueue.claim('w1')
+        IngestQueue.fail(job, 'No text could be extracted', 'no_text')
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'FAILED')
+        self.assertEqual(job.attempts, 1)
+    
+    def test_stale_running_jobs_are_requeued_or_failed(self):
+        """Jobs whose worker went quiet go back on the queue, unless their attempts are used up"""
+        retried = self.enqueue()
+        exhausted = self.enqueue()
+        fresh = self.enqueue()
+        ResumeIngestJob.objects.update(status='RUNNING', locked_by='w1')
+        ResumeIngestJob.objects.filter(id=exhausted.id).update(attempts=2)
+        with override_settings(INGEST_STALE_AFTER_SECONDS=60):
+            ResumeIngestJob.objects.exclude(id=fresh.id).update(updated_at=timezone.now() - timedelta(seconds=120))
+            self.assertEqual(IngestQueue.requeue_stale(), 2)
+        
+        retried.refresh_from_db()
+        exhausted.refresh_from_db()
+        fresh.refresh_from_db()
+        self.assertEqual((retried.status, retried.locked_by), ('QUEUED', None))
+        self.assertEqual(exhausted.status, 'FAILED')
+        self.assertIsNotNone(exhausted.finished_at)
+        self.assertEqual((fresh.status, fresh.locked_by), ('RUNNING', 'w1'))
+    
+    @unittest.skipUnless(ResumeParser and ResumeScorer, 'ML modules not available')
+    def test_process_scores_resume_and_merges_skills(self):
+        """A parsed resume is scored once and its skills are added to the student's profile"""
+        self.student.skills = ['Python']
+        self.student.save()
+        # 'Infosys' stands for an NER entity: kept on the score, not added to the profile
+        parser = StubGuardedParser(skills=['python', 'docker', 'Infosys'], skill_mentions={'python': 2, 'docker': 1})
+        self.enqueue()
+        job = IngestQueue.claim('w1')
+        
+        with mock.patch.object(MLRegistry, 'get_guarded_resume_parser', return_value=parser):
+            self.assertTrue(process(job))
+        
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.stage, job.progress), ('SUCCEEDED', 'DONE', 100))
+        score = ResumeScore.objects.get(ingest_job=job)
+        self.assertEqual(job.result['score_id'], score.id)
+        self.assertEqual(score.skills, ['python', 'docker', 'Infosys'])
+        self.assertEqual(score.content_hash, 'abc123')
+        self.student.refresh_from_db()
+        self.assertEqual(self.student.skills, ['Python', 'docker'])
+        expected = MLRegistry.get_resume_scorer().score_resume(
+            {'text': parser.result['cleaned_text'], 'skills': ['Python', 'docker']}
+        )
+        self.assertEqual(score.overall_score, expected['overall_score'])
+    
+    @unittest.skipUnless(ResumeParser and ResumeScorer, 'ML modules not available')
+    def test_process_records_guard_failure(self):
+        """A guard failure fails the job with its reason and stores no score"""
+        self.enqueue()
+        job = IngestQueue.claim('w1')
+        parser = StubGuardedParser(ok=False, reason='no_text', error='No text could be extracted')
+        
+        with mock.patch.object(MLRegistry, 'get_guarded_resume_parser', return_value=parser):
+            self.assertFalse(process(job))
+        
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'FAILED')
+        self.assertEqual(job.result['reason'], 'no_text')
+        self.assertFalse(ResumeScore.objects.exists())
+    
+    @unittest.skipUnless(ResumeParser and ResumeScorer and resume_model(), 'ML modules or resumes app not available')
+    def test_process_only_updates_the_students_own_resume(self):
+        """A job pointing at another student's resume stores its score without touching that resume"""
+        other_user = User.objects.create_user(
+            username='other', email='other@example.com', password='testpass123', role='student'
+        )
+        other = Student.objects.create(
+            user=other_user, name='Other Student', roll_number='CS2021002', branch='CSE', year=4, phone='9999999999'
+        )
+        Resume = resume_model()
+        others_resume = Resume.objects.create(student=other)
+        own_resume = Resume.objects.create(student=self.student)
+        parser = StubGuardedParser(skills=['python'], skill_mentions={'python': 1})
+        
+        for resume in (others_resume, own_resume):
+            IngestQueue.enqueue(self.student, SimpleUploadedFile('resume.pdf', b'%PDF-1.4'), resume_id=resume.id)
+            job = IngestQueue.claim('w1')
+            with mock.patch.object(MLRegistry, 'get_guarded_resume_parser', return_value=parser):
+                self.assertTrue(process(job))
+        
+        others_resume.refresh_from_db()
+        own_resume.refresh_from_db()
+        self.assertFalse(others_resume.is_parsed)
+        self.assertTrue(own_resume.is_parsed)
+        self.assertEqual(own_resume.parsed_text, parser.result['cleaned_text'])
+        self.assertEqual(set(ResumeScore.objects.values_list('resume_id', flat=True)), {None, own_resume.id})
+    
+    def test_upload_queues_job_and_reports_status(self):
+        """Uploading returns 202 with a status URL the frontend can poll"""
+        response = self.client.post(
+            reverse('resume-ingest'),
+            {'file': SimpleUploadedFile('resume.pdf', b'%PDF-1.4', content_type='application/pdf')},
+            format='multipart'
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data['status'], 'QUEUED')
+        
+        response = self.client.get(response.data['status_url'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['progress'], 0)
+
+    @unittest.skipUnless(resume_model(), 'resumes app not installed')
+    def test_upload_rejects_another_students_resume(self):
+        """resume_id must belong to the uploading student"""
+        other_user = User.objects.create_user(
+            username='other', email='other@example.com', password='testpass123', role='student'
+        )
+        other = Student.objects.create(
+            user=other_user, name='Other Student', roll_number='CS2021002', branch='CSE', year=4, phone='9999999999'
+        )
+        Resume = resume_model()
+        others_resume = Resume.objects.create(student=other)
+        own_resume = Resume.objects.create(student=self.student)
+        
+        def upload(resume_id):
+            return self.client.post(
+                reverse('resume-ingest'),
+                {'file': SimpleUploadedFile('resume.pdf', b'%PDF-1.4', content_type='application/pdf'),
+                 'resume_id': resume_id},
+                format='multipart'
+            )
+        
+        self.assertEqual(upload(others_resume.id).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(ResumeIngestJob.objects.exists())
+        self.assertEqual(upload(own_resume.id).status_code, status.HTTP_202_ACCEPTED)
+
+    @unittest.skipUnless(ResumeScorer, 'ML scorer not available')
+    def test_rescore_uses_stored_features(self):
+        """rescore_resumes applies the current weights to saved features, without the text"""
+        scorer = MLRegistry.get_resume_scorer()
+        resume_data = {'text': 'Education\nB.Tech, CGPA: 8.5\nExperience\n- Developed APIs', 'skills': ['python'] * 5}
+        expected = scorer.score_resume(resume_data)
+        score = ResumeScore.objects.create(student=self.student, parsed_text='', features=expected['features'])
+        
+        call_command('rescore_resumes', stdout=StringIO())
+        
+        score.refresh_from_db()
+        self.assertEqual(score.overall_score, expected['overall_score'])
+        self.assertEqual(score.breakdown, expected['breakdown'])
+    
+    @unittest.skipUnless(ResumeScorer, 'ML scorer not available')
+    def test_rescore_applies_new_weights_in_batches(self):
+        """Every stored score is rescored, across batches; rows without features are re-read from their text"""
+        scorer = MLRegistry.get_resume_scorer()
+        texts = [
+            'Education\nB.Tech, CGPA: 8.5\nExperience\n- Developed APIs',
+            'Experience\n- Led a team of 5 and improved latency by 30%\nSkills\nteamwork',
+            'Projects\nBuilt a compiler\nEmail: john@example.com',
+        ]
+        self.student.skills = ['python', 'django', 'sql']
+        self.student.save()
+        scores = [
+            ResumeScore.objects.create(student=self.student, parsed_text=text,
+                                       features=scorer.extract_features(text, self.student.skills))
+            for text in texts
+        ]
+        # Saved before features were stored
+        legacy = ResumeScore.objects.create(student=self.student, parsed_text=texts[0], features={})
+        
+        weights = {**scorer.weights, 'skills': 0.05, 'experience': 0.50}
+        with mock.patch.object(scorer, 'weights', weights):
+            out = StringIO()
+            call_command('rescore_resumes', '--batch-size', '2', stdout=out)
+            expected = [scorer.score_resume({'text': text, 'skills': self.student.skills}) for text in texts]
+        
+        self.assertIn('Rescored 4 resumes (1 re-extracted)', out.getvalue())
+        for score, result in zip(scores + [legacy], expected + expected[:1]):
+            score.refresh_from_db()
+            self.assertAlmostEqual(score.overall_score, result['overall_score'])
+            self.assertEqual(score.breakdown, result['breakdown'])
+            self.assertEqual(score.recommendations, result['recommendations'])
+            self.assertEqual(score.features, result['features'])
+    
+    @unittest.skipUnless(ResumeScorer, 'ML scorer not available')
+    def test_stored_score_is_refreshed_only_when_skills_change(self):
+        """A stored score is reused until the student's skill count changes"""
+        text = 'Education\nB.Tech, CGPA: 8.5\nExperience\n- Developed APIs'
+        score = create_score(self.student, text, [])
+        self.assertFalse(refresh_score(score, self.student))
+        
+        self.student.skills = ['python', 'django', 'sql', 'git', 'docker']
+        self.assertTrue(refresh_score(score, self.student))
+        expected = MLRegistry.get_resume_scorer().score_resume({'text': text, 'skills': self.student.skills})
+        score.refresh_from_db()
+        self.assertEqual(score.overall_score, expected['overall_score'])
+        self.assertEqual(score.breakdown['skills_score'], 70)
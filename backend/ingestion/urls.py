@@ -0,0 +1,8 @@
+from django.urls import path
+from .views import ResumeIngestView, IngestJobListView, IngestJobDetailView
+
+urlpatterns = [
+    path('', ResumeIngestView.as_view(), name='resume-ingest'),
+    path('jobs/', IngestJobListView.as_view(), name='ingest-job-list'),
+    path('jobs/<int:pk>/', IngestJobDetailView.as_view(), name='ingest-job-detail'),
+]
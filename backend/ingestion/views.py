@@ -0,0 +1,101 @@
+from rest_framework import status, generics
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from django.conf import settings
+from django.urls import reverse
+from django.utils import timezone
+from students.models import Student
+from placement_portal.permissions import IsStudent
+from .models import ResumeIngestJob
+from .pipeline import resume_model
+from .queue import IngestQueue
+from .serializers import ResumeUploadSerializer, ResumeIngestJobSerializer
+
+
+def status_payload(request, job):
+    data = ResumeIngestJobSerializer(job).data
+    data['status_url'] = request.build_absolute_uri(reverse('ingest-job-detail', args=[job.id]))
+    return data
+
+
+class ResumeIngestView(APIView):
+    """Upload a resume PDF; it is parsed, scored and merged into the profile in the background"""
+    
+    permission_classes = [IsAuthenticated, IsStudent]
+    
+    def post(self, request):
+        try:
+            student = Student.objects.get(user=request.user)
+        except Student.DoesNotExist:
+            return Response({'error': 'Student profile not found'}, status=status.HTTP_404_NOT_FOUND)
+        
+        serializer = ResumeUploadSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        # The parsed text and score are written back to this resume, so it must be the student's own
+        resume_id = serializer.validated_data.get('resume_id')
+        if resume_id is not None:
+            Resume = resume_model()
+            if not Resume or not Resume.objects.filter(id=resume_id, student=student).exists():
+                return Response({'error': 'Resume not found'}, status=status.HTTP_404_NOT_FOUND)
+        
+        job = IngestQueue.enqueue(
+            student,
+            serializer.validated_data['file'],
+            resume_id=resume_id,
+            priority=settings.INGEST_DEFAULT_PRIORITY
+        )
+        return Response(status_payload(request, job), status=status.HTTP_202_ACCEPTED)
+
+
+class IngestJobListView(generics.ListAPIView):
+    """The student's ingest jobs, newest first"""
+    
+    permission_classes = [IsAuthenticated, IsStudent]
+    serializer_class = ResumeIngestJobSerializer
+    
+    def get_queryset(self):
+        return ResumeIngestJob.objects.filter(student__user=self.request.user)
+
+
+class IngestJobDetailView(APIView):
+    """Status and progress of one ingest job (students see their own, admins any)"""
+    
+    permission_classes = [IsAuthenticated]
+    
+    def get_job(self, request, pk):
+        jobs = ResumeIngestJob.objects.all()
+        if request.user.role != 'admin':
+            jobs = jobs.filter(student__user=request.user)
+        return jobs.filter(id=pk).first()
+    
+    def get(self, request, pk):
+        job = self.get_job(request, pk)
+        if not job:
+            return Response({'error': 'Job not found'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(status_payload(request, job))
+    
+    def post(self, request, pk):
+        """Retry a failed job; admins may also change its priority"""
+        job = self.get_job(request, pk)
+        if not job:
+            return Response({'error': 'Job not found'}, status=status.HTTP_404_NOT_FOUND)
+        if job.status != 'FAILED':
+            return Response({'error': 'Only failed jobs can be retried'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        job.status = 'QUEUED'
+        job.stage = 'QUEUED'
+        job.progress = 0
+        job.attempts = 0
+        job.error = None
+        job.run_after = timezone.now()
+        job.finished_at = None
+        if request.user.role == 'admin' and 'priority' in request.data:
+            try:
+                job.priority = int(request.data['priority'])
+            except (TypeError, ValueError):
+                return Response({'error': 'priority must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+        job.save()
+        return Response(status_payload(request, job), status=status.HTTP_202_ACCEPTED)
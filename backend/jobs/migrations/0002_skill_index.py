@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def build_skill_index(apps, schema_editor):
+    Job = apps.get_model('jobs', 'Job')
+    JobSkill = apps.get_model('jobs', 'JobSkill')
+    rows = []
+    for job_id, skills in Job.objects.values_list('id', 'skills_required'):
+        normalized = {' '.join(str(skill).lower().split())[:100] for skill in skills or []}
+        rows.extend(JobSkill(job_id=job_id, skill=skill) for skill in normalized if skill)
+    JobSkill.objects.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('skill', models.CharField(max_length=100)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_index', to='jobs.job')),
+            ],
+            options={
+                'db_table': 'job_skills',
+                'unique_together': {('skill', 'job')},
+            },
+        ),
+        migrations.RunPython(build_skill_index, migrations.RunPython.noop),
+    ]
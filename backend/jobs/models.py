@@ -52,6 +52,20 @@ class Job(models.Model):
         ordering = ['-posted_at']
 
 
+class JobSkill(models.Model):
+    """Inverted skill index: one normalized skill required by a job"""
+    
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='skill_index')
+    skill = models.CharField(max_length=100)
+    
+    def __str__(self):
+        return f"{self.skill} - {self.job_id}"
+    
+    class Meta:
+        db_table = 'job_skills'
+        unique_together = ['skill', 'job']
+
+
 class Application(models.Model):
     """Job application model"""
     
@@ -88,6 +102,10 @@ class Application(models.Model):
         db_table = 'applications'
         ordering = ['-applied_at']
         unique_together = ['student', 'job']
+        indexes = [
+            # Recruiters list a job's applicants by match score
+            models.Index(fields=['job', '-match_score'], name='application_job_score_idx'),
+        ]
 
 
 class Interview(models.Model):
@@ -1,7 +1,10 @@
+from django.db import transaction
+from django.db.models import F
 from rest_framework import serializers
 from .models import Job, Application, Interview
 from students.serializers import StudentSerializer
 from recruiters.models import Recruiter
+from placement_portal.application_match import ApplicationMatch
 
 
 class JobSerializer(serializers.ModelSerializer):
@@ -14,6 +17,16 @@ class JobSerializer(serializers.ModelSerializer):
         model = Job
         fields = '__all__'
         read_only_fields = ['recruiter', 'posted_at', 'updated_at', 'views_count', 'applications_count']
+    
+    def update(self, instance, validated_data):
+        """
+        Write only the submitted fields, so counters incremented in SQL since the
+        row was read (views_count flushes, applications_count) aren't overwritten
+        """
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, 'updated_at'])
+        return instance
 
 
 class JobCreateSerializer(serializers.ModelSerializer):
@@ -46,6 +59,25 @@ class ApplicationSerializer(serializers.ModelSerializer):
         read_only_fields = ['student', 'job', 'applied_at', 'reviewed_at', 'updated_at']
 
 
+class ApplicationListSerializer(serializers.ModelSerializer):
+    """Flat application fields for list views (no nested student/job objects)"""
+    
+    job_title = serializers.CharField(source='job.title', read_only=True)
+    company_name = serializers.CharField(source='job.recruiter.company_name', read_only=True)
+    student_name = serializers.CharField(source='student.name', read_only=True)
+    student_roll = serializers.CharField(source='student.roll_number', read_only=True)
+    student_email = serializers.EmailField(source='student.user.email', read_only=True)
+    student_branch = serializers.CharField(source='student.branch', read_only=True)
+    student_cgpa = serializers.DecimalField(source='student.cgpa', max_digits=4, decimal_places=2, read_only=True)
+    
+    class Meta:
+        model = Application
+        fields = ['id', 'job', 'job_title', 'company_name', 'student', 'student_name', 'student_roll',
+                  'student_email', 'student_branch', 'student_cgpa', 'status', 'match_score', 'matched_skills',
+                  'missing_skills', 'applied_at', 'reviewed_at', 'updated_at']
+        read_only_fields = fields
+
+
 class ApplicationCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating job applications"""
     
@@ -54,15 +86,24 @@ class ApplicationCreateSerializer(serializers.ModelSerializer):
         fields = ['cover_letter']
     
     def create(self, validated_data):
+        """
+        Insert the application and bump the job's count in one transaction
+        A duplicate (student, job) raises IntegrityError from the unique constraint and nothing is counted
+        """
         student = self.context['student']
         job = self.context['job']
         validated_data['student'] = student
         validated_data['job'] = job
-        application = Application.objects.create(**validated_data)
+        application = Application(**validated_data)
+        # Stored once here; signals recompute it when the student's or job's skills change
+        ApplicationMatch.fill(application, student.skills, job.skills_required)
         
-        # Increment application count
-        job.applications_count += 1
-        job.save()
+        with transaction.atomic():
+            application.save()
+            # Incremented in SQL so concurrent applies can't overwrite each other's count
+            job.applications_count = F('applications_count') + 1
+            job.save(update_fields=['applications_count'])
+        job.refresh_from_db(fields=['applications_count'])
         
         return application
 
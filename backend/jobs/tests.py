@@ -1,3 +1,302 @@
-from django.test import TestCase
+"""
+Test suite for jobs and applications
+"""
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from django.db import OperationalError, connection, connections
+from django.db.models import F
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from authentication.models import User
+from students.models import Student
+from recruiters.models import Recruiter
+from placement_portal.ml_registry import SkillMatcher
+from placement_portal.view_counter import JobViewCounter
+from .models import Job, Application
+from .views import JobDetailView
 
-# Create your tests here.
+
+class ApplicationTestCase(TestCase):
+    """Shared fixtures: one recruiter with one job"""
+    
+    def setUp(self):
+        self.client = APIClient()
+        recruiter_user = User.objects.create_user(
+            username='recruiter', email='recruiter@company.com', password='testpass123', role='recruiter'
+        )
+        self.recruiter_user = recruiter_user
+        self.recruiter = Recruiter.objects.create(
+            user=recruiter_user, company_name='TechCorp', industry='IT', phone='9999999999', location='Bangalore'
+        )
+        self.job = Job.objects.create(
+            recruiter=self.recruiter,
+            title='Python Developer',
+            description='Backend role',
+            location='Bangalore',
+            skills_required=['Python', 'Django', 'SQL', 'Docker']
+        )
+    
+    def create_student(self, index, skills):
+        user = User.objects.create_user(
+            username=f'student{index}', email=f'student{index}@example.com', password='testpass123', role='student'
+        )
+        student = Student.objects.create(
+            user=user, name=f'Student {index}', roll_number=f'CS{index:04d}', branch='CSE', year=4,
+            phone='9999999999', skills=skills
+        )
+        return user, student
+    
+    def apply(self, user):
+        self.client.force_authenticate(user=user)
+        return self.client.post(reverse('job-apply', args=[self.job.id]), {})
+
+
+@unittest.skipUnless(SkillMatcher, 'ML matcher not available')
+class ApplicationMatchTestCase(ApplicationTestCase):
+    """Test match scores stored on applications"""
+    
+    def test_match_is_stored_on_apply_and_follows_skill_changes(self):
+        """Applying stores the match; changing the student's or job's skills recomputes it"""
+        user, student = self.create_student(1, ['python', 'django'])
+        response = self.apply(user)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        
+        application = Application.objects.get(student=student, job=self.job)
+        self.assertCountEqual(application.matched_skills, ['django', 'python'])
+        self.assertCountEqual(application.missing_skills, ['docker', 'sql'])
+        self.assertGreater(application.match_score, 0)
+        
+        student.skills = ['python', 'django', 'sql', 'docker']
+        student.save()
+        application.refresh_from_db()
+        self.assertEqual(application.missing_skills, [])
+        
+        self.job.skills_required = ['python', 'aws']
+        self.job.save()
+        application.refresh_from_db()
+        self.assertEqual(application.matched_skills, ['python'])
+        self.assertEqual(application.missing_skills, ['aws'])
+    
+    def test_recruiter_lists_applicants_by_match_score(self):
+        """Applicants come back best match first and can be filtered by score"""
+        for index, skills in enumerate([['python'], ['python', 'django', 'sql', 'docker'], ['java']]):
+            user, _ = self.create_student(index, skills)
+            self.apply(user)
+        
+        self.client.force_authenticate(user=self.recruiter_user)
+        url = reverse('job-applications', args=[self.job.id])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        scores = [float(application['match_score']) for application in response.data['results']]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertEqual(response.data['results'][0]['student_roll'], 'CS0001')
+        
+        response = self.client.get(url, {'min_score': 1})
+        self.assertEqual(response.data['count'], 2)
+
+
+class ListQueryCountTestCase(ApplicationTestCase):
+    """List endpoints load related rows up front instead of one query per row"""
+    
+    def count_queries(self, url, **params):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context), response
+    
+    def add_jobs(self, count):
+        return [
+            Job.objects.create(recruiter=self.recruiter, title=f'Job {index}', description='Role',
+                               location='Pune', skills_required=['Python'])
+            for index in range(count)
+        ]
+    
+    def test_job_list_query_count_is_constant(self):
+        user, _ = self.create_student(1, ['python'])
+        self.client.force_authenticate(user=user)
+        self.add_jobs(1)
+        small, response = self.count_queries(reverse('job-list-create'))
+        self.assertEqual(response.data['count'], 2)
+        self.add_jobs(6)
+        large, response = self.count_queries(reverse('job-list-create'))
+        self.assertEqual(response.data['count'], 8)
+        self.assertEqual(small, large)
+    
+    def test_my_applications_query_count_is_constant(self):
+        user, student = self.create_student(1, ['python'])
+        self.client.force_authenticate(user=user)
+        url = reverse('my-applications')
+        for job in [self.job] + self.add_jobs(1):
+            Application.objects.create(student=student, job=job)
+        small = [self.count_queries(url, **params)[0] for params in ({}, {'compact': 'true'})]
+        for job in self.add_jobs(6):
+            Application.objects.create(student=student, job=job)
+        # Both the nested and the compact serializer
+        for params, expected in zip(({}, {'compact': 'true'}), small):
+            large, response = self.count_queries(url, **params)
+            self.assertEqual(response.data['count'], 8)
+            self.assertEqual(large, expected)
+        self.assertEqual(response.data['results'][0]['company_name'], 'TechCorp')
+    
+    def test_recruiter_application_list_query_count_is_constant(self):
+        url = reverse('job-applications', args=[self.job.id])
+        for index in range(2):
+            Application.objects.create(student=self.create_student(index, ['python'])[1], job=self.job)
+        self.client.force_authenticate(user=self.recruiter_user)
+        small, response = self.count_queries(url)
+        self.assertEqual(response.data['count'], 2)
+        for index in range(2, 8):
+            Application.objects.create(student=self.create_student(index, ['python'])[1], job=self.job)
+        large, response = self.count_queries(url)
+        self.assertEqual(response.data['count'], 8)
+        self.assertEqual(small, large)
+        self.assertEqual(response.data['results'][0]['student_email'].split('@')[1], 'example.com')
+
+
+@override_settings(JOB_VIEWS_FLUSH_INTERVAL=3600)
+class JobViewCounterTestCase(ApplicationTestCase):
+    """Job detail views are buffered and added to views_count in one update"""
+    
+    def tearDown(self):
+        JobViewCounter.flush()
+    
+    def test_views_are_buffered_then_flushed(self):
+        user, _ = self.create_student(1, ['python'])
+        self.client.force_authenticate(user=user)
+        other_job = Job.objects.create(recruiter=self.recruiter, title='Data Analyst', description='Role',
+                                       location='Pune', skills_required=['SQL'])
+        updated_at = self.job.updated_at
+        
+        for expected in (1, 2, 3):
+            response = self.client.get(reverse('job-detail', args=[self.job.id]))
+            self.assertEqual(response.data['views_count'], expected)
+        self.client.get(reverse('job-detail', args=[other_job.id]))
+        
+        # Nothing written yet
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.views_count, 0)
+        
+        with self.assertNumQueries(2):
+            self.assertEqual(JobViewCounter.flush(), 4)
+        self.job.refresh_from_db()
+        other_job.refresh_from_db()
+        self.assertEqual(self.job.views_count, 3)
+        self.assertEqual(other_job.views_count, 1)
+        self.assertEqual(self.job.updated_at, updated_at)
+        self.assertEqual(JobViewCounter.pending(self.job.id), 0)
+    
+    def test_edit_keeps_counters_written_meanwhile(self):
+        """Editing a job doesn't write back the counters it read before they were incremented"""
+        self.client.force_authenticate(user=self.recruiter_user)
+        loaded = Job.objects.get(id=self.job.id)
+        # A views flush and an apply landing between the edit's read and its save
+        Job.objects.filter(id=self.job.id).update(views_count=F('views_count') + 5, applications_count=2)
+        
+        with mock.patch.object(JobDetailView, 'get_object', return_value=loaded):
+            response = self.client.patch(reverse('job-detail', args=[self.job.id]),
+                                         {'title': 'Senior Python Developer', 'views_count': 0}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.title, 'Senior Python Developer')
+        self.assertEqual(self.job.views_count, 5)
+        self.assertEqual(self.job.applications_count, 2)
+
+
+class ApplyTestCase(ApplicationTestCase):
+    """Applying counts once per student and job"""
+    
+    def test_duplicate_apply_is_rejected_and_not_counted(self):
+        user, student = self.create_student(1, ['python'])
+        updated_at = self.job.updated_at
+        self.assertEqual(self.apply(user).status_code, status.HTTP_201_CREATED)
+        response = self.apply(user)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error'], 'Already applied')
+        
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.applications_count, 1)
+        self.assertEqual(self.job.updated_at, updated_at)
+        self.assertEqual(Application.objects.filter(student=student).count(), 1)
+
+
+class ParallelApplyTestCase(TransactionTestCase):
+    """Shared fixtures: one job and STUDENTS students, applying from separate threads"""
+    
+    STUDENTS = 1
+    
+    def setUp(self):
+        recruiter_user = User.objects.create(username='recruiter', email='recruiter@company.com', role='recruiter')
+        recruiter = Recruiter.objects.create(
+            user=recruiter_user, company_name='TechCorp', industry='IT', phone='9999999999', location='Bangalore'
+        )
+        self.job = Job.objects.create(recruiter=recruiter, title='Python Developer', description='Backend role',
+                                      location='Bangalore', skills_required=['Python'])
+        self.users = []
+        for index in range(self.STUDENTS):
+            user = User.objects.create(username=f'student{index}', email=f'student{index}@example.com',
+                                       role='student')
+            Student.objects.create(user=user, name=f'Student {index}', roll_number=f'CS{index:04d}', branch='CSE',
+                                   year=4, phone='9999999999', skills=['python'])
+            self.users.append(user)
+    
+    def apply(self, user, barrier=None):
+        client = APIClient()
+        client.force_authenticate(user=user)
+        try:
+            if barrier:
+                barrier.wait()
+            for _ in range(100):
+                try:
+                    return client.post(reverse('job-apply', args=[self.job.id]), {}).status_code
+                except OperationalError as e:
+                    # SQLite lets one writer in at a time; the apply's transaction rolled back, so retry it
+                    if 'locked' not in str(e):
+                        raise
+                    time.sleep(0.01)
+            raise AssertionError('Database stayed locked')
+        finally:
+            connections.close_all()
+
+
+class DuplicateApplyTestCase(ParallelApplyTestCase):
+    """One student's simultaneous applies create exactly one application (runs on SQLite too)"""
+    
+    THREADS = 8
+    
+    def test_simultaneous_duplicate_applies(self):
+        barrier = threading.Barrier(self.THREADS)
+        with ThreadPoolExecutor(max_workers=self.THREADS) as executor:
+            codes = list(executor.map(lambda user: self.apply(user, barrier), self.users * self.THREADS))
+        
+        # Usually one 201 and the rest 400; on SQLite's shared-cache test database the winner can commit and
+        # then fail reading the job back, and its retry is answered 'Already applied' like the others
+        self.assertLessEqual(codes.count(status.HTTP_201_CREATED), 1)
+        self.assertEqual(codes.count(status.HTTP_201_CREATED) + codes.count(status.HTTP_400_BAD_REQUEST), self.THREADS)
+        self.assertEqual(Application.objects.filter(job=self.job).count(), 1)
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.applications_count, 1)
+
+
+@unittest.skipIf(connection.vendor == 'sqlite', 'SQLite serializes writers; CI runs this on PostgreSQL')
+class ConcurrentApplyTestCase(ParallelApplyTestCase):
+    """Hundreds of parallel applies keep applications_count equal to the number of applications"""
+    
+    STUDENTS = 150
+    
+    def test_parallel_applies(self):
+        # Every student applies twice, so duplicates race each other as well
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            codes = list(executor.map(self.apply, self.users * 2))
+        
+        self.assertEqual(codes.count(status.HTTP_201_CREATED), self.STUDENTS)
+        self.assertEqual(codes.count(status.HTTP_400_BAD_REQUEST), self.STUDENTS)
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.applications_count, self.STUDENTS)
+        self.assertEqual(Application.objects.filter(job=self.job).count(), self.STUDENTS)
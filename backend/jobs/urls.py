@@ -1,11 +1,13 @@
 from django.urls import path
-from .views import (JobListCreateView, JobDetailView, StudentApplicationView, MyApplicationsView)
+from .views import (JobListCreateView, JobDetailView, StudentApplicationView, MyApplicationsView,
+                    JobApplicationsView)
 from .interview_views import (ScheduleInterviewView, StudentInterviewsView, InterviewDetailView)
 
 urlpatterns = [
     path('', JobListCreateView.as_view(), name='job-list-create'),
     path('<int:pk>/', JobDetailView.as_view(), name='job-detail'),
     path('<int:job_id>/apply/', StudentApplicationView.as_view(), name='job-apply'),
+    path('<int:job_id>/applications/', JobApplicationsView.as_view(), name='job-applications'),
     path('applications/my/', MyApplicationsView.as_view(), name='my-applications'),
     
     # Interview endpoints
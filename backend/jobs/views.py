@@ -2,13 +2,18 @@ from rest_framework import status, generics
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Q
-from django.utils import timezone
-from .models import Job, Application, Interview
+from django.db import IntegrityError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound, ValidationError
+from .models import Job, Application
 from .serializers import (JobSerializer, JobCreateSerializer, 
-                          ApplicationSerializer, ApplicationCreateSerializer,
-                          InterviewSerializer)
+                          ApplicationSerializer, ApplicationListSerializer, ApplicationCreateSerializer)
 from students.models import Student
+from placement_portal.permissions import IsRecruiter, StandardResultsSetPagination
+from placement_portal.view_counter import JobViewCounter
+
+# Everything ApplicationSerializer / ApplicationListSerializer read, fetched with the applications
+APPLICATION_RELATED = ('student__user', 'job__recruiter')
 
 
 class JobListCreateView(generics.ListCreateAPIView):
@@ -16,7 +21,7 @@ class JobListCreateView(generics.ListCreateAPIView):
     serializer_class = JobSerializer
     
     def get_queryset(self):
-        queryset = Job.objects.filter(is_active=True)
+        queryset = Job.objects.filter(is_active=True).select_related('recruiter')
         search = self.request.query_params.get('search', None)
         if search:
             queryset = queryset.filter(Q(title__icontains=search) | Q(recruiter__company_name__icontains=search))
@@ -38,8 +43,9 @@ class JobDetailView(generics.RetrieveUpdateDestroyAPIView):
     
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
-        instance.views_count += 1
-        instance.save()
+        # Buffered and flushed in the background, so a page view never writes the job row
+        JobViewCounter.record(instance.id)
+        instance.views_count += JobViewCounter.pending(instance.id)
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
 
@@ -56,22 +62,66 @@ class StudentApplicationView(APIView):
             job = Job.objects.get(id=job_id, is_active=True)
         except Job.DoesNotExist:
             return Response({'error': 'Job not found'}, status=status.HTTP_404_NOT_FOUND)
-        if Application.objects.filter(student=student, job=job).exists():
-            return Response({'error': 'Already applied'}, status=status.HTTP_400_BAD_REQUEST)
         serializer = ApplicationCreateSerializer(data=request.data, context={'student': student, 'job': job})
         if serializer.is_valid():
-            application = serializer.save()
+            try:
+                application = serializer.save()
+            except IntegrityError:
+                # unique_together (student, job) decides, so parallel duplicate applies can't both succeed
+                return Response({'error': 'Already applied'}, status=status.HTTP_400_BAD_REQUEST)
             return Response(ApplicationSerializer(application).data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
 class MyApplicationsView(generics.ListAPIView):
+    """The student's applications; ?compact=true returns flat ApplicationListSerializer rows"""
     permission_classes = [IsAuthenticated]
     serializer_class = ApplicationSerializer
     
     def get_queryset(self):
-        try:
-            student = Student.objects.get(user=self.request.user)
-            return Application.objects.filter(student=student).order_by('-applied_at')
-        except Student.DoesNotExist:
-            return Application.objects.none()
+        return Application.objects.filter(
+            student__user=self.request.user
+        ).select_related(*APPLICATION_RELATED).order_by('-applied_at')
+    
+    def get_serializer_class(self):
+        if self.request.query_params.get('compact') == 'true':
+            return ApplicationListSerializer
+        return ApplicationSerializer
+
+
+class JobApplicationsView(generics.ListAPIView):
+    """
+    Applicants to one of the recruiter's jobs, best match first
+    Query params: status, min_score, ordering (match_score, -match_score, applied_at, -applied_at)
+    """
+    permission_classes = [IsAuthenticated, IsRecruiter]
+    serializer_class = ApplicationListSerializer
+    pagination_class = StandardResultsSetPagination
+    
+    ORDERINGS = {
+        'match_score': [F('match_score').asc(nulls_last=True), 'id'],
+        '-match_score': [F('match_score').desc(nulls_last=True), 'id'],
+        'applied_at': ['applied_at', 'id'],
+        '-applied_at': ['-applied_at', '-id'],
+    }
+    
+    def get_queryset(self):
+        job_id = self.kwargs['job_id']
+        if not Job.objects.filter(id=job_id, recruiter__user=self.request.user).exists():
+            raise NotFound('Job not found')
+        
+        # Match scores are stored on the application, so filtering and sorting happen in SQL
+        queryset = Application.objects.filter(job_id=job_id).select_related(*APPLICATION_RELATED)
+        application_status = self.request.query_params.get('status')
+        if application_status:
+            queryset = queryset.filter(status=application_status)
+        min_score = self.request.query_params.get('min_score')
+        if min_score:
+            try:
+                queryset = queryset.filter(match_score__gte=float(min_score))
+            except ValueError:
+                raise ValidationError({'min_score': 'min_score must be a number'})
+        ordering = self.request.query_params.get('ordering', '-match_score')
+        if ordering not in self.ORDERINGS:
+            raise ValidationError({'ordering': f"ordering must be one of {', '.join(self.ORDERINGS)}"})
+        return queryset.order_by(*self.ORDERINGS[ordering])
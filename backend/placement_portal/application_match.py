@@ -0,0 +1,86 @@
+"""
+Materialized Match Scores
+Application.match_score / matched_skills / missing_skills are computed when an
+application is created and recomputed only when the student's or the job's skills change
+"""
+from django.db import transaction
+from jobs.models import Application
+from placement_portal.ml_registry import MLRegistry, SkillMatcher
+
+MATCH_FIELDS = ['match_score', 'matched_skills', 'missing_skills']
+
+
+class ApplicationMatch:
+    """Keeps the match fields of applications in step with the skills they were computed from"""
+
+    @classmethod
+    def _details(cls, query_skills, skill_lists, query_is_job):
+        """Match details of every list in skill_lists against query_skills"""
+        # Same per-pair scores as calculate_match, fitted vocabulary or not
+        batch = MLRegistry.get_skill_matcher().batch_match(query_skills, skill_lists, query_is_job)
+        return [batch.details(i) for i in range(len(batch))]
+
+    @classmethod
+    def _assign(cls, application, details):
+        application.match_score = round(details['match_score'], 2)
+        application.matched_skills = details['matched_skills']
+        application.missing_skills = details['missing_skills']
+
+    @classmethod
+    def fill(cls, application, student_skills, job_skills):
+        """Set the match fields on an application before it is saved"""
+        if not SkillMatcher:
+            return
+        [details] = cls._details(job_skills or [], [student_skills or []], query_is_job=True)
+        cls._assign(application, details)
+
+    @classmethod
+    @transaction.atomic
+    def refresh_student(cls, student):
+        """Recompute the student's applications after their skills changed"""
+        if not SkillMatcher:
+            return 0
+        applications = list(
+            Application.objects.filter(student_id=student.id).select_related('job').only('id', 'job__skills_required')
+        )
+        if not applications:
+            return 0
+        details = cls._details(
+            student.skills or [], [application.job.skills_required or [] for application in applications],
+            query_is_job=False
+        )
+        for application, match in zip(applications, details):
+            cls._assign(application, match)
+        Application.objects.bulk_update(applications, MATCH_FIELDS)
+        return len(applications)
+
+    @classmethod
+    @transaction.atomic
+    def refresh_job(cls, job, batch_size=1000):
+        """Recompute every application to the job after its required skills changed"""
+        if not SkillMatcher:
+            return 0
+        applications = Application.objects.filter(job_id=job.id).select_related('student').only(
+            'id', 'student__skills'
+        ).order_by('id')
+        refreshed = 0
+        batch = []
+        for application in applications.iterator(chunk_size=batch_size):
+            batch.append(application)
+            if len(batch) >= batch_size:
+                refreshed += cls._refresh_batch(job, batch)
+                batch = []
+        if batch:
+            refreshed += cls._refresh_batch(job, batch)
+        return refreshed
+
+    @classmethod
+    def _refresh_batch(cls, job, applications):
+        details = cls._details(
+            job.skills_required or [], [application.student.skills or [] for application in applications],
+            query_is_job=True
+        )
+        for application, match in zip(applications, details):
+            cls._assign(application, match)
+        Application.objects.bulk_update(applications, MATCH_FIELDS)
+        return len(applications)
@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class PlacementPortalConfig(AppConfig):
+    name = 'placement_portal'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+
+        if settings.ML_WARM_UP_ON_STARTUP:
+            from .ml_registry import MLRegistry
+            MLRegistry.warm_up()
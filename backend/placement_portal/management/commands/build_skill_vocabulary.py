@@ -0,0 +1,45 @@
+"""
+Management command to fit and persist the global TF-IDF skill vocabulary
+"""
+from pathlib import Path
+import os
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from jobs.models import Job
+from students.models import Student
+from placement_portal.ml_registry import SkillMatcher
+
+
+class Command(BaseCommand):
+    help = 'Fit one TF-IDF vocabulary over all job and student skills and save it for the skill matcher'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            default=settings.SKILL_MATCHER_MODEL_PATH,
+            help='Where to write the fitted vocabulary (defaults to SKILL_MATCHER_MODEL_PATH)'
+        )
+
+    def handle(self, *args, **options):
+        if not SkillMatcher:
+            raise CommandError('ML matcher not available')
+
+        job_skills = Job.objects.values_list('skills_required', flat=True)
+        student_skills = Student.objects.values_list('skills', flat=True)
+        corpus = [skills for skills in list(job_skills) + list(student_skills) if skills]
+
+        self.stdout.write(f'Fitting skill vocabulary on {len(corpus)} skill lists...')
+        try:
+            matcher = SkillMatcher().fit(corpus)
+        except ValueError as e:
+            raise CommandError(f'Could not fit skill vocabulary: {e}')
+
+        output = Path(options['output'])
+        output.parent.mkdir(parents=True, exist_ok=True)
+        # Running workers reload the file when its mtime changes, so swap it in whole
+        partial = output.with_name(f'{output.name}.{os.getpid()}.tmp')
+        matcher.save(str(partial))
+        os.replace(partial, output)
+
+        vocabulary_size = len(matcher.vectorizer.vocabulary_)
+        self.stdout.write(self.style.SUCCESS(f'✅ Saved {vocabulary_size} terms to {output}; running workers pick it up on their next request'))
@@ -0,0 +1,57 @@
+"""
+Management command to parse a batch of resume PDFs in parallel
+"""
+import json
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from placement_portal.ml_registry import BatchResumeParser
+
+
+class Command(BaseCommand):
+    help = 'Parse resume PDFs (files or directories) over a process pool and report per-stage timings'
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='+', help='PDF files or directories to search for PDFs')
+        parser.add_argument('--workers', type=int, default=None, help='Worker processes (defaults to the CPU count)')
+        parser.add_argument('--output', help='Write one JSON result per line to this file')
+        parser.add_argument('--include-text', action='store_true', help='Keep the extracted text in --output')
+
+    def handle(self, *args, **options):
+        if not BatchResumeParser:
+            raise CommandError('Resume parser not available')
+
+        from resume_parser.batch import find_resumes, summarize
+
+        paths = list(find_resumes(options['paths']))
+        if not paths:
+            raise CommandError('No PDF files found')
+
+        self.stdout.write(f'Parsing {len(paths)} resumes...')
+        output = open(options['output'], 'w') if options['output'] else None
+        results = []
+        try:
+            batch = BatchResumeParser(
+                options['workers'],
+                timeout=settings.ML_RESUME_PARSE_TIMEOUT,
+                memory_limit_mb=settings.ML_RESUME_MEMORY_LIMIT_MB,
+                max_page_count=settings.ML_RESUME_MAX_PAGE_COUNT
+            )
+            for i, result in enumerate(batch.parse(paths), start=1):
+                if not options['include_text']:
+                    result.pop('text', None)
+                results.append(result)
+                if output:
+                    output.write(json.dumps(result) + '\n')
+
+                if result['ok']:
+                    self.stdout.write(f"[{i}/{len(paths)}] {result['path']}: {result['skill_count']} skills ({result['elapsed']:.2f}s)")
+                else:
+                    self.stdout.write(self.style.WARNING(f"[{i}/{len(paths)}] {result['path']}: {result['error']}"))
+        finally:
+            if output:
+                output.close()
+
+        summary = summarize(results)
+        for stage, timing in summary['stages'].items():
+            self.stdout.write(f"{stage}: {timing['total']:.2f}s total, {timing['mean'] * 1000:.1f}ms per resume")
+        self.stdout.write(self.style.SUCCESS(f"✅ Parsed {summary['parsed']} resumes, {summary['failed']} failed"))
@@ -0,0 +1,16 @@
+"""
+Management command to rebuild the inverted skill index tables
+"""
+from django.core.management.base import BaseCommand
+from placement_portal.skill_index import SkillIndex
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the StudentSkill/JobSkill inverted index from Student.skills and Job.skills_required'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding skill index...')
+        counts = SkillIndex.rebuild()
+        for name, count in counts.items():
+            self.stdout.write(f'{name}: {count} postings')
+        self.stdout.write(self.style.SUCCESS('✅ Skill index rebuilt'))
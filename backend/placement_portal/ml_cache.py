@@ -0,0 +1,89 @@
+"""
+Recommendation Cache
+Caches ML results in Django's cache framework, keyed on version stamps of their inputs
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+import time
+
+
+class RecommendationCache:
+    """
+    Per-student job recommendations, keyed by student id, the student's version,
+    the version of the active-jobs set and the date (deadlines pass at midnight).
+    Saving a Student or Job, or applying to a job, bumps the matching version
+    (see placement_portal.signals), so stale entries are never read again and
+    age out through the cache's TTL/LRU eviction.
+    """
+
+    JOBS_VERSION_KEY = 'ml:jobs-version'
+    STUDENT_VERSION_KEY = 'ml:student-version:{student_id}'
+    JOB_RECOMMENDATIONS_KEY = 'ml:job-recommendations:{student_id}:{student_version}:{jobs_version}:{date}'
+
+    @classmethod
+    def _version(cls, key):
+        version = cache.get(key)
+        if version is None:
+            cache.add(key, time.time_ns(), timeout=None)
+            version = cache.get(key)
+        return version
+
+    @classmethod
+    def _bump(cls, key):
+        # A fresh timestamp rather than incr() so an evicted version key can't come back with an old value
+        cache.set(key, time.time_ns(), timeout=None)
+
+    @classmethod
+    def jobs_version(cls):
+        return cls._version(cls.JOBS_VERSION_KEY)
+
+    @classmethod
+    def student_version(cls, student_id):
+        return cls._version(cls.STUDENT_VERSION_KEY.format(student_id=student_id))
+
+    @classmethod
+    def invalidate_jobs(cls):
+        """A job was posted, edited, deactivated or deleted"""
+        cls._bump(cls.JOBS_VERSION_KEY)
+
+    @classmethod
+    def invalidate_student(cls, student_id):
+        """The student's profile (skills, CGPA, ...) or applications changed"""
+        cls._bump(cls.STUDENT_VERSION_KEY.format(student_id=student_id))
+
+    @classmethod
+    def job_recommendations_key(cls, student_id):
+        """
+        Resolve the key before computing, so results computed while a job or
+        profile is being saved are stored under the versions they were built from
+        """
+        return cls.JOB_RECOMMENDATIONS_KEY.format(
+            student_id=student_id,
+            student_version=cls.student_version(student_id),
+            jobs_version=cls.jobs_version(),
+            date=timezone.localdate().isoformat()
+        )
+
+    @classmethod
+    def get(cls, key):
+        return cache.get(key)
+
+    @classmethod
+    def set(cls, key, data):
+        cache.set(key, data, timeout=settings.ML_RECOMMENDATION_CACHE_TIMEOUT)
+
+
+class ParsedResumeCache:
+    """
+    Parsed resume stages (text, skills) keyed on the PDF's SHA-256, shared by
+    every worker through Django's cache; passed to ResumeParser as its cache
+    """
+
+    @classmethod
+    def get(cls, key):
+        return cache.get(key)
+
+    @classmethod
+    def set(cls, key, data):
+        cache.set(key, data, timeout=settings.ML_RESUME_CACHE_TIMEOUT)
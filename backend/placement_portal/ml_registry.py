@@ -0,0 +1,253 @@
+"""
+ML Engine Registry
+Builds the ML engines once per worker process and shares them across requests
+"""
+from django.conf import settings
+import os
+import sys
+import threading
+import time
+from placement_portal.ml_cache import ParsedResumeCache
+
+# Add ML modules to path
+sys.path.append(os.path.join(settings.BASE_DIR.parent, 'ml_modules'))
+
+try:
+    from skill_taxonomy.taxonomy import SkillTaxonomy
+except ImportError as e:
+    SkillTaxonomy = None
+    print(f"Skill taxonomy import error: {e}")
+
+try:
+    from skill_matcher.matcher import SkillMatcher
+    from recommender.engine import RecommendationEngine
+    from recommender.similarity import SimilarJobsIndex
+    from resume_scorer.scorer import ResumeScorer
+except ImportError as e:
+    SkillMatcher = None
+    RecommendationEngine = None
+    SimilarJobsIndex = None
+    ResumeScorer = None
+    print(f"ML modules import error: {e}")
+
+try:
+    from resume_parser.parser import ResumeParser
+    from resume_parser.batch import BatchResumeParser
+    from resume_parser.guard import GuardedResumeParser
+except ImportError as e:
+    ResumeParser = None
+    BatchResumeParser = None
+    GuardedResumeParser = None
+    print(f"Resume parser import error: {e}")
+
+
+class MLRegistry:
+    """Process-wide ML engines, built lazily on first use or eagerly by warm_up()"""
+
+    _lock = threading.RLock()
+    _skill_matcher = None
+    _skill_matcher_mtime = None
+    _recommendation_engine = None
+    _resume_scorer = None
+    _resume_parser = None
+    _guarded_resume_parser = None
+    _similar_jobs_index = None
+    _similar_jobs_index_built_at = None
+    _similar_jobs_lock = threading.Lock()
+
+    @classmethod
+    def get_skill_matcher(cls):
+        """
+        Skill matcher using the persisted corpus vocabulary when it exists. The file's
+        mtime is checked on every call, so a vocabulary saved by build_skill_vocabulary
+        is picked up by running workers without a restart
+        """
+        mtime = cls._vocabulary_mtime()
+        if cls._skill_matcher is None or mtime != cls._skill_matcher_mtime:
+            with cls._lock:
+                if cls._skill_matcher is None or mtime != cls._skill_matcher_mtime:
+                    matcher = None
+                    engine = settings.SKILL_MATCHER_OVERLAP_ENGINE
+                    if mtime is not None:
+                        try:
+                            matcher = SkillMatcher.load(settings.SKILL_MATCHER_MODEL_PATH, overlap_engine=engine)
+                        except Exception as e:
+                            print(f"Error loading skill vocabulary: {e}")
+                    cls._skill_matcher = matcher or SkillMatcher(overlap_engine=engine)
+                    cls._skill_matcher_mtime = mtime
+                    # Built around the previous matcher's vocabulary, so rebuilt on next use
+                    cls._recommendation_engine = None
+                    cls._similar_jobs_index = None
+        return cls._skill_matcher
+
+    @staticmethod
+    def _vocabulary_mtime():
+        try:
+            return os.stat(settings.SKILL_MATCHER_MODEL_PATH).st_mtime_ns
+        except OSError:
+            return None
+
+    @classmethod
+    def get_recommendation_engine(cls):
+        matcher = cls.get_skill_matcher()
+        if cls._recommendation_engine is None:
+            with cls._lock:
+                if cls._recommendation_engine is None:
+                    cls._recommendation_engine = RecommendationEngine(matcher)
+        return cls._recommendation_engine
+
+    @classmethod
+    def get_resume_scorer(cls):
+        if cls._resume_scorer is None:
+            with cls._lock:
+                if cls._resume_scorer is None:
+                    cls._resume_scorer = ResumeScorer()
+        return cls._resume_scorer
+
+    @classmethod
+    def get_resume_parser(cls):
+        """Resume parser holding the loaded spaCy model"""
+        if cls._resume_parser is None:
+            with cls._lock:
+                if cls._resume_parser is None:
+                    cls._resume_parser = ResumeParser(
+                        cache=ParsedResumeCache,
+                        max_pages=settings.ML_RESUME_MAX_PAGES,
+                        max_chars=settings.ML_RESUME_MAX_CHARS
+                    )
+        return cls._resume_parser
+
+    @classmethod
+    def get_guarded_resume_parser(cls):
+        """
+        The shared resume parser run in a supervised child process, for parsing
+        uploads: a hanging or oversized PDF fails with a reason instead of tying
+        up the web worker
+        """
+        if cls._guarded_resume_parser is None:
+            with cls._lock:
+                if cls._guarded_resume_parser is None:
+                    cls._guarded_resume_parser = GuardedResumeParser(
+                        cls.get_resume_parser(),
+                        timeout=settings.ML_RESUME_PARSE_TIMEOUT,
+                        memory_limit_mb=settings.ML_RESUME_MEMORY_LIMIT_MB,
+                        max_page_count=settings.ML_RESUME_MAX_PAGE_COUNT
+                    )
+        return cls._guarded_resume_parser
+
+    @classmethod
+    def get_similar_jobs_index(cls):
+        """
+        Job-to-job similarity index over active jobs. Job saves and deletes in
+        this process are applied in place (update_similar_jobs_index /
+        remove_from_similar_jobs_index, from signals); the O(n^2) full rebuild
+        only runs once the index is ML_SIMILAR_JOBS_INDEX_MAX_AGE old, which
+        bounds staleness from other workers and from changes that skip signals
+        (QuerySet.update(), bulk actions). While one thread rebuilds, others
+        keep reading the previous index.
+        """
+        matcher = cls.get_skill_matcher()
+        index = cls._similar_jobs_index
+        if index is not None and not cls._similar_jobs_index_expired():
+            return index
+        if index is None:
+            cls._similar_jobs_lock.acquire()
+        elif not cls._similar_jobs_lock.acquire(blocking=False):
+            return index
+        try:
+            if cls._similar_jobs_index is None or cls._similar_jobs_index_expired():
+                from jobs.models import Job
+                jobs = Job.objects.filter(is_active=True).select_related('recruiter')
+                cls._similar_jobs_index = SimilarJobsIndex(matcher).build(
+                    [similar_job_data(job) for job in jobs]
+                )
+                cls._similar_jobs_index_built_at = time.monotonic()
+            return cls._similar_jobs_index
+        finally:
+            cls._similar_jobs_lock.release()
+
+    @classmethod
+    def _similar_jobs_index_expired(cls):
+        max_age = settings.ML_SIMILAR_JOBS_INDEX_MAX_AGE
+        return max_age > 0 and time.monotonic() - cls._similar_jobs_index_built_at > max_age
+
+    @classmethod
+    def update_similar_jobs_index(cls, job):
+        """Apply a saved job to this process's index, if built (a deactivated job is removed)"""
+        if cls._similar_jobs_index is None:
+            return
+        # Waits for a rebuild in progress, whose query may have missed this change
+        with cls._similar_jobs_lock:
+            if cls._similar_jobs_index is None:
+                return
+            if job.is_active:
+                cls._similar_jobs_index.upsert(similar_job_data(job))
+            else:
+                cls._similar_jobs_index.remove(job.id)
+
+    @classmethod
+    def remove_from_similar_jobs_index(cls, job_id):
+        """Drop a deleted job from this process's index, if built"""
+        if cls._similar_jobs_index is None:
+            return
+        with cls._similar_jobs_lock:
+            if cls._similar_jobs_index is not None:
+                cls._similar_jobs_index.remove(job_id)
+
+    @classmethod
+    def warm_up(cls, include_indexes=False):
+        """
+        Build every engine now so the first request after a deploy isn't slow
+        include_indexes also builds the database-backed indexes (needs a ready database)
+        Returns seconds spent per engine
+        """
+        timings = {}
+        steps = [
+            ('skill_matcher', SkillMatcher, cls.get_skill_matcher),
+            ('recommendation_engine', RecommendationEngine, cls.get_recommendation_engine),
+            ('resume_scorer', ResumeScorer, cls.get_resume_scorer),
+            # The parser loads its spaCy model lazily, so load it explicitly here
+            ('resume_parser', ResumeParser, lambda: cls.get_resume_parser().load_nlp()),
+        ]
+        if include_indexes:
+            steps.append(('similar_jobs_index', SimilarJobsIndex, cls.get_similar_jobs_index))
+
+        for name, available, build in steps:
+            if not available:
+                continue
+            start = time.perf_counter()
+            try:
+                build()
+            except Exception as e:
+                print(f"Error warming up {name}: {e}")
+                continue
+            timings[name] = round(time.perf_counter() - start, 3)
+
+        # Exercise the matcher once so scikit-learn/scipy code paths are loaded
+        if SkillMatcher:
+            cls.get_skill_matcher().calculate_match(['python'], ['python'])
+
+        return timings
+
+    @classmethod
+    def reset(cls):
+        """Drop every engine so the next use rebuilds it"""
+        with cls._lock:
+            cls._skill_matcher = None
+            cls._skill_matcher_mtime = None
+            cls._recommendation_engine = None
+            cls._resume_scorer = None
+            cls._resume_parser = None
+            cls._guarded_resume_parser = None
+            cls._similar_jobs_index = None
+            cls._similar_jobs_index_built_at = None
+
+
+def similar_job_data(job):
+    """Job fields used by the similar jobs index"""
+    return {
+        'id': job.id,
+        'title': job.title,
+        'company': job.recruiter.company_name,
+        'skills_required': job.skills_required or []
+    }
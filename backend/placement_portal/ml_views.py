@@ -6,27 +6,64 @@ from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
 from students.models import Student
-from recruiters.models import Recruiter
 from jobs.models import Job, Application
 from resumes.models import Resume
+from ingestion.models import ResumeScore
+from ingestion.pipeline import create_score, refresh_score
 from placement_portal.permissions import IsStudent, IsRecruiter
-import os
-import sys
+from placement_portal.ml_cache import RecommendationCache
+from placement_portal.skill_index import SkillIndex
+from placement_portal.ml_registry import (
+    MLRegistry, SkillMatcher, RecommendationEngine, SimilarJobsIndex, ResumeScorer
+)
 
-# Add ML modules to path
-sys.path.append(os.path.join(settings.BASE_DIR.parent, 'ml_modules'))
 
-try:
-    from skill_matcher.matcher import SkillMatcher
-    from recommender.engine import RecommendationEngine
-    from resume_scorer.scorer import ResumeScorer
-except ImportError as e:
-    SkillMatcher = None
-    RecommendationEngine = None
-    ResumeScorer = None
-    print(f"ML modules import error: {e}")
+# Job columns the recommendation engine reads (company name through the recruiter JOIN)
+JOB_FIELDS = ('id', 'title', 'recruiter__company_name', 'skills_required')
+
+
+def eligible_jobs(jobs, student):
+    """
+    Jobs the student can still apply to, filtered in the database: CGPA at least
+    min_cgpa (when set), deadline not passed (when set) and not already applied to.
+    Jobs carry no branch/year requirements to check
+    """
+    cgpa_ok = Q(min_cgpa__isnull=True)
+    if student.cgpa is not None:
+        cgpa_ok |= Q(min_cgpa__lte=student.cgpa)
+    return jobs.filter(
+        cgpa_ok,
+        Q(deadline__isnull=True) | Q(deadline__gte=timezone.localdate())
+    ).exclude(
+        id__in=Application.objects.filter(student_id=student.id).values('job_id')
+    )
+
+
+def load_jobs(jobs, chunk_size=2000):
+    """Job dicts for RecommendationEngine.recommend_jobs, from one query selecting only JOB_FIELDS"""
+    return [
+        {'id': job_id, 'title': title, 'company': company, 'skills_required': skills or []}
+        for job_id, title, company, skills in jobs.values_list(*JOB_FIELDS).iterator(chunk_size=chunk_size)
+    ]
+
+
+# Student columns the recommendation engine reads (the user's name comes through the same JOIN)
+CANDIDATE_FIELDS = ('id', 'user__first_name', 'user__last_name', 'skills')
+
+
+def load_candidates(students, chunk_size=2000):
+    """
+    Candidate dicts for RecommendationEngine.recommend_candidates: one query
+    selecting only CANDIDATE_FIELDS, streamed in chunks instead of caching model instances
+    """
+    return [
+        {'id': student_id, 'name': f'{first_name} {last_name}'.strip(), 'skills': skills or []}
+        for student_id, first_name, last_name, skills
+        in students.values_list(*CANDIDATE_FIELDS).iterator(chunk_size=chunk_size)
+    ]
 
 
 class JobRecommendationsView(APIView):
@@ -50,36 +87,41 @@ class JobRecommendationsView(APIView):
                 'recommendations': []
             })
         
-        # Get active jobs
-        jobs = Job.objects.filter(is_active=True)
+        # Serve from cache unless the student's profile or the active jobs changed
+        cache_key = RecommendationCache.job_recommendations_key(student.id)
+        cached = RecommendationCache.get(cache_key)
+        if cached is not None:
+            return Response(cached)
+        
+        # Only score active jobs the student is eligible for and shares at least one skill with
+        active_jobs = Job.objects.filter(is_active=True)
+        jobs = eligible_jobs(active_jobs, student).filter(
+            id__in=SkillIndex.job_ids_with_skills(student_skills)
+        )
         
         # Prepare job data
-        job_data = []
-        for job in jobs:
-            job_data.append({
-                'id': job.id,
-                'title': job.title,
-                'company_name': job.company_name,
-                'location': job.location,
-                'ctc': job.ctc,
-                'job_type': job.job_type,
-                'skills_required': job.skills_required or [],
-                'min_cgpa': float(job.min_cgpa) if job.min_cgpa else 0,
-                'deadline': job.deadline.isoformat()
-            })
+        job_data = load_jobs(jobs)
         
         # Get recommendations
-        engine = RecommendationEngine()
-        recommendations = engine.recommend_jobs(student_skills, job_data, student.cgpa or 0)
+        engine = MLRegistry.get_recommendation_engine()
+        student_profile = {
+            'skills': student_skills,
+            'cgpa': float(student.cgpa) if student.cgpa else 0,
+            'branch': student.branch
+        }
+        recommendations = engine.recommend_jobs(student_profile, job_data)
         
-        # Filter by CGPA
+        # Keep reasonable matches (eligibility was already applied in the query)
         filtered_recs = [rec for rec in recommendations if rec['match_score'] >= 30]
         
-        return Response({
+        data = {
             'student_skills': student_skills,
-            'total_jobs': len(jobs),
+            'total_jobs': active_jobs.count(),
             'recommendations': filtered_recs[:10]  # Top 10
-        })
+        }
+        RecommendationCache.set(cache_key, data)
+        
+        return Response(data)
 
 
 class CandidateRecommendationsView(APIView):
@@ -88,7 +130,9 @@ class CandidateRecommendationsView(APIView):
     
     def get(self, request, job_id):
         try:
-            job = Job.objects.get(id=job_id, posted_by__user=request.user)
+            job = Job.objects.only('id', 'title', 'skills_required', 'experience_required', 'min_cgpa').get(
+                id=job_id, recruiter__user=request.user
+            )
         except Job.DoesNotExist:
             return Response({'error': 'Job not found'}, status=status.HTTP_404_NOT_FOUND)
         
@@ -103,28 +147,23 @@ class CandidateRecommendationsView(APIView):
                 'recommendations': []
             })
         
-        # Get all students meeting CGPA requirement
-        students = Student.objects.filter(
-            user__is_approved=True,
-            cgpa__gte=job.min_cgpa
-        )
+        # Get students meeting CGPA requirement who share at least one skill with the job
+        eligible_students = Student.objects.filter(user__is_approved=True)
+        if job.min_cgpa is not None:
+            eligible_students = eligible_students.filter(cgpa__gte=job.min_cgpa)
+        students = eligible_students.filter(id__in=SkillIndex.student_ids_with_skills(job_skills))
         
         # Prepare student data
-        student_data = []
-        for student in students:
-            student_data.append({
-                'id': student.id,
-                'name': student.user.get_full_name(),
-                'email': student.user.email,
-                'roll_number': student.roll_number,
-                'branch': student.branch,
-                'cgpa': float(student.cgpa) if student.cgpa else 0,
-                'skills': student.skills or []
-            })
+        student_data = load_candidates(students)
         
         # Get recommendations
-        engine = RecommendationEngine()
-        recommendations = engine.recommend_candidates(job_skills, student_data)
+        engine = MLRegistry.get_recommendation_engine()
+        job_details = {
+            'skills_required': job_skills,
+            'experience_required': job.experience_required,
+            'min_cgpa': float(job.min_cgpa) if job.min_cgpa else 0
+        }
+        recommendations = engine.recommend_candidates(job_details, student_data)
         
         # Filter high matches
         filtered_recs = [rec for rec in recommendations if rec['match_score'] >= 40]
@@ -132,7 +171,7 @@ class CandidateRecommendationsView(APIView):
         return Response({
             'job_title': job.title,
             'required_skills': job_skills,
-            'total_students': len(students),
+            'total_students': eligible_students.count(),
             'recommendations': filtered_recs[:20]  # Top 20
         })
 
@@ -168,7 +207,7 @@ class CalculateMatchScoreView(APIView):
             })
         
         # Calculate match
-        matcher = SkillMatcher()
+        matcher = MLRegistry.get_skill_matcher()
         match_result = matcher.calculate_match_detailed(student_skills, job_skills)
         
         return Response({
@@ -180,8 +219,33 @@ class CalculateMatchScoreView(APIView):
         })
 
 
+class SimilarJobsView(APIView):
+    """Get jobs with similar skill requirements"""
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request, job_id):
+        if not Job.objects.filter(id=job_id).exists():
+            return Response({'error': 'Job not found'}, status=status.HTTP_404_NOT_FOUND)
+        
+        if not SimilarJobsIndex:
+            return Response({'error': 'ML engine not available'}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        
+        try:
+            top_n = int(request.query_params.get('top_n', 5))
+        except ValueError:
+            return Response({'error': 'top_n must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+        if top_n < 1:
+            return Response({'error': 'top_n must be positive'}, status=status.HTTP_400_BAD_REQUEST)
+        top_n = min(top_n, 20)
+        
+        return Response({
+            'job_id': job_id,
+            'similar_jobs': MLRegistry.get_similar_jobs_index().similar(job_id, top_n)
+        })
+
+
 class ResumeScoreView(APIView):
-    """Get resume score and analysis"""
+    """Get resume score and analysis (stored when the resume is parsed, not recomputed per request)"""
     permission_classes = [IsAuthenticated, IsStudent]
     
     def get(self, request, resume_id=None):
@@ -193,26 +257,34 @@ class ResumeScoreView(APIView):
             else:
                 # Get active resume
                 resume = Resume.objects.filter(student=student, is_active=True).first()
-                
-            if not resume:
-                return Response({'error': 'No resume found'}, status=status.HTTP_404_NOT_FOUND)
-            
-            if not resume.is_parsed or not resume.parsed_text:
-                return Response({'error': 'Resume not yet parsed'}, status=status.HTTP_400_BAD_REQUEST)
             
-            if not ResumeScorer:
-                return Response({'error': 'ML scorer not available'}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+            scores = ResumeScore.objects.filter(student=student)
+            if resume:
+                scores = scores.filter(resume_id=resume.id)
+            score = scores.first()
             
-            # Score resume
-            scorer = ResumeScorer()
-            score_result = scorer.score_resume(resume.parsed_text)
+            if score is None:
+                if not resume:
+                    return Response({'error': 'No resume found'}, status=status.HTTP_404_NOT_FOUND)
+                
+                if not resume.is_parsed or not resume.parsed_text:
+                    return Response({'error': 'Resume not yet parsed'}, status=status.HTTP_400_BAD_REQUEST)
+                
+                if not ResumeScorer:
+                    return Response({'error': 'ML scorer not available'}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+                
+                # Parsed before scores were stored: score it once
+                score = create_score(student, resume.parsed_text, student.skills or [], resume_id=resume.id)
+            else:
+                refresh_score(score, student)
             
             return Response({
-                'resume_id': resume.id,
-                'overall_score': score_result['overall_score'],
-                'breakdown': score_result['breakdown'],
-                'recommendations': score_result['recommendations'],
-                'uploaded_at': resume.uploaded_at
+                'resume_id': resume.id if resume else score.resume_id,
+                'overall_score': score.overall_score,
+                'breakdown': score.breakdown,
+                'recommendations': score.recommendations,
+                'uploaded_at': resume.uploaded_at if resume else score.created_at,
+                'scored_at': score.created_at
             })
             
         except Student.DoesNotExist:
@@ -54,7 +54,9 @@ INSTALLED_APPS = [
     'recruiters',
     'jobs',
     'resumes',
+    'ingestion',
     'analytics',
+    'placement_portal',
 ]
 
 MIDDLEWARE = [
@@ -158,6 +160,61 @@ STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# ML Settings
+# Fitted TF-IDF skill vocabulary (built with `python manage.py build_skill_vocabulary`)
+SKILL_MATCHER_MODEL_PATH = os.environ.get('SKILL_MATCHER_MODEL_PATH', str(BASE_DIR / 'ml_models' / 'skill_vocabulary.joblib'))
+# Exact skill-overlap engine: 'sparse' (CSR incidence matrix) or 'bitset' (packed uint64 AND + popcount)
+SKILL_MATCHER_OVERLAP_ENGINE = os.environ.get('SKILL_MATCHER_OVERLAP_ENGINE', 'sparse')
+# Build the ML engines (vocabulary, spaCy model, scorer) when each worker starts instead of on first request
+ML_WARM_UP_ON_STARTUP = os.environ.get('ML_WARM_UP_ON_STARTUP', 'False') == 'True'
+# Seconds before a worker fully rebuilds its similar jobs index (0 = never). Job saves in the same
+# worker are applied at once; this bounds how long other workers' changes take to show up
+ML_SIMILAR_JOBS_INDEX_MAX_AGE = int(os.environ.get('ML_SIMILAR_JOBS_INDEX_MAX_AGE', '600'))
+# Seconds a student's cached job recommendations live (entries are also invalidated on Student/Job saves)
+ML_RECOMMENDATION_CACHE_TIMEOUT = int(os.environ.get('ML_RECOMMENDATION_CACHE_TIMEOUT', '900'))
+# Resume text extraction stops after this many pages / characters (long portfolios are truncated)
+ML_RESUME_MAX_PAGES = int(os.environ.get('ML_RESUME_MAX_PAGES', '10'))
+ML_RESUME_MAX_CHARS = int(os.environ.get('ML_RESUME_MAX_CHARS', '50000'))
+# Guarded parsing of uploads: wall-clock seconds, extra memory (MB) and page count per resume
+ML_RESUME_PARSE_TIMEOUT = int(os.environ.get('ML_RESUME_PARSE_TIMEOUT', '30'))
+ML_RESUME_MEMORY_LIMIT_MB = int(os.environ.get('ML_RESUME_MEMORY_LIMIT_MB', '1024'))
+ML_RESUME_MAX_PAGE_COUNT = int(os.environ.get('ML_RESUME_MAX_PAGE_COUNT', '50'))
+# Seconds parsed resume text/skills stay cached by file hash (identical uploads skip PDF extraction)
+ML_RESUME_CACHE_TIMEOUT = int(os.environ.get('ML_RESUME_CACHE_TIMEOUT', '86400'))
+
+# Resume ingest queue (worker: python manage.py run_ingest_worker)
+INGEST_DEFAULT_PRIORITY = int(os.environ.get('INGEST_DEFAULT_PRIORITY', '0'))
+INGEST_MAX_ATTEMPTS = int(os.environ.get('INGEST_MAX_ATTEMPTS', '3'))
+INGEST_RETRY_BACKOFF_SECONDS = int(os.environ.get('INGEST_RETRY_BACKOFF_SECONDS', '30'))
+# RUNNING jobs untouched for this long are assumed to belong to a dead worker
+INGEST_STALE_AFTER_SECONDS = int(os.environ.get('INGEST_STALE_AFTER_SECONDS', '600'))
+INGEST_POLL_INTERVAL = float(os.environ.get('INGEST_POLL_INTERVAL', '2'))
+
+# Seconds job detail views are buffered in each process before being added to views_count (0 = write every view)
+JOB_VIEWS_FLUSH_INTERVAL = float(os.environ.get('JOB_VIEWS_FLUSH_INTERVAL', '10'))
+
+# Cache
+# Local memory (per process, LRU culling at MAX_ENTRIES) unless REDIS_URL points at a shared cache.
+# Use a shared cache in production so invalidations reach every worker.
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ.get('REDIS_URL'),
+            'TIMEOUT': int(os.environ.get('CACHE_TIMEOUT', '300')),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'TIMEOUT': int(os.environ.get('CACHE_TIMEOUT', '300')),
+            'OPTIONS': {
+                'MAX_ENTRIES': int(os.environ.get('CACHE_MAX_ENTRIES', '5000')),
+            },
+        }
+    }
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
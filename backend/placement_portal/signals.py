@@ -0,0 +1,74 @@
+"""
+Signal handlers that keep the skill index, in-process ML state and cached ML results in sync with the database
+"""
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from jobs.models import Job, Application
+from students.models import Student
+from placement_portal.application_match import ApplicationMatch
+from placement_portal.ml_cache import RecommendationCache
+from placement_portal.ml_registry import MLRegistry
+from placement_portal.skill_index import SkillIndex
+
+# Counter columns that don't affect any ML result
+JOB_COUNTER_FIELDS = {'views_count', 'applications_count', 'updated_at'}
+
+
+def skills_changed(instance, field, update_fields):
+    """Whether saving instance changes its skill list (compared with the stored row)"""
+    if instance._state.adding or (update_fields is not None and field not in update_fields):
+        return False
+    stored = type(instance).objects.filter(pk=instance.pk).values_list(field, flat=True).first()
+    return stored != getattr(instance, field)
+
+
+@receiver(pre_save, sender=Job)
+def job_saving(sender, instance, update_fields=None, **kwargs):
+    instance._skills_changed = skills_changed(instance, 'skills_required', update_fields)
+
+
+@receiver(post_save, sender=Job)
+def job_saved(sender, instance, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) <= JOB_COUNTER_FIELDS:
+        return
+    SkillIndex.sync_job(instance)
+    RecommendationCache.invalidate_jobs()
+    # In-memory state, so only once the change is committed
+    transaction.on_commit(lambda: MLRegistry.update_similar_jobs_index(instance))
+    if instance._skills_changed:
+        ApplicationMatch.refresh_job(instance)
+
+
+@receiver(post_delete, sender=Job)
+def job_deleted(sender, instance, **kwargs):
+    RecommendationCache.invalidate_jobs()
+    job_id = instance.id
+    transaction.on_commit(lambda: MLRegistry.remove_from_similar_jobs_index(job_id))
+
+
+@receiver(pre_save, sender=Student)
+def student_saving(sender, instance, update_fields=None, **kwargs):
+    instance._skills_changed = skills_changed(instance, 'skills', update_fields)
+
+
+@receiver(post_save, sender=Student)
+def student_saved(sender, instance, **kwargs):
+    SkillIndex.sync_student(instance)
+    RecommendationCache.invalidate_student(instance.id)
+    if instance._skills_changed:
+        ApplicationMatch.refresh_student(instance)
+
+
+@receiver(post_delete, sender=Student)
+def student_deleted(sender, instance, **kwargs):
+    RecommendationCache.invalidate_student(instance.id)
+
+
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def application_changed(sender, instance, created=True, **kwargs):
+    # Applied-to jobs are left out of the student's recommendations
+    if created:
+        RecommendationCache.invalidate_student(instance.student_id)
+
@@ -0,0 +1,86 @@
+"""
+Inverted Skill Index
+Canonical skill -> student/job postings, stored in the StudentSkill and JobSkill tables
+"""
+from django.db import transaction
+from jobs.models import Job, JobSkill
+from students.models import Student, StudentSkill
+from placement_portal.ml_registry import SkillTaxonomy
+
+
+class SkillIndex:
+    """Candidate generation: only students/jobs sharing at least one skill get scored"""
+
+    MAX_SKILL_LENGTH = 100
+
+    @classmethod
+    def normalize(cls, skills):
+        """
+        Set of skills as stored in the index: canonical names from the skill
+        taxonomy ("ReactJS" -> "react"), or lowercase and single-spaced without it
+        """
+        if SkillTaxonomy:
+            canonical = SkillTaxonomy.default().canonicalize_all(skills)
+        else:
+            canonical = (' '.join(str(skill).lower().split()) for skill in skills or [])
+        normalized = {skill[:cls.MAX_SKILL_LENGTH] for skill in canonical}
+        normalized.discard('')
+        return normalized
+
+    @classmethod
+    @transaction.atomic
+    def _sync(cls, model, owner_field, owner_id, skills):
+        """Make the postings for one owner match its current skill list"""
+        wanted = cls.normalize(skills)
+        postings = model.objects.filter(**{owner_field: owner_id})
+        existing = set(postings.values_list('skill', flat=True))
+
+        stale = existing - wanted
+        if stale:
+            postings.filter(skill__in=stale).delete()
+
+        added = wanted - existing
+        if added:
+            model.objects.bulk_create(
+                [model(**{owner_field: owner_id, 'skill': skill}) for skill in added],
+                ignore_conflicts=True
+            )
+
+    @classmethod
+    def sync_student(cls, student):
+        cls._sync(StudentSkill, 'student_id', student.id, student.skills)
+
+    @classmethod
+    def sync_job(cls, job):
+        cls._sync(JobSkill, 'job_id', job.id, job.skills_required)
+
+    @classmethod
+    def student_ids_with_skills(cls, skills):
+        """Subquery of ids of students holding any of the given skills"""
+        return StudentSkill.objects.filter(skill__in=cls.normalize(skills)).values('student_id')
+
+    @classmethod
+    def job_ids_with_skills(cls, skills):
+        """Subquery of ids of jobs requiring any of the given skills"""
+        return JobSkill.objects.filter(skill__in=cls.normalize(skills)).values('job_id')
+
+    @classmethod
+    @transaction.atomic
+    def rebuild(cls, batch_size=1000):
+        """Recreate every posting from Student.skills and Job.skills_required"""
+        counts = {}
+        for model, owner_model, owner_field, skills_field in [
+            (StudentSkill, Student, 'student_id', 'skills'),
+            (JobSkill, Job, 'job_id', 'skills_required'),
+        ]:
+            model.objects.all().delete()
+            rows = []
+            for owner_id, skills in owner_model.objects.values_list('id', skills_field).iterator(chunk_size=batch_size):
+                rows.extend(model(**{owner_field: owner_id, 'skill': skill}) for skill in cls.normalize(skills))
+                if len(rows) >= batch_size:
+                    model.objects.bulk_create(rows, ignore_conflicts=True)
+                    counts[model.__name__] = counts.get(model.__name__, 0) + len(rows)
+                    rows = []
+            model.objects.bulk_create(rows, ignore_conflicts=True)
+            counts[model.__name__] = counts.get(model.__name__, 0) + len(rows)
+        return counts
@@ -1,14 +1,22 @@
 """
 Test suite for ML endpoints
 """
-from django.test import TestCase
+import io
+import os
+import tempfile
+import unittest
+from datetime import timedelta
+from django.core.management import call_command
+from django.test import TestCase, override_settings
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient
 from authentication.models import User
 from students.models import Student
-from jobs.models import Job
+from jobs.models import Job, Application
 from recruiters.models import Recruiter
+from placement_portal.ml_registry import MLRegistry, SimilarJobsIndex, SkillMatcher
 
 class RecommendationTestCase(TestCase):
     """Test ML recommendation endpoints"""
@@ -131,3 +139,234 @@ class MatchScoreTestCase(TestCase):
         url = reverse('calculate-match')
         response = self.client.post(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class CalculateMatchTestCase(TestCase):
+    """Test that match details compare canonical skills"""
+    
+    def setUp(self):
+        self.client = APIClient()
+        recruiter_user = User.objects.create_user(
+            username='recruiter', email='recruiter@company.com', password='testpass123', role='recruiter'
+        )
+        recruiter = Recruiter.objects.create(
+            user=recruiter_user, company_name='TechCorp', industry='IT', phone='9999999999', location='Bangalore'
+        )
+        student_user = User.objects.create_user(
+            username='student', email='student@example.com', password='testpass123', role='student'
+        )
+        self.student = Student.objects.create(
+            user=student_user, name='John Student', roll_number='CS0001', branch='CSE', year=4,
+            phone='9999999999', skills=['ReactJS', 'Node.JS', 'Python3']
+        )
+        self.job = Job.objects.create(
+            recruiter=recruiter, title='Full Stack Developer', description='Web role', location='Bangalore',
+            skills_required=['react', 'node.js', 'python', 'AWS']
+        )
+        self.client.force_authenticate(user=recruiter_user)
+    
+    @unittest.skipUnless(SkillMatcher, 'ML matcher not available')
+    def test_match_score_canonicalizes_aliases(self):
+        """Skill aliases match their canonical skill"""
+        url = reverse('calculate-match')
+        response = self.client.post(url, {'job_id': self.job.id, 'student_id': self.student.id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertCountEqual(response.data['matched_skills'], ['python', 'react', 'node'])
+        self.assertEqual(response.data['missing_skills'], ['aws'])
+
+
+@unittest.skipUnless(SkillMatcher, 'ML matcher not available')
+class SkillVocabularyReloadTestCase(TestCase):
+    """Test that a vocabulary saved by build_skill_vocabulary replaces the running matcher"""
+    
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'skill_vocabulary.joblib')
+        overrides = override_settings(SKILL_MATCHER_MODEL_PATH=self.path)
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        MLRegistry.reset()
+        self.addCleanup(MLRegistry.reset)
+        recruiter_user = User.objects.create_user(
+            username='recruiter', email='recruiter@company.com', password='testpass123', role='recruiter'
+        )
+        recruiter = Recruiter.objects.create(
+            user=recruiter_user, company_name='TechCorp', industry='IT', phone='9999999999', location='Bangalore'
+        )
+        Job.objects.create(
+            recruiter=recruiter, title='Python Developer', description='Backend role', location='Bangalore',
+            skills_required=['python', 'django', 'sql']
+        )
+    
+    def test_saved_vocabulary_is_picked_up(self):
+        """The registry reloads the matcher and the engines built on it when the file changes"""
+        matcher = MLRegistry.get_skill_matcher()
+        engine = MLRegistry.get_recommendation_engine()
+        self.assertFalse(matcher.is_fitted)
+        self.assertIs(MLRegistry.get_skill_matcher(), matcher)
+        
+        call_command('build_skill_vocabulary', stdout=io.StringIO())
+        reloaded = MLRegistry.get_skill_matcher()
+        self.assertIsNot(reloaded, matcher)
+        self.assertTrue(reloaded.is_fitted)
+        self.assertIn('django', reloaded.vectorizer.vocabulary_)
+        self.assertIsNot(MLRegistry.get_recommendation_engine(), engine)
+        self.assertIs(MLRegistry.get_recommendation_engine().matcher, reloaded)
+        # Unchanged file: no reload
+        self.assertIs(MLRegistry.get_skill_matcher(), reloaded)
+        
+        os.remove(self.path)
+        self.assertFalse(MLRegistry.get_skill_matcher().is_fitted)
+
+
+class CandidateRecommendationsQueryTestCase(TestCase):
+    """Test that candidate recommendations load students in a fixed number of queries"""
+    
+    def setUp(self):
+        self.client = APIClient()
+        recruiter_user = User.objects.create_user(
+            username='recruiter', email='recruiter@company.com', password='testpass123', role='recruiter'
+        )
+        recruiter = Recruiter.objects.create(
+            user=recruiter_user, company_name='TechCorp', industry='IT', phone='9999999999', location='Bangalore'
+        )
+        # min_cgpa left empty: every approved student is eligible
+        self.job = Job.objects.create(
+            recruiter=recruiter, title='Python Developer', description='Backend role', location='Bangalore',
+            skills_required=['python', 'django']
+        )
+        for i in range(30):
+            user = User.objects.create_user(
+                username=f'student{i}', email=f'student{i}@example.com', password='testpass123',
+                first_name='Student', last_name=str(i), role='student', is_approved=True
+            )
+            Student.objects.create(
+                user=user, name=f'Student {i}', roll_number=f'CS{i:04d}', branch='CSE', year=4, cgpa=8.0,
+                phone='9999999999', skills=['python', 'django'] if i % 2 else ['python']
+            )
+        self.client.force_authenticate(user=recruiter_user)
+    
+    def test_candidate_recommendations_query_count(self):
+        """Job, candidates (one projected JOIN) and the eligible count: no query per student"""
+        url = reverse('candidate-recommendations', args=[self.job.id])
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_students'], 30)
+        best = response.data['recommendations'][0]
+        self.assertEqual(best['missing_skills'], [])
+        self.assertRegex(best['name'], r'^Student \d+$')
+
+
+class JobEligibilityTestCase(TestCase):
+    """Test that job recommendations only score jobs the student is eligible for"""
+    
+    def setUp(self):
+        self.client = APIClient()
+        recruiter_user = User.objects.create_user(
+            username='recruiter', email='recruiter@company.com', password='testpass123', role='recruiter'
+        )
+        recruiter = Recruiter.objects.create(
+            user=recruiter_user, company_name='TechCorp', industry='IT', phone='9999999999', location='Bangalore'
+        )
+        student_user = User.objects.create_user(
+            username='student', email='student@example.com', password='testpass123', role='student'
+        )
+        self.student = Student.objects.create(
+            user=student_user, name='John Student', roll_number='CS0001', branch='CSE', year=4, cgpa=7.5,
+            phone='9999999999', skills=['python', 'django']
+        )
+        today = timezone.localdate()
+        self.jobs = {}
+        for name, min_cgpa, deadline in [
+            ('open', None, None),
+            ('cgpa_ok', 7.0, today),
+            ('cgpa_too_high', 8.0, None),
+            ('expired', None, today - timedelta(days=1)),
+            ('applied', None, None),
+        ]:
+            self.jobs[name] = Job.objects.create(
+                recruiter=recruiter, title=name, description='Backend role', location='Bangalore',
+                skills_required=['python', 'django'], min_cgpa=min_cgpa, deadline=deadline
+            )
+        Application.objects.create(student=self.student, job=self.jobs['applied'])
+        self.client.force_authenticate(user=student_user)
+    
+    def test_only_eligible_jobs_are_recommended(self):
+        """CGPA, deadline and existing applications are filtered before scoring"""
+        url = reverse('job-recommendations')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        titles = {rec['title'] for rec in response.data['recommendations']}
+        self.assertEqual(titles, {'open', 'cgpa_ok'})
+        
+        # Applying drops the job from the (cached) recommendations
+        Application.objects.create(student=self.student, job=self.jobs['open'])
+        response = self.client.get(url)
+        self.assertEqual({rec['title'] for rec in response.data['recommendations']}, {'cgpa_ok'})
+
+
+@unittest.skipUnless(SimilarJobsIndex, 'ML modules not available')
+class SimilarJobsTestCase(TestCase):
+    """Test that the similar jobs index follows job changes without full rebuilds"""
+    
+    def setUp(self):
+        # The index lives on the registry, so don't carry it over between tests
+        MLRegistry.reset()
+        self.addCleanup(MLRegistry.reset)
+        self.client = APIClient()
+        recruiter_user = User.objects.create_user(
+            username='recruiter', email='recruiter@company.com', password='testpass123', role='recruiter'
+        )
+        self.recruiter = Recruiter.objects.create(
+            user=recruiter_user, company_name='TechCorp', industry='IT', phone='9999999999', location='Bangalore'
+        )
+        self.jobs = [
+            Job.objects.create(recruiter=self.recruiter, title=f'Job {index}', description='Backend role',
+                               location='Bangalore', skills_required=['python', 'django'])
+            for index in range(3)
+        ]
+        self.client.force_authenticate(user=recruiter_user)
+    
+    def similar_ids(self):
+        response = self.client.get(reverse('similar-jobs', args=[self.jobs[0].id]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {job['id'] for job in response.data['similar_jobs']}
+    
+    def test_job_changes_update_the_index_in_place(self):
+        self.assertEqual(self.similar_ids(), {self.jobs[1].id, self.jobs[2].id})
+        index = MLRegistry.get_similar_jobs_index()
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            self.jobs[2].is_active = False
+            self.jobs[2].save()
+        self.assertEqual(self.similar_ids(), {self.jobs[1].id})
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            new_job = Job.objects.create(recruiter=self.recruiter, title='Job 3', description='Backend role',
+                                         location='Bangalore', skills_required=['django'])
+        self.assertEqual(self.similar_ids(), {self.jobs[1].id, new_job.id})
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            self.jobs[1].delete()
+        self.assertEqual(self.similar_ids(), {new_job.id})
+        self.assertIs(MLRegistry.get_similar_jobs_index(), index)
+    
+    @override_settings(ML_SIMILAR_JOBS_INDEX_MAX_AGE=60)
+    def test_index_is_rebuilt_after_max_age(self):
+        self.assertEqual(self.similar_ids(), {self.jobs[1].id, self.jobs[2].id})
+        
+        # A change made without signals in this process (another worker, QuerySet.update())
+        Job.objects.filter(id=self.jobs[2].id).update(is_active=False)
+        self.assertEqual(self.similar_ids(), {self.jobs[1].id, self.jobs[2].id})
+        MLRegistry._similar_jobs_index_built_at -= 120
+        self.assertEqual(self.similar_ids(), {self.jobs[1].id})
+    
+    def test_top_n_must_be_positive(self):
+        url = reverse('similar-jobs', args=[self.jobs[0].id])
+        for top_n in (-1, 0):
+            response = self.client.get(url, {'top_n': top_n})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(url, {'top_n': 1})
+        self.assertEqual(len(response.data['similar_jobs']), 1)
@@ -9,6 +9,7 @@ from .ml_views import (
     JobRecommendationsView,
     CandidateRecommendationsView,
     CalculateMatchScoreView,
+    SimilarJobsView,
     ResumeScoreView
 )
 from .health_views import HealthCheckView
@@ -21,12 +22,14 @@ urlpatterns = [
     path('api/recruiters/', include('recruiters.urls')),
     path('api/jobs/', include('jobs.urls')),
     path('api/resumes/', include('resumes.urls')),
+    path('api/ingestion/', include('ingestion.urls')),
     path('api/analytics/', include('analytics.urls')),
     
     # ML Integration endpoints
     path('api/ml/job-recommendations/', JobRecommendationsView.as_view(), name='job-recommendations'),
     path('api/ml/candidate-recommendations/<int:job_id>/', CandidateRecommendationsView.as_view(), name='candidate-recommendations'),
     path('api/ml/calculate-match/', CalculateMatchScoreView.as_view(), name='calculate-match'),
+    path('api/ml/similar-jobs/<int:job_id>/', SimilarJobsView.as_view(), name='similar-jobs'),
     path('api/ml/resume-score/', ResumeScoreView.as_view(), name='resume-score'),
     path('api/ml/resume-score/<int:resume_id>/', ResumeScoreView.as_view(), name='resume-score-detail'),
 ]
@@ -0,0 +1,94 @@
+"""
+Job View Counter
+Buffers job detail views in process and writes them back in batches
+"""
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import F
+import atexit
+import threading
+import time
+
+
+class JobViewCounter:
+    """
+    Views are added to an in-process buffer and flushed every
+    JOB_VIEWS_FLUSH_INTERVAL seconds by a daemon thread with
+    UPDATE ... SET views_count = views_count + n (one statement per distinct n).
+    QuerySet.update() skips save() and its signals and leaves updated_at alone,
+    and concurrent flushes from other workers add up instead of overwriting.
+    An interval of 0 writes every view through immediately.
+    """
+
+    _pending = {}
+    _lock = threading.Lock()
+    _thread = None
+
+    @classmethod
+    def interval(cls):
+        return getattr(settings, 'JOB_VIEWS_FLUSH_INTERVAL', 10)
+
+    @classmethod
+    def record(cls, job_id):
+        """Count one view of job_id; never waits on the database unless buffering is off"""
+        with cls._lock:
+            cls._pending[job_id] = cls._pending.get(job_id, 0) + 1
+        if cls.interval() <= 0:
+            cls.flush()
+        else:
+            cls._ensure_thread()
+
+    @classmethod
+    def pending(cls, job_id):
+        """Views of job_id not yet written to the database"""
+        with cls._lock:
+            return cls._pending.get(job_id, 0)
+
+    @classmethod
+    def flush(cls):
+        """Write the buffered views; returns the number of views written"""
+        from jobs.models import Job
+
+        with cls._lock:
+            pending, cls._pending = cls._pending, {}
+        if not pending:
+            return 0
+
+        by_increment = {}
+        for job_id, count in pending.items():
+            by_increment.setdefault(count, []).append(job_id)
+        written = 0
+        for count, job_ids in by_increment.items():
+            try:
+                Job.objects.filter(pk__in=job_ids).update(views_count=F('views_count') + count)
+                written += count * len(job_ids)
+            except Exception as e:
+                # Put the views back so the next flush retries them
+                print(f"Error flushing job views: {e}")
+                with cls._lock:
+                    for job_id in job_ids:
+                        cls._pending[job_id] = cls._pending.get(job_id, 0) + count
+        return written
+
+    @classmethod
+    def _ensure_thread(cls):
+        # After a fork the parent's thread doesn't run in the child, so is_alive() is False there
+        if cls._thread is not None and cls._thread.is_alive():
+            return
+        with cls._lock:
+            if cls._thread is not None and cls._thread.is_alive():
+                return
+            cls._thread = threading.Thread(target=cls._run, name='job-view-counter', daemon=True)
+            cls._thread.start()
+
+    @classmethod
+    def _run(cls):
+        while True:
+            time.sleep(max(cls.interval(), 1))
+            cls.flush()
+            # This thread holds its own connection; don't keep it past CONN_MAX_AGE
+            close_old_connections()
+
+
+# Don't lose the last interval's views when the worker shuts down cleanly
+atexit.register(JobViewCounter.flush)
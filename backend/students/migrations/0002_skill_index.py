@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def build_skill_index(apps, schema_editor):
+    Student = apps.get_model('students', 'Student')
+    StudentSkill = apps.get_model('students', 'StudentSkill')
+    rows = []
+    for student_id, skills in Student.objects.values_list('id', 'skills'):
+        normalized = {' '.join(str(skill).lower().split())[:100] for skill in skills or []}
+        rows.extend(StudentSkill(student_id=student_id, skill=skill) for skill in normalized if skill)
+    StudentSkill.objects.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StudentSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('skill', models.CharField(max_length=100)),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_index', to='students.student')),
+            ],
+            options={
+                'db_table': 'student_skills',
+                'unique_together': {('skill', 'student')},
+            },
+        ),
+        migrations.RunPython(build_skill_index, migrations.RunPython.noop),
+    ]
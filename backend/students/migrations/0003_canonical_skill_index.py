@@ -0,0 +1,114 @@
+import re
+from django.db import migrations
+
+# The skill taxonomy (canonical skill -> aliases) as it was when this migration was written,
+# frozen so later dictionary changes don't change what it writes; rebuild_skill_index applies those
+SKILL_ALIASES = {
+    'python': ['python3', 'python 3'],
+    'java': ['core java'],
+    'javascript': ['js', 'ecmascript', 'es6'],
+    'typescript': [],
+    'c++': ['cpp', 'cplusplus'],
+    'c#': ['csharp', 'c sharp'],
+    'php': [],
+    'ruby': [],
+    'go': ['golang'],
+    'rust': [],
+    'kotlin': [],
+    'swift': [],
+    'scala': [],
+    'html': ['html5'],
+    'css': ['css3'],
+    'react': ['reactjs', 'react.js'],
+    'angular': ['angularjs', 'angular.js'],
+    'vue': ['vuejs', 'vue.js'],
+    'node': ['nodejs', 'node.js'],
+    'express.js': ['expressjs'],
+    'next.js': ['nextjs'],
+    'django': [],
+    'flask': [],
+    'fastapi': [],
+    'spring': ['spring boot', 'springboot'],
+    'sql': [],
+    'nosql': ['no-sql'],
+    'mongodb': ['mongo'],
+    'postgresql': ['postgres'],
+    'mysql': [],
+    'redis': [],
+    'machine learning': ['ml'],
+    'deep learning': [],
+    'ai': ['artificial intelligence'],
+    'data science': [],
+    'nlp': ['natural language processing'],
+    'computer vision': [],
+    'tensorflow': [],
+    'pytorch': ['torch'],
+    'scikit-learn': ['sklearn', 'scikit learn'],
+    'pandas': [],
+    'numpy': [],
+    'docker': [],
+    'kubernetes': ['k8s'],
+    'aws': ['amazon web services'],
+    'azure': ['microsoft azure'],
+    'gcp': ['google cloud', 'google cloud platform'],
+    'devops': [],
+    'ci/cd': ['cicd', 'ci cd'],
+    'git': [],
+    'linux': [],
+    'rest api': ['restful api', 'restful apis', 'rest apis'],
+    'graphql': [],
+    'microservices': ['microservice'],
+    'agile': [],
+    'scrum': [],
+}
+
+MAX_SKILL_LENGTH = 100
+_WHITESPACE = re.compile(r'\s+')
+_SEPARATORS = re.compile(r'[\s.\-_]+')
+
+
+def skill_normalizer():
+    """Function mapping a skill list to its set of canonical names, as SkillIndex.normalize did then"""
+    aliases = {}
+    compact = {}
+    for canonical, terms in SKILL_ALIASES.items():
+        for term in [canonical] + terms:
+            aliases.setdefault(term, canonical)
+            compact.setdefault(_SEPARATORS.sub('', term), canonical)
+
+    def normalize(skills):
+        normalized = set()
+        for skill in skills or []:
+            term = _WHITESPACE.sub(' ', str(skill)).strip().lower()
+            canonical = aliases.get(term) or compact.get(_SEPARATORS.sub('', term), term)
+            normalized.add(canonical[:MAX_SKILL_LENGTH])
+        normalized.discard('')
+        return normalized
+
+    return normalize
+
+
+def canonicalize_skill_index(apps, schema_editor):
+    """Rebuild StudentSkill with canonical skill names (0002 stored lowercase terms)"""
+    normalize = skill_normalizer()
+    Student = apps.get_model('students', 'Student')
+    StudentSkill = apps.get_model('students', 'StudentSkill')
+    StudentSkill.objects.all().delete()
+    rows = []
+    for student_id, skills in Student.objects.values_list('id', 'skills').iterator(chunk_size=1000):
+        rows.extend(StudentSkill(student_id=student_id, skill=skill) for skill in normalize(skills))
+        if len(rows) >= 1000:
+            StudentSkill.objects.bulk_create(rows, ignore_conflicts=True)
+            rows = []
+    StudentSkill.objects.bulk_create(rows, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0002_skill_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(canonicalize_skill_index, migrations.RunPython.noop),
+    ]
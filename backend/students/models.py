@@ -51,3 +51,17 @@ class Student(models.Model):
     class Meta:
         db_table = 'students'
         ordering = ['-created_at']
+
+
+class StudentSkill(models.Model):
+    """Inverted skill index: one normalized skill held by a student"""
+    
+    student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name='skill_index')
+    skill = models.CharField(max_length=100)
+    
+    def __str__(self):
+        return f"{self.skill} - {self.student_id}"
+    
+    class Meta:
+        db_table = 'student_skills'
+        unique_together = ['skill', 'student']
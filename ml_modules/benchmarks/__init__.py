@@ -0,0 +1,6 @@
+"""Benchmarks for the ML modules"""
+
+from .generators import generate_students, generate_jobs, generate_resumes, write_resume_pdf
+from .harness import measure, compare
+
+__all__ = ['generate_students', 'generate_jobs', 'generate_resumes', 'write_resume_pdf', 'measure', 'compare']
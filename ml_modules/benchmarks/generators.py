@@ -0,0 +1,148 @@
+"""
+Synthetic Data Generators
+Deterministic students, jobs and resumes for benchmarking the ML modules
+"""
+
+import random
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+# Add parent directory to import skill_taxonomy
+sys.path.append(str(Path(__file__).parent.parent))
+from skill_taxonomy.taxonomy import DEFAULT_SKILLS
+
+BRANCHES = ['CSE', 'IT', 'ECE', 'EEE', 'MECH', 'CIVIL']
+COMPANIES = ['TechCorp', 'DataWorks', 'CloudNine', 'ByteForge', 'NeuralSoft', 'InfraStack', 'PixelLabs']
+ROLES = ['Software Engineer', 'Backend Developer', 'Frontend Developer', 'Data Scientist',
+         'ML Engineer', 'DevOps Engineer', 'Full Stack Developer', 'Data Analyst']
+FIRST_NAMES = ['Aarav', 'Diya', 'Rohan', 'Ananya', 'Vikram', 'Meera', 'Arjun', 'Sneha', 'Kiran', 'Priya']
+LAST_NAMES = ['Sharma', 'Reddy', 'Iyer', 'Patel', 'Gupta', 'Nair', 'Rao', 'Singh', 'Das', 'Menon']
+
+# Mostly dictionary skills, as typed by users (aliases, mixed case), plus a long tail of niche ones
+SKILL_POOL = (
+    list(DEFAULT_SKILLS)
+    + [alias for aliases in DEFAULT_SKILLS.values() for alias in aliases]
+    + [skill.title() for skill in DEFAULT_SKILLS]
+    + [f'niche skill {i}' for i in range(200)]
+)
+
+
+def _skills(rng: random.Random, low: int, high: int) -> List[str]:
+    return rng.sample(SKILL_POOL, rng.randint(low, high))
+
+
+def generate_students(n: int, seed: int = 42) -> List[Dict]:
+    """Student dicts shaped like the candidate data built in ml_views"""
+    rng = random.Random(seed)
+    return [
+        {
+            'id': i + 1,
+            'name': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+            'skills': _skills(rng, 0, 15),
+            'cgpa': round(rng.uniform(5.0, 10.0), 2),
+            'branch': rng.choice(BRANCHES),
+            'year': rng.randint(1, 4),
+        }
+        for i in range(n)
+    ]
+
+
+def generate_jobs(n: int, seed: int = 42) -> List[Dict]:
+    """Job dicts shaped like the job data built in ml_views"""
+    rng = random.Random(seed + 1)
+    return [
+        {
+            'id': i + 1,
+            'title': rng.choice(ROLES),
+            'company': rng.choice(COMPANIES),
+            'skills_required': _skills(rng, 1, 10),
+            'min_cgpa': rng.choice([None, 6.0, 6.5, 7.0, 7.5, 8.0]),
+        }
+        for i in range(n)
+    ]
+
+
+def generate_resume_text(seed: int = 42) -> str:
+    """Plain-text resume with contact, education, experience, skills and projects sections"""
+    rng = random.Random(seed)
+    name = f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}'
+    skills = _skills(rng, 3, 20)
+    lines = [
+        name,
+        f'{name.split()[0].lower()}.{rng.randint(1, 999)}@example.com | {rng.randint(6000000000, 9999999999)}',
+        f'linkedin.com/in/{name.split()[0].lower()} | github.com/{name.split()[0].lower()}',
+        '',
+        'Education',
+        f'B.Tech in {rng.choice(BRANCHES)}, graduated {rng.randint(2018, 2025)}, CGPA: {rng.uniform(6, 10):.2f}',
+        'Major: Computer Science',
+        '',
+        'Experience',
+    ]
+    for _ in range(rng.randint(1, 4)):
+        lines.append(f'{rng.choice(ROLES)} at {rng.choice(COMPANIES)} ({rng.randint(1, 4)} years)')
+        for _ in range(rng.randint(2, 5)):
+            lines.append(
+                f'- Developed and managed {rng.choice(skills)} services; improved latency by {rng.randint(5, 60)}% '
+                f'and led a team of {rng.randint(2, 8)} engineers'
+            )
+    lines += ['', 'Skills', ', '.join(skills), '', 'Projects']
+    for _ in range(rng.randint(1, 3)):
+        lines.append(f'- Built a {rng.choice(skills)} application using {rng.choice(skills)} and {rng.choice(skills)}')
+    lines += ['', 'Certifications', f'- {rng.choice(skills)} certification']
+    return '\n'.join(lines)
+
+
+def generate_resumes(n: int, seed: int = 42) -> List[str]:
+    return [generate_resume_text(seed + i) for i in range(n)]
+
+
+def _pdf_escape(line: str) -> str:
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def write_resume_pdf(path: str, text: str, lines_per_page: int = 50) -> str:
+    """
+    Write text as a minimal single-font PDF (no PDF library needed)
+    Long lines are wrapped and pages are split every lines_per_page lines
+    """
+    lines = []
+    for line in text.splitlines():
+        while len(line) > 90:
+            lines.append(line[:90])
+            line = line[90:]
+        lines.append(line)
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+
+    # Objects: 1 catalog, 2 page tree, 3 font, then a (page, content stream) pair per page
+    objects = []
+    page_ids = [4 + 2 * i for i in range(len(pages))]
+    objects.append(b'<< /Type /Catalog /Pages 2 0 R >>')
+    kids = ' '.join(f'{page_id} 0 R' for page_id in page_ids)
+    objects.append(f'<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>'.encode())
+    objects.append(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>')
+    for page_id, page_lines in zip(page_ids, pages):
+        content = 'BT /F1 11 Tf 14 TL 50 800 Td ' + ' '.join(
+            f'({_pdf_escape(line)}) Tj T*' for line in page_lines
+        ) + ' ET'
+        content = content.encode('latin-1', 'replace')
+        objects.append(
+            f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] '
+            f'/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>'.encode()
+        )
+        objects.append(b'<< /Length %d >>\nstream\n' % len(content) + content + b'\nendstream')
+
+    output = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b'%d 0 obj\n' % number + body + b'\nendobj\n'
+    xref_offset = len(output)
+    output += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    for offset in offsets:
+        output += b'%010d 00000 n \n' % offset
+    output += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref_offset)
+
+    with open(path, 'wb') as f:
+        f.write(output)
+    return path
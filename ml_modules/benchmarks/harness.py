@@ -0,0 +1,113 @@
+"""
+Benchmark Harness
+Times a callable over a list of inputs and reports throughput, latency percentiles and peak memory
+"""
+
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Sequence
+import numpy as np
+
+
+def measure(name: str, fn: Callable, args_list: Sequence[tuple], items_per_call: int = 1,
+            scale: int = None, warmup: int = 1) -> Dict:
+    """
+    Call fn(*args) once per entry of args_list
+    items_per_call: work items handled by one call (e.g. candidates ranked), used for throughput
+    Timing and memory are measured in separate passes, since tracemalloc slows allocation down
+    """
+    for args in args_list[:warmup]:
+        fn(*args)
+
+    latencies = []
+    for args in args_list:
+        start = time.perf_counter()
+        fn(*args)
+        latencies.append(time.perf_counter() - start)
+    latencies = np.array(latencies)
+
+    # Peak memory of a single call, relative to what was allocated before it
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    fn(*args_list[0])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = latencies.sum()
+    return {
+        'name': name,
+        'scale': scale,
+        'calls': len(latencies),
+        'items_per_call': items_per_call,
+        'throughput': round(len(latencies) * items_per_call / total, 2) if total else None,
+        'p50_ms': round(float(np.percentile(latencies, 50)) * 1000, 3),
+        'p99_ms': round(float(np.percentile(latencies, 99)) * 1000, 3),
+        'peak_memory_mb': round((peak - baseline) / 2 ** 20, 3),
+    }
+
+
+def environment() -> Dict:
+    """Machine and library versions stored alongside results"""
+    import scipy
+    import sklearn
+    return {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'numpy': np.__version__,
+        'scipy': scipy.__version__,
+        'scikit-learn': sklearn.__version__,
+    }
+
+
+def save_results(path: str, results: List[Dict], meta: Dict = None) -> None:
+    with open(path, 'w') as f:
+        json.dump({'meta': {**environment(), **(meta or {})}, 'results': results}, f, indent=2)
+        f.write('\n')
+
+
+def load_results(path: str) -> List[Dict]:
+    with open(path) as f:
+        return json.load(f)['results']
+
+
+def compare(results: List[Dict], baseline: List[Dict], tolerance: float = 0.25) -> List[Dict]:
+    """
+    Regressions against a saved baseline, matched on (name, scale)
+    A result regresses when p50 or p99 latency, or peak memory, grows by more than tolerance
+    """
+    previous = {(r['name'], r['scale']): r for r in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get((result['name'], result['scale']))
+        if not before:
+            continue
+        for metric in ('p50_ms', 'p99_ms', 'peak_memory_mb'):
+            old, new = before[metric], result[metric]
+            if old and new > old * (1 + tolerance):
+                regressions.append({
+                    'name': result['name'],
+                    'scale': result['scale'],
+                    'metric': metric,
+                    'baseline': old,
+                    'current': new,
+                    'change': f'{(new / old - 1) * 100:+.1f}%',
+                })
+    return regressions
+
+
+def format_table(results: List[Dict]) -> str:
+    header = f"{'benchmark':<32}{'scale':>8}{'calls':>7}{'items/s':>14}{'p50 ms':>12}{'p99 ms':>12}{'peak MB':>10}"
+    rows = [header, '-' * len(header)]
+    for r in results:
+        throughput = f"{r['throughput']:,.1f}" if r['throughput'] is not None else '-'
+        rows.append(
+            f"{r['name']:<32}{r['scale'] or '':>8}{r['calls']:>7}{throughput:>14}"
+            f"{r['p50_ms']:>12.3f}{r['p99_ms']:>12.3f}{r['peak_memory_mb']:>10.2f}"
+        )
+    return '\n'.join(rows)
@@ -0,0 +1,159 @@
+"""
+Benchmark Runner
+Times the ML module hot paths on synthetic data
+
+    cd ml_modules
+    python -m benchmarks.run --scale 1000 --scale 10000
+    python -m benchmarks.run --scale 1000 --save benchmarks/baselines/local.json
+    python -m benchmarks.run --scale 1000 --baseline benchmarks/baselines/reference.json
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+# Add parent directory to import the ML modules
+sys.path.append(str(Path(__file__).parent.parent))
+from skill_matcher.matcher import SkillMatcher
+from recommender.engine import RecommendationEngine
+from resume_scorer.scorer import ResumeScorer
+from benchmarks.generators import generate_students, generate_jobs, generate_resumes, write_resume_pdf
+from benchmarks.harness import measure, compare, format_table, save_results, load_results
+
+BENCHMARKS = [
+    'calculate_match', 'rank_candidates', 'recommend_jobs', 'recommend_candidates',
+    'similar_jobs_index_build', 'get_similar_jobs', 'get_similar_jobs_scan',
+    'extract_skills', 'extract_skills_cached', 'score_resume', 'score_many', 'score_feature_matrix',
+]
+
+
+def run_suite(scale: int, seed: int = 42, only: List[str] = None, queries: int = 20,
+              resumes: int = 50, fitted: bool = True) -> List[Dict]:
+    """
+    Run every benchmark at one scale (number of students and of jobs)
+    queries: calls per ranking benchmark; resumes: PDFs parsed by extract_skills (uncached)
+    and extract_skills_cached (every file parsed once first, then served from the cache)
+    fitted: fit one corpus vocabulary first, as the backend does with build_skill_vocabulary
+    """
+    selected = set(only or BENCHMARKS)
+    students = generate_students(scale, seed)
+    jobs = generate_jobs(scale, seed)
+    queries = min(queries, scale)
+
+    matcher = SkillMatcher()
+    if fitted:
+        matcher.fit([s['skills'] for s in students] + [j['skills_required'] for j in jobs])
+    engine = RecommendationEngine(matcher)
+    results = []
+
+    if 'calculate_match' in selected:
+        pairs = [(students[i]['skills'], jobs[i]['skills_required']) for i in range(min(scale, 1000))]
+        results.append(measure('calculate_match', matcher.calculate_match, pairs, scale=scale))
+
+    if 'rank_candidates' in selected:
+        args = [(students, jobs[i]['skills_required']) for i in range(queries)]
+        results.append(measure('rank_candidates', matcher.rank_candidates, args, len(students), scale))
+
+    if 'recommend_jobs' in selected:
+        args = [(students[i], jobs) for i in range(queries)]
+        results.append(measure('recommend_jobs', engine.recommend_jobs, args, len(jobs), scale))
+
+    if 'recommend_candidates' in selected:
+        args = [(jobs[i], students) for i in range(queries)]
+        results.append(measure('recommend_candidates', engine.recommend_candidates, args, len(students), scale))
+
+    if selected & {'similar_jobs_index_build', 'get_similar_jobs'}:
+        results.append(measure('similar_jobs_index_build', engine.build_similar_jobs_index, [(jobs,)],
+                               len(jobs), scale, warmup=0))
+        if 'get_similar_jobs' in selected:
+            args = [(jobs[i]['id'],) for i in range(queries)]
+            results.append(measure('get_similar_jobs', engine.get_similar_jobs, args, scale=scale))
+        engine.similar_jobs_index = None
+
+    if 'get_similar_jobs_scan' in selected:
+        args = [(jobs[i]['id'], jobs) for i in range(queries)]
+        results.append(measure('get_similar_jobs_scan', engine.get_similar_jobs, args, len(jobs), scale))
+
+    texts = generate_resumes(min(scale, max(resumes, 1000)), seed)
+
+    if selected & {'extract_skills', 'extract_skills_cached'}:
+        try:
+            from resume_parser.parser import ResumeParser
+        except ImportError as e:
+            print(f"Skipping extract_skills: {e}")
+        else:
+            with tempfile.TemporaryDirectory() as tmp:
+                paths = [
+                    (write_resume_pdf(os.path.join(tmp, f'resume_{i}.pdf'), text),)
+                    for i, text in enumerate(texts[:resumes])
+                ]
+                if 'extract_skills' in selected:
+                    # Every call (warm-up and memory pass included) parses the PDF
+                    parser = ResumeParser(cache=False)
+                    results.append(measure('extract_skills', parser.extract_skills, paths, scale=scale))
+                if 'extract_skills_cached' in selected:
+                    # Re-uploads of identical files: hashing plus two cache lookups
+                    parser = ResumeParser()
+                    results.append(measure('extract_skills_cached', parser.extract_skills, paths, scale=scale,
+                                           warmup=len(paths)))
+
+    if selected & {'score_resume', 'score_many', 'score_feature_matrix'}:
+        scorer = ResumeScorer()
+        resume_data = [{'text': text, 'skills': text.split('Skills\n', 1)[-1].split('\n', 1)[0].split(', ')}
+                       for text in texts]
+        if 'score_resume' in selected:
+            results.append(measure('score_resume', scorer.score_resume, [(r,) for r in resume_data], scale=scale))
+        if 'score_many' in selected:
+            results.append(measure('score_many', scorer.score_many, [(resume_data,)] * 3, len(resume_data),
+                                   scale, warmup=0))
+        if 'score_feature_matrix' in selected:
+            # Rescoring from stored features, as rescore_resumes does after a weight change
+            matrix = scorer.feature_matrix(resume_data)
+            results.append(measure('score_feature_matrix', scorer.score_feature_matrix, [(matrix,)] * 3,
+                                   len(resume_data), scale, warmup=0))
+
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the ml_modules hot paths on synthetic data')
+    parser.add_argument('--scale', type=int, action='append',
+                        help='Number of students and jobs (repeatable, default 1000)')
+    parser.add_argument('--only', action='append', choices=BENCHMARKS, help='Run only these benchmarks')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--queries', type=int, default=20, help='Calls per ranking benchmark')
+    parser.add_argument('--resumes', type=int, default=50, help='PDFs parsed by extract_skills')
+    parser.add_argument('--unfitted', action='store_true', help='Skip fitting the corpus vocabulary')
+    parser.add_argument('--save', help='Write results to this JSON file')
+    parser.add_argument('--baseline', help='Compare against a saved results file')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed slowdown/memory growth before a result counts as a regression')
+    args = parser.parse_args(argv)
+
+    results = []
+    for scale in args.scale or [1000]:
+        print(f"Running benchmarks at scale {scale}...")
+        results += run_suite(scale, args.seed, args.only, args.queries, args.resumes, not args.unfitted)
+    print(format_table(results))
+
+    if args.save:
+        save_results(args.save, results, {
+            'seed': args.seed, 'queries': args.queries, 'resumes': args.resumes, 'fitted': not args.unfitted
+        })
+        print(f"Saved results to {args.save}")
+
+    if args.baseline:
+        regressions = compare(results, load_results(args.baseline), args.tolerance)
+        for r in regressions:
+            print(f"REGRESSION {r['name']} @ {r['scale']}: {r['metric']} {r['baseline']} -> {r['current']} ({r['change']})")
+        if regressions:
+            return 1
+        print(f"No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,5 +8,6 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from recommender.engine import RecommendationEngine
+from recommender.similarity import SimilarJobsIndex
 
-__all__ = ['RecommendationEngine']
+__all__ = ['RecommendationEngine', 'SimilarJobsIndex']
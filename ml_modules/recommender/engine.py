@@ -4,20 +4,23 @@ Provides job recommendations for students and candidate recommendations for recr
 """
 
 from typing import List, Dict
+import numpy as np
 import sys
 from pathlib import Path
 
 # Add parent directory to import skill_matcher
 sys.path.append(str(Path(__file__).parent.parent))
-from skill_matcher.matcher import SkillMatcher
+from skill_matcher.matcher import SkillMatcher, BatchMatch
+from recommender.similarity import SimilarJobsIndex
 
 
 class RecommendationEngine:
     """Generate recommendations using collaborative and content-based filtering"""
     
-    def __init__(self):
-        """Initialize with skill matcher"""
-        self.matcher = SkillMatcher()
+    def __init__(self, matcher: SkillMatcher = None):
+        """Initialize with skill matcher (pass a fitted one to reuse a corpus vocabulary)"""
+        self.matcher = matcher or SkillMatcher()
+        self.similar_jobs_index = None
     
     def recommend_jobs(self, student_profile: Dict, jobs: List[Dict], top_n: int = 10) -> List[Dict]:
         """
@@ -33,25 +36,26 @@ class RecommendationEngine:
         """
         student_skills = student_profile.get('skills', [])
         
-        # Rank all jobs based on skill match
-        ranked_jobs = self.matcher.rank_jobs(jobs, student_skills)
+        # Score all jobs in one pass, then only materialize the top N
+        batch = self.matcher.batch_match(
+            student_skills,
+            [job.get('skills_required', []) for job in jobs],
+            query_is_job=False
+        )
+        rec_scores = self._calculate_job_recommendation_scores(batch)
         
-        # Apply additional filters
         recommendations = []
-        for job in ranked_jobs:
-            # Calculate recommendation score (weighted)
-            rec_score = self._calculate_job_recommendation_score(
-                job,
-                student_profile
-            )
-            
-            job['recommendation_score'] = rec_score
-            recommendations.append(job)
-        
-        # Re-sort by recommendation score
-        recommendations.sort(key=lambda x: x['recommendation_score'], reverse=True)
-        
-        return recommendations[:top_n]
+        for i, rec_score in self._top_k(rec_scores, batch.match_score, top_n):
+            job = jobs[i]
+            recommendations.append({
+                'id': job.get('id'),
+                'title': job.get('title'),
+                'company': job.get('company', ''),
+                **batch.details(i),
+                'recommendation_score': float(rec_score)
+            })
+        
+        return recommendations
     
     def recommend_candidates(self, job_details: Dict, candidates: List[Dict], top_n: int = 20) -> List[Dict]:
         """
@@ -67,68 +71,90 @@ class RecommendationEngine:
         """
         job_skills = job_details.get('skills_required', [])
         
-        # Rank all candidates based on skill match
-        ranked_candidates = self.matcher.rank_candidates(candidates, job_skills)
+        # Score all candidates in one pass, then only materialize the top N
+        batch = self.matcher.batch_match(
+            job_skills,
+            [candidate.get('skills', []) for candidate in candidates]
+        )
+        rec_scores = self._calculate_candidate_recommendation_scores(batch)
         
-        # Apply additional scoring
         recommendations = []
-        for candidate in ranked_candidates:
-            # Calculate recommendation score
-            rec_score = self._calculate_candidate_recommendation_score(
-                candidate,
-                job_details
-            )
-            
-            candidate['recommendation_score'] = rec_score
-            recommendations.append(candidate)
-        
-        # Re-sort by recommendation score
-        recommendations.sort(key=lambda x: x['recommendation_score'], reverse=True)
-        
-        return recommendations[:top_n]
+        for i, rec_score in self._top_k(rec_scores, batch.match_score, top_n):
+            candidate = candidates[i]
+            recommendations.append({
+                'id': candidate.get('id'),
+                'name': candidate.get('name'),
+                **batch.details(i),
+                'recommendation_score': float(rec_score)
+            })
+        
+        return recommendations
     
-    def _calculate_job_recommendation_score(self, job: Dict, student_profile: Dict) -> float:
+    def _top_k(self, scores: np.ndarray, match_scores: np.ndarray, k: int) -> List[tuple]:
         """
-        Calculate weighted recommendation score for a job
-        Considers skill match, CGPA requirement, etc.
+        (index, rounded score) of the K best items, ordered by recommendation score,
+        then match score, then input order
+        Uses argpartition so only the items at or near the K-th score get sorted
         """
-        # Base score from skill match
-        skill_match = job.get('match_score', 0)
+        n = len(scores)
+        if k <= 0 or n == 0:
+            return []
+        
+        selected = np.arange(n)
+        if k < n:
+            threshold = scores[np.argpartition(scores, n - k)[n - k]]
+            # Keep everything that could tie with the K-th item once rounded to 2 decimals
+            selected = np.flatnonzero(scores >= threshold - 0.01)
         
+        rounded = np.array([round(float(scores[i]), 2) for i in selected])
+        order = np.lexsort((selected, -match_scores[selected], -rounded))[:k]
+        return [(selected[j], rounded[j]) for j in order]
+    
+    def _calculate_job_recommendation_scores(self, batch: BatchMatch) -> np.ndarray:
+        """
+        Calculate weighted recommendation scores for a batch of jobs
+        Considers skill match, CGPA requirement, etc.
+        """
         # Weight: 70% skill match, 30% other factors
-        score = skill_match * 0.7
+        scores = batch.match_score * 0.7
         
         # Add bonus for exact skill matches
-        exact_match = job.get('exact_match_percentage', 0)
-        score += exact_match * 0.2
+        scores = scores + batch.exact_match_percentage * 0.2
         
         # Add bonus if student has many matched skills
-        matched_count = job.get('matched_count', 0)
-        if matched_count >= 5:
-            score += 10
+        scores = scores + np.where(batch.matched_count >= 5, 10, 0)
         
-        return round(min(score, 100), 2)  # Cap at 100
+        return np.minimum(scores, 100)  # Cap at 100, rounded in _top_k
     
-    def _calculate_candidate_recommendation_score(self, candidate: Dict, job_details: Dict) -> float:
+    def _calculate_candidate_recommendation_scores(self, batch: BatchMatch) -> np.ndarray:
         """
-        Calculate weighted recommendation score for a candidate
+        Calculate weighted recommendation scores for a batch of candidates
         """
-        # Base score from skill match
-        skill_match = candidate.get('match_score', 0)
-        exact_match = candidate.get('exact_match_percentage', 0)
-        
         # Weighted score
-        score = (skill_match * 0.6) + (exact_match * 0.4)
+        scores = (batch.match_score * 0.6) + (batch.exact_match_percentage * 0.4)
         
-        return round(min(score, 100), 2)  # Cap at 100
+        return np.minimum(scores, 100)  # Cap at 100, rounded in _top_k
+    
+    def build_similar_jobs_index(self, jobs: List[Dict], neighbours: int = 20) -> SimilarJobsIndex:
+        """
+        Precompute nearest-neighbour lists for every job
+        Keep it current with index.upsert(job) / index.remove(job_id) when jobs change
+        """
+        self.similar_jobs_index = SimilarJobsIndex(self.matcher, neighbours=neighbours).build(jobs)
+        return self.similar_jobs_index
     
-    def get_similar_jobs(self, job_id: str, all_jobs: List[Dict], top_n: int = 5) -> List[Dict]:
+    def get_similar_jobs(self, job_id: str, all_jobs: List[Dict] = None, top_n: int = 5) -> List[Dict]:
         """
         Find similar jobs based on skill requirements
         Useful for "Similar Jobs" feature
+        Served from the similar jobs index when it holds the job, else scored against all_jobs in one pass
         """
+        index = self.similar_jobs_index
+        if index is not None and job_id in index and top_n <= index.neighbours:
+            return index.similar(job_id, top_n)
+        
         target_job = None
-        for job in all_jobs:
+        for job in all_jobs or []:
             if job.get('id') == job_id:
                 target_job = job
                 break
@@ -136,29 +162,23 @@ class RecommendationEngine:
         if not target_job:
             return []
         
-        target_skills = target_job.get('skills_required', [])
-        similar = []
+        others = [job for job in all_jobs if job.get('id') != job_id]
+        batch = self.matcher.batch_match(
+            target_job.get('skills_required', []),
+            [job.get('skills_required', []) for job in others]
+        )
         
-        for job in all_jobs:
-            if job.get('id') == job_id:
-                continue
-            
-            match_score = self.matcher.calculate_match(
-                job.get('skills_required', []),
-                target_skills
-            )
-            
+        similar = []
+        for i in np.argsort(-batch.match_score, kind='stable')[:top_n]:
+            job = others[i]
             similar.append({
                 'id': job.get('id'),
                 'title': job.get('title'),
                 'company': job.get('company'),
-                'similarity_score': match_score
+                'similarity_score': float(batch.match_score[i])
             })
         
-        # Sort by similarity
-        similar.sort(key=lambda x: x['similarity_score'], reverse=True)
-        
-        return similar[:top_n]
+        return similar
 
 
 # Example usage
@@ -0,0 +1,199 @@
+"""
+Similar Jobs Index
+Precomputed job-to-job nearest-neighbour lists over TF-IDF skill vectors
+"""
+
+from typing import List, Dict
+import bisect
+import threading
+import numpy as np
+from scipy import sparse
+from sklearn.base import clone
+import sys
+from pathlib import Path
+
+# Add parent directory to import skill_matcher
+sys.path.append(str(Path(__file__).parent.parent))
+from skill_matcher.matcher import SkillMatcher
+
+
+class SimilarJobsIndex:
+    """Keep the most similar jobs for every job so lookups are O(K)"""
+
+    def __init__(self, matcher: SkillMatcher = None, neighbours: int = 20, chunk_size: int = 256):
+        """
+        matcher: SkillMatcher whose vocabulary is used (fitted on the jobs at build time if needed)
+        neighbours: number of nearest neighbours kept per job
+        chunk_size: rows of the cosine matrix computed at once while building
+        """
+        self.matcher = matcher or SkillMatcher()
+        self.neighbours = neighbours
+        self.chunk_size = chunk_size
+        self.vectorizer = None
+
+        self._jobs = {}        # job id -> {'id', 'title', 'company'}
+        self._skills = {}      # job id -> skills_required
+        self._vectors = {}     # job id -> 1 x V sparse TF-IDF row
+        self._lists = {}       # job id -> [(-score, row order, other id)], best first
+        self._order = {}       # job id -> insertion order, used to break ties
+        self._matrix = None
+        self._matrix_ids = []
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._jobs)
+
+    def __contains__(self, job_id):
+        return job_id in self._jobs
+
+    def build(self, jobs: List[Dict]) -> 'SimilarJobsIndex':
+        """
+        Build the index from scratch
+        jobs: List of job dicts with 'id', 'title', 'company', 'skills_required'
+        """
+        texts = [self.matcher.skills_to_text(job.get('skills_required', [])) for job in jobs]
+
+        with self._lock:
+            if self.matcher.is_fitted:
+                self.vectorizer = self.matcher.vectorizer
+            else:
+                self.vectorizer = clone(self.matcher.vectorizer)
+                try:
+                    self.vectorizer.fit(texts)
+                except ValueError as e:
+                    print(f"Error building similar jobs index: {e}")
+                    self.vectorizer = None
+
+            self._jobs, self._skills, self._vectors, self._lists, self._order = {}, {}, {}, {}, {}
+            if self.vectorizer is None or not jobs:
+                self._invalidate()
+                return self
+
+            matrix = self.vectorizer.transform(texts).tocsr()
+            for row, job in enumerate(jobs):
+                job_id = job.get('id')
+                self._jobs[job_id] = self._job_summary(job)
+                self._skills[job_id] = job.get('skills_required', [])
+                self._vectors[job_id] = matrix[row]
+                self._order[job_id] = row
+            self._invalidate()
+
+            # All-pairs cosine similarity, a chunk of rows at a time to bound memory
+            matrix = self._get_matrix()
+            for start in range(0, matrix.shape[0], self.chunk_size):
+                similarities = (matrix[start:start + self.chunk_size] @ matrix.T).toarray()
+                for offset, row in enumerate(similarities):
+                    job_id = self._matrix_ids[start + offset]
+                    self._lists[job_id] = self._nearest(job_id, row)
+
+        return self
+
+    def upsert(self, job: Dict) -> None:
+        """Add a new job or refresh an edited one, updating only the affected neighbour lists"""
+        job_id = job.get('id')
+        if self.vectorizer is None:
+            # Nothing usable was fitted yet, so rebuild with the new job included
+            jobs = [{**summary, 'skills_required': self._skills[other_id]}
+                    for other_id, summary in self._jobs.items() if other_id != job_id]
+            self.build(jobs + [job])
+            return
+
+        with self._lock:
+            if job_id in self._jobs:
+                if (self._skills[job_id] == job.get('skills_required', [])
+                        and self._jobs[job_id] == self._job_summary(job)):
+                    return  # Nothing the index depends on changed
+                self._discard(job_id)
+
+            self._jobs[job_id] = self._job_summary(job)
+            self._skills[job_id] = job.get('skills_required', [])
+            self._vectors[job_id] = self.vectorizer.transform(
+                [self.matcher.skills_to_text(job.get('skills_required', []))]
+            )
+            self._order[job_id] = max(self._order.values(), default=-1) + 1
+            self._invalidate()
+
+            # One sparse matrix-vector product against every other job
+            similarities = (self._get_matrix() @ self._vectors[job_id].T).toarray().ravel()
+            self._lists[job_id] = self._nearest(job_id, similarities)
+
+            entry_order = self._order[job_id]
+            for i in np.flatnonzero(similarities > 0):
+                other_id = self._matrix_ids[i]
+                if other_id == job_id:
+                    continue
+                neighbours = self._lists[other_id]
+                entry = (-float(similarities[i]), entry_order, job_id)
+                if len(neighbours) < self.neighbours or entry < neighbours[-1]:
+                    bisect.insort(neighbours, entry)
+                    del neighbours[self.neighbours:]
+
+    def remove(self, job_id) -> None:
+        """Drop a deleted or deactivated job"""
+        with self._lock:
+            if job_id in self._jobs:
+                self._discard(job_id)
+                self._invalidate()
+
+    def similar(self, job_id, top_n: int = 5) -> List[Dict]:
+        """Most similar jobs to job_id, best first"""
+        neighbours = self._lists.get(job_id, [])[:top_n]
+        return [
+            {**self._jobs[other_id], 'similarity_score': round(-score * 100, 2)}
+            for score, _, other_id in neighbours
+        ]
+
+    def _discard(self, job_id) -> None:
+        """Remove job_id everywhere and refill the lists that referenced it"""
+        del self._jobs[job_id]
+        del self._skills[job_id]
+        del self._vectors[job_id]
+        del self._lists[job_id]
+        del self._order[job_id]
+        self._invalidate()
+
+        affected = [other_id for other_id, neighbours in self._lists.items()
+                    if any(entry[2] == job_id for entry in neighbours)]
+        if affected:
+            matrix = self._get_matrix()
+            rows = sparse.vstack([self._vectors[other_id] for other_id in affected])
+            similarities = (rows @ matrix.T).toarray()
+            for other_id, row in zip(affected, similarities):
+                self._lists[other_id] = self._nearest(other_id, row)
+
+    def _nearest(self, job_id, similarities: np.ndarray) -> List[tuple]:
+        """Top neighbours from one row of cosine similarities aligned with _matrix_ids"""
+        candidates = np.flatnonzero(similarities > 0)
+        if len(candidates) > self.neighbours + 1:
+            # Keep everything tied with the cutoff score, so ties are broken by insertion order below
+            scores = similarities[candidates]
+            cutoff = -np.partition(-scores, self.neighbours)[self.neighbours]
+            candidates = candidates[scores >= cutoff]
+
+        neighbours = [
+            (-float(similarities[i]), self._order[self._matrix_ids[i]], self._matrix_ids[i])
+            for i in candidates
+            if self._matrix_ids[i] != job_id
+        ]
+        neighbours.sort()
+        return neighbours[:self.neighbours]
+
+    def _get_matrix(self):
+        """Stacked TF-IDF rows for every indexed job, rebuilt lazily after changes"""
+        if self._matrix is None:
+            self._matrix_ids = list(self._vectors)
+            if self._matrix_ids:
+                self._matrix = sparse.vstack([self._vectors[i] for i in self._matrix_ids]).tocsr()
+            else:
+                self._matrix = sparse.csr_matrix((0, len(self.vectorizer.vocabulary_)))
+        return self._matrix
+
+    def _invalidate(self) -> None:
+        self._matrix = None
+
+    def _job_summary(self, job: Dict) -> Dict:
+        return {
+            'id': job.get('id'),
+            'title': job.get('title'),
+            'company': job.get('company')
+        }
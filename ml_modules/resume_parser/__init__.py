@@ -1,5 +1,7 @@
 """Resume Parser Module"""
 
 from .parser import ResumeParser
+from .batch import BatchResumeParser
+from .guard import GuardedResumeParser
 
-__all__ = ['ResumeParser']
+__all__ = ['ResumeParser', 'BatchResumeParser', 'GuardedResumeParser']
@@ -0,0 +1,169 @@
+"""
+Batch Resume Parsing
+Fans PDFs out over a process pool, one ResumeParser (and spaCy model) per worker;
+each file is parsed under the guard, so a bad PDF fails alone
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Dict, Generator, Iterable, Iterator, List
+
+# Add parent directory so worker processes can import resume_parser
+sys.path.append(str(Path(__file__).parent.parent))
+from resume_parser.parser import ResumeParser
+from resume_parser.guard import GuardedResumeParser
+
+# Set in each worker by _init_worker, so the spaCy model is loaded once per process
+# (the guard forks its per-file child from the worker, sharing the loaded model)
+_parser = None
+_guard = None
+
+
+def _init_worker(guard_options: Dict = None):
+    global _parser, _guard
+    _parser = ResumeParser()
+    _parser.load_nlp()
+    _guard = GuardedResumeParser(_parser, **guard_options) if guard_options is not None else None
+
+
+def parse_resume(path: str, parser: ResumeParser = None, guard: GuardedResumeParser = None) -> Dict:
+    """
+    Parse one PDF, never raising: failures come back as {'ok': False, 'error': ..., 'reason': ...}
+    With a guard the parse runs in a child process under its timeout and memory/page limits
+    """
+    guard = guard or (_guard if parser is None else None)
+    parser = guard.parser if guard else parser or _parser or ResumeParser()
+    start = time.perf_counter()
+    result = {'path': path, 'ok': False, 'reason': None, 'worker': os.getpid()}
+    try:
+        parsed = guard.extract_skills(path) if guard else parser.extract_skills(path)
+        text = parsed['cleaned_text']
+        result.update({
+            'skills': parsed['skills'],
+            'skill_count': parsed['skill_count'],
+            'email': parser.extract_email(text),
+            'phone': parser.extract_phone(text),
+            'text': text,
+            'timings': parsed['timings'],
+        })
+        if guard and not parsed['ok']:
+            result.update(reason=parsed['reason'], error=parsed['error'])
+        elif text:
+            result['ok'] = True
+        else:
+            result['error'] = 'No text could be extracted'
+    except Exception as e:
+        result['error'] = f'{type(e).__name__}: {e}'
+    result['elapsed'] = round(time.perf_counter() - start, 6)
+    return result
+
+
+class BatchResumeParser:
+    """Parse many resumes in parallel, yielding each result as soon as it is ready"""
+
+    def __init__(self, max_workers: int = None, mp_context=None, timeout: float = 30,
+                 memory_limit_mb: int = 1024, max_page_count: int = 50, guarded: bool = True,
+                 max_pool_restarts: int = 2):
+        """
+        max_workers: worker processes (defaults to the CPU count)
+        mp_context: multiprocessing context, e.g. multiprocessing.get_context('spawn')
+        timeout, memory_limit_mb, max_page_count: per-file GuardedResumeParser limits
+        guarded: False parses in the worker itself (no per-file timeout or memory cap)
+        max_pool_restarts: parallel retries of files left unfinished by a dead worker
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.mp_context = mp_context
+        self.guard_options = {
+            'timeout': timeout,
+            'memory_limit_mb': memory_limit_mb,
+            'max_page_count': max_page_count
+        } if guarded else None
+        self.max_pool_restarts = max_pool_restarts
+
+    def parse(self, paths: Iterable[str]) -> Iterator[Dict]:
+        """
+        Yield one result dict per path, in completion order
+        A file that hangs, runs out of memory or crashes its guard process is
+        reported as failed on its own. If a pool worker itself dies, the files
+        it left unfinished go to a fresh pool; after max_pool_restarts they run
+        one at a time, so only a file that kills its worker again is failed
+        """
+        pending = [str(path) for path in paths]
+        restarts = 0
+        while pending:
+            isolate = restarts >= self.max_pool_restarts
+            pending = yield from self._run_pool(pending, isolate)
+            restarts += 1
+
+    def _pool(self, workers: int) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=self.mp_context,
+            initializer=_init_worker,
+            initargs=(self.guard_options,)
+        )
+
+    def _run_pool(self, paths: List[str], isolate: bool) -> Generator[Dict, None, List[str]]:
+        """Yield results from one pool; returns the paths a dead worker left unfinished"""
+        if isolate:
+            # One file in flight at a time: a crash can only be that file's
+            with self._pool(1) as executor:
+                for i, path in enumerate(paths):
+                    try:
+                        yield executor.submit(parse_resume, path).result()
+                    except BrokenProcessPool as e:
+                        yield {'path': path, 'ok': False, 'error': f'Worker crashed: {e}'}
+                        return paths[i + 1:]
+                    except Exception as e:
+                        yield {'path': path, 'ok': False, 'error': f'{type(e).__name__}: {e}'}
+            return []
+
+        unfinished = []
+        with self._pool(min(self.max_workers, len(paths))) as executor:
+            futures = {executor.submit(parse_resume, path): path for path in paths}
+            for future in as_completed(futures):
+                try:
+                    yield future.result()
+                except BrokenProcessPool:
+                    # A worker died (e.g. killed by the OS); the pool fails every file it still held
+                    unfinished.append(futures[future])
+                except Exception as e:
+                    yield {'path': futures[future], 'ok': False, 'error': f'{type(e).__name__}: {e}'}
+        return unfinished
+
+
+def summarize(results: Iterable[Dict]) -> Dict:
+    """Counts and total/mean seconds per parsing stage"""
+    parsed = failed = timed = 0
+    stage_totals = {}
+    for result in results:
+        if result.get('ok'):
+            parsed += 1
+        else:
+            failed += 1
+        if result.get('timings'):
+            timed += 1
+        for stage, seconds in result.get('timings', {}).items():
+            stage_totals[stage] = stage_totals.get(stage, 0.0) + seconds
+
+    return {
+        'parsed': parsed,
+        'failed': failed,
+        'stages': {
+            stage: {'total': round(total, 3), 'mean': round(total / timed, 6)}
+            for stage, total in stage_totals.items()
+        }
+    }
+
+
+def find_resumes(paths: Iterable[str]) -> Iterator[str]:
+    """PDF files among paths, searching directories recursively"""
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from (str(p) for p in sorted(path.rglob('*')) if p.suffix.lower() == '.pdf')
+        else:
+            yield str(path)
@@ -0,0 +1,193 @@
+"""
+Guarded Resume Parsing
+Runs ResumeParser in a supervised child process with a wall-clock timeout,
+an address-space cap and a page-count cap, so one bad PDF can't hang or
+exhaust the calling (web) worker
+"""
+
+import multiprocessing
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict
+
+# Add parent directory so the child process can import resume_parser
+sys.path.append(str(Path(__file__).parent.parent))
+from resume_parser.parser import ResumeParser
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits, the timeout still applies
+    resource = None
+
+# Failure reasons
+TIMEOUT = 'timeout'
+MEMORY_LIMIT = 'memory_limit'
+TOO_MANY_PAGES = 'too_many_pages'
+CRASHED = 'crashed'
+NO_TEXT = 'no_text'
+ERROR = 'error'
+
+
+def _address_space_bytes() -> int:
+    """Current virtual memory size of this process (0 when unknown)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def count_pages(pdf_path: str) -> int:
+    """Number of pages from the PDF's page tree (None if it can't be read)"""
+    try:
+        import PyPDF2
+        with open(pdf_path, 'rb') as file:
+            return len(PyPDF2.PdfReader(file).pages)
+    except Exception:
+        return None
+
+
+def _child(conn, parser: ResumeParser, pdf_path: str, memory_limit: int, max_page_count: int):
+    """Runs in the child: send ('stage', name, data) per finished stage, then ('done',) or ('failed', reason, error)"""
+    try:
+        # The parent owns caching; cache clients (e.g. Redis connections) aren't fork-safe
+        parser.cache = None
+        if resource and memory_limit:
+            # Cap growth beyond what the (forked) process already maps
+            limit = _address_space_bytes() + memory_limit
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+        page_count = count_pages(pdf_path)
+        conn.send(('stage', 'page_count', {'page_count': page_count}))
+        if max_page_count and page_count and page_count > max_page_count:
+            conn.send(('failed', TOO_MANY_PAGES, f'{page_count} pages (limit {max_page_count})'))
+            return
+
+        timings = {}
+        texts = parser.parse_text(pdf_path, timings)
+        conn.send(('stage', 'text', {**texts, 'timings': dict(timings)}))
+        found = parser.parse_skills(texts['cleaned_text'], timings)
+        conn.send(('stage', 'skills', {**found, 'timings': dict(timings)}))
+        conn.send(('done',))
+    except MemoryError:
+        conn.send(('failed', MEMORY_LIMIT, 'Memory limit exceeded'))
+    except Exception as e:
+        conn.send(('failed', ERROR, f'{type(e).__name__}: {e}'))
+    finally:
+        conn.close()
+
+
+class GuardedResumeParser:
+    """
+    extract_skills() in a child process. Always returns a dict with
+    'ok', 'reason' (None or a failure reason), 'error', 'stage' (last finished
+    stage) and whatever the finished stages produced
+    """
+
+    def __init__(self, parser: ResumeParser = None, timeout: float = 30, memory_limit_mb: int = 1024,
+                 max_page_count: int = 50, mp_context=None):
+        """
+        parser: parser to run (with 'fork' the child reuses its loaded spaCy model)
+        timeout: wall-clock seconds for the whole parse
+        memory_limit_mb: extra address space the child may map (Linux/macOS)
+        max_page_count: PDFs with more pages are rejected before extraction
+        """
+        self.parser = parser or ResumeParser()
+        self.timeout = timeout
+        self.memory_limit = memory_limit_mb * 2 ** 20 if memory_limit_mb else None
+        self.max_page_count = max_page_count
+        if mp_context is None:
+            methods = multiprocessing.get_all_start_methods()
+            mp_context = multiprocessing.get_context('fork' if 'fork' in methods else 'spawn')
+        self.mp_context = mp_context
+
+    def _cached(self, digest: str):
+        """Both stages from the parser's cache, or None"""
+        cache = self.parser.cache
+        if cache is None or not digest:
+            return None
+        keys = self.parser._cache_keys(digest)
+        texts = cache.get(keys['text'])
+        found = cache.get(keys['skills']) if texts is not None else None
+        if found is None:
+            return None
+        return {**texts, **found}
+
+    def _store(self, digest: str, result: Dict):
+        cache = self.parser.cache
+        if cache is None or not digest:
+            return
+        keys = self.parser._cache_keys(digest)
+        cache.set(keys['text'], {'raw_text': result['raw_text'], 'cleaned_text': result['cleaned_text']})
+        cache.set(keys['skills'], {'skills': result['skills'], 'skill_mentions': result['skill_mentions']})
+
+    def extract_skills(self, pdf_path: str) -> Dict:
+        """Parse one PDF under the guard; never raises and never outlives the timeout"""
+        start = time.perf_counter()
+        digest = self.parser.content_hash(pdf_path) if self.parser.cache is not None else None
+        result = {
+            'ok': False, 'reason': None, 'error': None, 'stage': None,
+            'raw_text': '', 'cleaned_text': '', 'skills': [], 'skill_count': 0, 'skill_mentions': {},
+            'page_count': None, 'content_hash': digest, 'cached': False, 'timings': {},
+        }
+
+        cached = self._cached(digest)
+        if cached is not None:
+            result.update(cached, ok=True, stage='skills', skill_count=len(cached['skills']), cached=True)
+            result['elapsed'] = round(time.perf_counter() - start, 6)
+            return result
+
+        receiver, sender = self.mp_context.Pipe(duplex=False)
+        process = self.mp_context.Process(
+            target=_child,
+            args=(sender, self.parser, pdf_path, self.memory_limit, self.max_page_count),
+            daemon=True
+        )
+        process.start()
+        sender.close()
+
+        deadline = start + self.timeout
+        finished = False
+        try:
+            while not finished:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0 or not receiver.poll(remaining):
+                    result.update(reason=TIMEOUT, error=f'Parsing exceeded {self.timeout}s')
+                    break
+                try:
+                    message = receiver.recv()
+                except EOFError:
+                    # The child died without reporting (killed by a signal, e.g. the OOM killer)
+                    process.join(1)
+                    result.update(reason=CRASHED, error=f'Parser process exited with code {process.exitcode}')
+                    break
+                if message[0] == 'stage':
+                    _, stage, data = message
+                    result.update(data)
+                    if stage != 'page_count':
+                        result['stage'] = stage
+                elif message[0] == 'failed':
+                    result.update(reason=message[1], error=message[2])
+                    finished = True
+                else:
+                    result['ok'] = True
+                    finished = True
+        finally:
+            receiver.close()
+            process.join(0.5)
+            if process.is_alive():
+                process.terminate()
+                process.join(1)
+                if process.is_alive():
+                    process.kill()
+                    process.join()
+
+        result['skill_count'] = len(result['skills'])
+        if result['ok'] and not result['cleaned_text']:
+            result.update(ok=False, reason=NO_TEXT, error='No text could be extracted')
+        if result['ok']:
+            self._store(digest, result)
+        result['elapsed'] = round(time.perf_counter() - start, 6)
+        return result
@@ -6,51 +6,153 @@ Extracts text and skills from PDF resumes
 import PyPDF2
 import pdfplumber
 import re
-import spacy
-from typing import List, Dict
+import sys
+import threading
+import time
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, List, Dict
+
+# Add parent directory to import skill_taxonomy
+sys.path.append(str(Path(__file__).parent.parent))
+from skill_taxonomy.taxonomy import SkillTaxonomy
+from skill_taxonomy.extractor import SkillExtractor
+from resume_parser.cache import LRUCache, file_digest
+
+
+def _timed(timings: Dict, stage: str, fn, *args):
+    """Call fn(*args), recording its duration in timings[stage] when timings is given"""
+    start = time.perf_counter()
+    result = fn(*args)
+    if timings is not None:
+        timings[stage] = round(time.perf_counter() - start, 6)
+    return result
 
 
 class ResumeParser:
     """Parse PDF resumes and extract skills"""
     
-    def __init__(self):
-        """Initialize with spaCy model"""
-        try:
-            self.nlp = spacy.load('en_core_web_sm')
-        except OSError:
-            print("Please download spaCy model: python -m spacy download en_core_web_sm")
-            self.nlp = None
+    # Only doc.ents is used, so everything except NER is left out of the pipeline
+    NER_EXCLUDED_COMPONENTS = ['tagger', 'parser', 'attribute_ruler', 'lemmatizer', 'senter', 'morphologizer']
     
-    def extract_text_pypdf2(self, pdf_path: str) -> str:
-        """Extract text using PyPDF2"""
-        text = ""
+    def __init__(self, taxonomy: SkillTaxonomy = None, spacy_model: str = 'en_core_web_sm',
+                 batch_size: int = 32, n_process: int = 1, cache=None,
+                 max_pages: int = 10, max_chars: int = 50000, min_text_chars: int = 200):
+        """
+        Initialize the parser; the spaCy model is loaded on first NER use (or by load_nlp())
+        batch_size / n_process: passed to nlp.pipe for batched NER
+        cache: get(key)/set(key, value) store for parsed stages, keyed on the PDF's SHA-256
+               (defaults to an in-process LRUCache; pass False to disable)
+        max_pages / max_chars: stop reading a PDF after this many pages / characters
+        min_text_chars: pdfplumber text shorter than this also tries PyPDF2
+        """
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.min_text_chars = min_text_chars
+        if cache is None:
+            cache = LRUCache()
+        self.cache = cache if cache is not False else None
+        # Skill dictionary: every alias is searched, results are canonical names
+        self.taxonomy = taxonomy or SkillTaxonomy.default()
+        self.extractor = SkillExtractor(self.taxonomy)
+        self.spacy_model = spacy_model
+        self.batch_size = batch_size
+        self.n_process = n_process
+        self._nlp = None
+        self._nlp_loaded = False
+        self._nlp_lock = threading.Lock()
+    
+    def __getstate__(self):
+        # For spawned worker processes: locks, the loaded spaCy model and the cache
+        # client don't pickle, so the copy reloads the model lazily and doesn't cache
+        state = self.__dict__.copy()
+        del state['_nlp_lock']
+        state.update(_nlp=None, _nlp_loaded=False, cache=None)
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._nlp_lock = threading.Lock()
+    
+    @property
+    def nlp(self):
+        """spaCy pipeline with only the components NER needs, or None if the model is missing"""
+        if not self._nlp_loaded:
+            self.load_nlp()
+        return self._nlp
+    
+    def load_nlp(self):
+        """Load the spaCy model now (importing spaCy alone takes about a second)"""
+        with self._nlp_lock:
+            if self._nlp_loaded:
+                return self._nlp
+            try:
+                import spacy
+                nlp = spacy.load(self.spacy_model, exclude=self.NER_EXCLUDED_COMPONENTS)
+                # The shared tok2vec is only needed if NER listens to it (it doesn't in en_core_web_sm)
+                if 'tok2vec' in nlp.pipe_names and 'ner' not in nlp.get_pipe('tok2vec').listening_components:
+                    nlp.disable_pipe('tok2vec')
+                self._nlp = nlp
+            except (ImportError, OSError):
+                print(f"Please download spaCy model: python -m spacy download {self.spacy_model}")
+                self._nlp = None
+            self._nlp_loaded = True
+        return self._nlp
+    
+    def iter_pages_pypdf2(self, pdf_path: str) -> Iterator[str]:
+        """Yield page texts using PyPDF2, up to max_pages"""
         try:
             with open(pdf_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text()
+                for page in islice(pdf_reader.pages, self.max_pages):
+                    yield page.extract_text() or ''
         except Exception as e:
             print(f"Error extracting text with PyPDF2: {e}")
-        return text
     
-    def extract_text_pdfplumber(self, pdf_path: str) -> str:
-        """Extract text using pdfplumber (more accurate)"""
-        text = ""
+    def iter_pages_pdfplumber(self, pdf_path: str) -> Iterator[str]:
+        """Yield page texts using pdfplumber (more accurate), up to max_pages"""
         try:
             with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text
+                for page in islice(pdf.pages, self.max_pages):
+                    yield page.extract_text() or ''
+                    # Drop the page's parsed layout objects once its text is out
+                    page.close()
         except Exception as e:
             print(f"Error extracting text with pdfplumber: {e}")
-        return text
+    
+    def join_pages(self, pages: Iterable[str]) -> str:
+        """Join page texts once, stopping (and closing the reader) once max_chars is reached"""
+        parts = []
+        length = 0
+        for page_text in pages:
+            if not page_text:
+                continue
+            parts.append(page_text)
+            length += len(page_text) + 1
+            if length >= self.max_chars:
+                break
+        if hasattr(pages, 'close'):
+            pages.close()
+        return '\n'.join(parts)[:self.max_chars]
+    
+    def extract_text_pypdf2(self, pdf_path: str) -> str:
+        """Extract text using PyPDF2"""
+        return self.join_pages(self.iter_pages_pypdf2(pdf_path))
+    
+    def extract_text_pdfplumber(self, pdf_path: str) -> str:
+        """Extract text using pdfplumber (more accurate)"""
+        return self.join_pages(self.iter_pages_pdfplumber(pdf_path))
     
     def extract_text(self, pdf_path: str) -> str:
-        """Extract text from PDF (tries both methods)"""
+        """
+        Extract text from PDF (tries both methods)
+        PyPDF2 only runs when pdfplumber's text is shorter than min_text_chars; the longer text wins
+        """
         text = self.extract_text_pdfplumber(pdf_path)
-        if not text:
-            text = self.extract_text_pypdf2(pdf_path)
+        if len(text.strip()) < self.min_text_chars:
+            fallback = self.extract_text_pypdf2(pdf_path)
+            if len(fallback.strip()) > len(text.strip()):
+                text = fallback
         return text
     
     def clean_text(self, text: str) -> str:
@@ -62,66 +164,149 @@ class ResumeParser:
         return text.strip()
     
     def extract_skills_regex(self, text: str) -> List[str]:
-        """Extract skills using regex patterns"""
-        # Common technical skills
-        skills_keywords = [
-            'python', 'java', 'javascript', 'c\\+\\+', 'c#', 'react', 'angular', 'vue',
-            'node', 'django', 'flask', 'spring', 'sql', 'nosql', 'mongodb', 'postgresql',
-            'mysql', 'html', 'css', 'typescript', 'php', 'ruby', 'go', 'rust', 'kotlin',
-            'swift', 'machine learning', 'deep learning', 'ai', 'data science', 'nlp',
-            'computer vision', 'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy',
-            'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'devops', 'ci/cd', 'git',
-            'restful api', 'graphql', 'microservices', 'agile', 'scrum', 'rest api'
-        ]
-        
-        text_lower = text.lower()
-        found_skills = []
-        
-        for skill in skills_keywords:
-            pattern = r'\b' + skill + r'\b'
-            if re.search(pattern, text_lower):
-                # Normalize skill name
-                skill_name = skill.replace('\\', '')
-                if skill_name not in found_skills:
-                    found_skills.append(skill_name)
-        
-        return found_skills
+        """Extract skills with the compiled dictionary pattern (one pass over the text)"""
+        return self.extractor.extract_skills(text)
     
     def extract_skills_nlp(self, text: str) -> List[str]:
         """Extract skills using NLP (Named Entity Recognition)"""
+        return self.extract_skills_nlp_batch([text])[0]
+    
+    def extract_skills_nlp_batch(self, texts: Iterable[str], batch_size: int = None, n_process: int = None) -> List[List[str]]:
+        """
+        Extract skills from many texts with nlp.pipe
+        Returns one skill list per text, in input order
+        """
+        texts = list(texts)
         if not self.nlp:
-            return []
+            return [[] for _ in texts]
         
-        doc = self.nlp(text)
-        skills = []
+        results = []
+        docs = self.nlp.pipe(
+            texts,
+            batch_size=batch_size or self.batch_size,
+            n_process=n_process or self.n_process
+        )
+        for doc in docs:
+            # Extract organizations and products (often represent technologies)
+            skills = [ent.text for ent in doc.ents if ent.label_ in ['ORG', 'PRODUCT']]
+            results.append(self.taxonomy.canonicalize_all(skills))
         
-        # Extract organizations and products (often represent technologies)
-        for ent in doc.ents:
-            if ent.label_ in ['ORG', 'PRODUCT']:
-                skills.append(ent.text.lower())
+        return results
+    
+    def content_hash(self, pdf_path: str) -> str:
+        """SHA-256 of the PDF bytes, or None if the file can't be read"""
+        try:
+            return file_digest(pdf_path)
+        except OSError as e:
+            print(f"Error hashing resume: {e}")
+            return None
+    
+    def _cache_keys(self, digest: str) -> Dict:
+        """
+        Text depends only on the file and extraction limits; skills also depend on the skill dictionary
+        and NER model, so changing either reuses the cached text
+        """
+        text_key = f'{digest}:{self.max_pages}:{self.max_chars}:{self.min_text_chars}'
+        return {
+            'text': f'resume:text:{text_key}',
+            'skills': f'resume:skills:{text_key}:{self.taxonomy.version}:{self.spacy_model}'
+        }
+    
+    def parse_text(self, pdf_path: str, timings: Dict = None) -> Dict:
+        """Text stage: raw and cleaned text, recording seconds per step in timings"""
+        text = _timed(timings, 'extract_text', self.extract_text, pdf_path)
+        cleaned_text = _timed(timings, 'clean_text', self.clean_text, text)
+        return {'raw_text': text, 'cleaned_text': cleaned_text}
+    
+    def parse_skills(self, cleaned_text: str, timings: Dict = None) -> Dict:
+        """Skills stage: dictionary and NER skills (canonical names) and mention counts"""
+        # Extract skills using both methods
+        mentions = _timed(timings, 'regex_skills', self.extractor.extract, cleaned_text)
+        nlp_skills = _timed(timings, 'nlp_skills', self.extract_skills_nlp, cleaned_text)
         
-        return list(set(skills))
+        # Combine and deduplicate canonical names
+        return {
+            'skills': self.taxonomy.canonicalize_all(mentions['skills'] + nlp_skills),
+            'skill_mentions': mentions['counts']
+        }
     
     def extract_skills(self, pdf_path: str) -> Dict:
-        """Extract all skills from resume"""
-        # Extract and clean text
-        text = self.extract_text(pdf_path)
-        cleaned_text = self.clean_text(text)
+        """
+        Extract all skills from resume, with the seconds spent in each stage under 'timings'
+        Stages already cached for identical file contents are skipped ('cache_hits')
+        """
+        timings = {}
+        cache_hits = {'text': False, 'skills': False}
         
-        # Extract skills using both methods
-        regex_skills = self.extract_skills_regex(cleaned_text)
-        nlp_skills = self.extract_skills_nlp(cleaned_text)
+        digest = _timed(timings, 'hash', self.content_hash, pdf_path) if self.cache is not None else None
+        keys = self._cache_keys(digest) if digest else None
         
-        # Combine and deduplicate
-        all_skills = list(set(regex_skills + nlp_skills))
+        # Extract and clean text
+        texts = self.cache.get(keys['text']) if keys else None
+        if texts is not None:
+            cache_hits['text'] = True
+        else:
+            texts = self.parse_text(pdf_path, timings)
+            if keys:
+                self.cache.set(keys['text'], texts)
+        
+        found = self.cache.get(keys['skills']) if keys else None
+        if found is not None:
+            cache_hits['skills'] = True
+        else:
+            found = self.parse_skills(texts['cleaned_text'], timings)
+            if keys:
+                self.cache.set(keys['skills'], found)
         
         return {
-            'raw_text': text,
-            'cleaned_text': cleaned_text,
-            'skills': all_skills,
-            'skill_count': len(all_skills)
+            'raw_text': texts['raw_text'],
+            'cleaned_text': texts['cleaned_text'],
+            'skills': list(found['skills']),
+            'skill_count': len(found['skills']),
+            'skill_mentions': dict(found['skill_mentions']),
+            'content_hash': digest,
+            'cache_hits': cache_hits,
+            'timings': timings
         }
     
+    def extract_skills_batch(self, pdf_paths: Iterable[str]) -> List[Dict]:
+        """
+        Extract skills from many resumes, running NER over all of them in one nlp.pipe call
+        Cached stages are reused exactly as in extract_skills
+        """
+        results = []
+        pending = []
+        for pdf_path in pdf_paths:
+            digest = self.content_hash(pdf_path) if self.cache is not None else None
+            keys = self._cache_keys(digest) if digest else None
+            
+            texts = self.cache.get(keys['text']) if keys else None
+            if texts is None:
+                text = self.extract_text(pdf_path)
+                texts = {'raw_text': text, 'cleaned_text': self.clean_text(text)}
+                if keys:
+                    self.cache.set(keys['text'], texts)
+            result = {**texts, 'content_hash': digest}
+            results.append(result)
+            
+            found = self.cache.get(keys['skills']) if keys else None
+            if found is not None:
+                result.update({'skills': list(found['skills']), 'skill_mentions': dict(found['skill_mentions'])})
+            else:
+                mentions = self.extractor.extract(texts['cleaned_text'])
+                result.update({'skills': mentions['skills'], 'skill_mentions': mentions['counts']})
+                pending.append((result, keys))
+        
+        nlp_skills = self.extract_skills_nlp_batch([result['cleaned_text'] for result, _ in pending])
+        for (result, keys), skills in zip(pending, nlp_skills):
+            result['skills'] = self.taxonomy.canonicalize_all(result['skills'] + skills)
+            if keys:
+                self.cache.set(keys['skills'], {'skills': result['skills'], 'skill_mentions': result['skill_mentions']})
+        
+        for result in results:
+            result['skill_count'] = len(result['skills'])
+        return results
+    
     def extract_email(self, text: str) -> str:
         """Extract email from text"""
         email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
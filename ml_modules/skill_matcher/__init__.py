@@ -1,5 +1,5 @@
 """Skill Matcher Module"""
 
-from .matcher import SkillMatcher
+from .matcher import SkillMatcher, BatchMatch
 
-__all__ = ['SkillMatcher']
+__all__ = ['SkillMatcher', 'BatchMatch']
@@ -3,26 +3,74 @@ Skill Matcher Module
 Uses TF-IDF and Cosine Similarity to match skills
 """
 
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.base import clone
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
+import joblib
 import numpy as np
-from typing import List, Dict
+import sys
+from pathlib import Path
+from typing import Iterable, List, Dict
+
+# Add parent directory to import skill_taxonomy
+sys.path.append(str(Path(__file__).parent.parent))
+from skill_taxonomy.taxonomy import SkillTaxonomy
+from skill_matcher.overlap import OVERLAP_ENGINES
 
 
 class SkillMatcher:
     """Match student skills with job requirements"""
     
-    def __init__(self):
-        """Initialize TF-IDF vectorizer"""
+    def __init__(self, taxonomy: SkillTaxonomy = None, overlap_engine: str = 'sparse'):
+        """
+        Initialize TF-IDF vectorizer
+        overlap_engine: 'sparse' (CSR incidence matrix, memory grows with skills held) or
+                        'bitset' (packed uint64 AND + popcount, memory grows with taxonomy size)
+        """
+        if overlap_engine not in OVERLAP_ENGINES:
+            raise ValueError(f"Unknown overlap engine: {overlap_engine}")
+        # Canonical skill names and ids ("ReactJS", "react.js" -> "react")
+        self.taxonomy = taxonomy or SkillTaxonomy.default()
+        self.overlap_engine = overlap_engine
         self.vectorizer = TfidfVectorizer(
             lowercase=True,
             stop_words='english',
             ngram_range=(1, 2)  # Consider unigrams and bigrams
         )
+        # Set once the vocabulary/IDF model has been fitted on the whole skill corpus
+        self.is_fitted = False
     
     def skills_to_text(self, skills: List[str]) -> str:
-        """Convert skills list to text"""
-        return ' '.join(skills)
+        """Convert skills list to text (canonical names, so aliases share TF-IDF terms)"""
+        return ' '.join(self.taxonomy.canonicalize_all(skills))
+    
+    def fit(self, skill_lists: Iterable[List[str]]) -> 'SkillMatcher':
+        """
+        Fit a single vocabulary/IDF model over the whole skill corpus
+        skill_lists: every Job.skills_required and Student.skills list
+        Once fitted, match scores only call transform and are comparable across pairs
+        """
+        documents = [self.skills_to_text(skills) for skills in skill_lists if skills]
+        if not documents:
+            raise ValueError("Cannot fit skill vocabulary on an empty corpus")
+        
+        self.vectorizer.fit(documents)
+        self.is_fitted = True
+        return self
+    
+    def save(self, path: str) -> None:
+        """Persist the fitted vocabulary/IDF model"""
+        if not self.is_fitted:
+            raise ValueError("SkillMatcher must be fitted before it can be saved")
+        joblib.dump(self.vectorizer, path)
+    
+    @classmethod
+    def load(cls, path: str, taxonomy: SkillTaxonomy = None, overlap_engine: str = 'sparse') -> 'SkillMatcher':
+        """Load a matcher with a previously fitted vocabulary/IDF model"""
+        matcher = cls(taxonomy, overlap_engine)
+        matcher.vectorizer = joblib.load(path)
+        matcher.is_fitted = True
+        return matcher
     
     def calculate_match(self, student_skills: List[str], job_skills: List[str]) -> float:
         """
@@ -37,8 +85,12 @@ class SkillMatcher:
         job_text = self.skills_to_text(job_skills)
         
         try:
-            # Create TF-IDF vectors
-            tfidf_matrix = self.vectorizer.fit_transform([student_text, job_text])
+            # Create TF-IDF vectors (refit on the pair unless a corpus model is loaded)
+            if self.is_fitted:
+                tfidf_matrix = self.vectorizer.transform([student_text, job_text])
+            else:
+                # Fit a copy so a shared matcher is safe to use from several threads
+                tfidf_matrix = clone(self.vectorizer).fit_transform([student_text, job_text])
             
             # Calculate cosine similarity
             similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
@@ -56,22 +108,23 @@ class SkillMatcher:
         Calculate detailed match information
         Returns dict with match score, matched skills, and missing skills
         """
-        # Normalize skills (lowercase for comparison)
-        student_skills_lower = [s.lower() for s in student_skills]
-        job_skills_lower = [s.lower() for s in job_skills]
+        # Canonicalize skills and compare their integer ids
+        id_space = self.taxonomy.id_space()
+        student_ids = set(id_space.skill_ids(student_skills).tolist())
+        job_ids = set(id_space.skill_ids(job_skills).tolist())
         
         # Find matched and missing skills
-        matched_skills = list(set(student_skills_lower) & set(job_skills_lower))
-        missing_skills = list(set(job_skills_lower) - set(student_skills_lower))
-        extra_skills = list(set(student_skills_lower) - set(job_skills_lower))
+        matched_skills = id_space.names(sorted(student_ids & job_ids))
+        missing_skills = id_space.names(sorted(job_ids - student_ids))
+        extra_skills = id_space.names(sorted(student_ids - job_ids))
         
         # Calculate match score
         match_score = self.calculate_match(student_skills, job_skills)
         
         # Calculate match percentage based on exact matches
         exact_match_percentage = 0
-        if job_skills_lower:
-            exact_match_percentage = round((len(matched_skills) / len(job_skills_lower)) * 100, 2)
+        if job_ids:
+            exact_match_percentage = round((len(matched_skills) / len(job_ids)) * 100, 2)
         
         return {
             'match_score': match_score,  # TF-IDF based score
@@ -85,33 +138,93 @@ class SkillMatcher:
             'missing_count': len(missing_skills)
         }
     
+    def batch_match(self, query_skills: List[str], skill_lists: List[List[str]], query_is_job: bool = True) -> 'BatchMatch':
+        """
+        Score one skill list against many in a single pass
+        query_skills: job skills (query_is_job=True) or student skills (query_is_job=False)
+        skill_lists: the other side of every pair
+        Returns a BatchMatch with score arrays aligned with skill_lists
+        """
+        n = len(skill_lists)
+        
+        match_scores = np.zeros(n)
+        if query_skills and n:
+            texts = [self.skills_to_text(skills) for skills in skill_lists]
+            query_text = self.skills_to_text(query_skills)
+            try:
+                if self.is_fitted:
+                    # TF-IDF: one sparse matrix for the pool, one sparse matrix-vector product for the scores
+                    tfidf_matrix = self.vectorizer.transform(texts)
+                    query_vector = self.vectorizer.transform([query_text])
+                    # Rows are L2-normalised, so the dot product is the cosine similarity
+                    similarity = (tfidf_matrix @ query_vector.T).toarray().ravel()
+                    match_scores = np.round(similarity * 100, 2)
+                else:
+                    match_scores = self._pairwise_scores(query_text, texts)
+            except ValueError as e:
+                print(f"Error calculating match: {e}")
+            match_scores[[i for i, skills in enumerate(skill_lists) if not skills]] = 0.0
+        
+        # Exact overlap on skill ids, for the whole pool at once (unknown skills get ids local to this call)
+        id_space = self.taxonomy.id_space()
+        query_ids = id_space.skill_ids(query_skills)
+        id_lists = [id_space.skill_ids(skills) for skills in skill_lists]
+        overlap = OVERLAP_ENGINES[self.overlap_engine](query_ids, id_lists, len(id_space), query_is_job)
+        
+        job_sizes = overlap.job_sizes
+        with np.errstate(divide='ignore', invalid='ignore'):
+            exact_match = np.where(job_sizes > 0, np.round(overlap.matched_count / job_sizes * 100, 2), 0.0)
+        
+        return BatchMatch(match_scores, exact_match, overlap, id_space)
+    
+    def _pairwise_scores(self, query_text: str, texts: List[str]) -> np.ndarray:
+        """
+        The scores calculate_match gives each (query, text) pair without a corpus vocabulary, in one pass
+        TF-IDF fitted on just two documents gives idf 1 to the terms they share and 1 + ln(3/2)
+        to the others, so each pair's weights follow from term counts: terms are counted once
+        for the whole batch and every pair is scored with sparse products instead of a refit
+        """
+        counter = CountVectorizer(analyzer=self.vectorizer.build_analyzer())
+        try:
+            counts = counter.fit_transform(texts + [query_text]).tocsr().astype(float)
+        except ValueError:
+            # No terms anywhere (calculate_match returns 0 for every pair)
+            return np.zeros(len(texts))
+        pool = counts[:-1]
+        query = counts[-1].toarray().ravel()
+        squared = pool.multiply(pool).tocsr()
+        
+        # Shared terms have weight 1, so the dot product is the same as on raw counts
+        dot = pool @ query
+        # Squared norms: every term at the unshared weight, less the difference on shared terms
+        unshared = (1 + np.log(1.5)) ** 2
+        query_norms = unshared * (query @ query) - (unshared - 1) * ((pool > 0).astype(float) @ query ** 2)
+        pool_norms = (unshared * np.asarray(squared.sum(axis=1)).ravel()
+                      - (unshared - 1) * (squared @ (query > 0).astype(float)))
+        
+        denominator = np.sqrt(query_norms * pool_norms)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            similarity = np.where(denominator > 0, dot / denominator, 0.0)
+        return np.round(similarity * 100, 2)
+    
     def rank_candidates(self, candidates: List[Dict], job_skills: List[str]) -> List[Dict]:
         """
         Rank candidates based on their match with job requirements
         candidates: List of dicts with 'id', 'name', 'skills'
         Returns sorted list with match scores
         """
-        ranked = []
+        batch = self.batch_match(job_skills, [c.get('skills', []) for c in candidates])
         
-        for candidate in candidates:
-            match_info = self.calculate_match_detailed(
-                candidate.get('skills', []),
-                job_skills
-            )
-            
+        # Sort by match score (descending, stable)
+        ranked = []
+        for i in np.argsort(-batch.match_score, kind='stable'):
+            candidate = candidates[i]
             ranked.append({
                 'id': candidate.get('id'),
                 'name': candidate.get('name'),
-                'match_score': match_info['match_score'],
-                'exact_match_percentage': match_info['exact_match_percentage'],
-                'matched_skills': match_info['matched_skills'],
-                'missing_skills': match_info['missing_skills'],
-                'matched_count': match_info['matched_count']
+                **batch.details(i)
             })
         
-        # Sort by match score (descending)
-        ranked.sort(key=lambda x: x['match_score'], reverse=True)
-        
         return ranked
     
     def rank_jobs(self, jobs: List[Dict], student_skills: List[str]) -> List[Dict]:
@@ -120,31 +233,58 @@ class SkillMatcher:
         jobs: List of dicts with 'id', 'title', 'skills_required'
         Returns sorted list with match scores
         """
-        ranked = []
+        batch = self.batch_match(
+            student_skills,
+            [job.get('skills_required', []) for job in jobs],
+            query_is_job=False
+        )
         
-        for job in jobs:
-            match_info = self.calculate_match_detailed(
-                student_skills,
-                job.get('skills_required', [])
-            )
-            
+        # Sort by match score (descending, stable)
+        ranked = []
+        for i in np.argsort(-batch.match_score, kind='stable'):
+            job = jobs[i]
             ranked.append({
                 'id': job.get('id'),
                 'title': job.get('title'),
                 'company': job.get('company', ''),
-                'match_score': match_info['match_score'],
-                'exact_match_percentage': match_info['exact_match_percentage'],
-                'matched_skills': match_info['matched_skills'],
-                'missing_skills': match_info['missing_skills'],
-                'matched_count': match_info['matched_count']
+                **batch.details(i)
             })
         
-        # Sort by match score (descending)
-        ranked.sort(key=lambda x: x['match_score'], reverse=True)
-        
         return ranked
 
 
+class BatchMatch:
+    """Match results of one skill list against many, stored as aligned arrays"""
+    
+    def __init__(self, match_score, exact_match_percentage, overlap, id_space):
+        self.match_score = match_score
+        self.exact_match_percentage = exact_match_percentage
+        self.matched_count = overlap.matched_count
+        self._overlap = overlap
+        self._id_space = id_space
+    
+    def __len__(self):
+        return len(self.match_score)
+    
+    def matched_skills(self, i: int) -> List[str]:
+        """Skills shared by the query and item i"""
+        return self._id_space.names(self._overlap.matched_ids(i))
+    
+    def details(self, i: int) -> Dict:
+        """Match fields for item i, as returned by rank_candidates / rank_jobs"""
+        return {
+            'match_score': float(self.match_score[i]),
+            'exact_match_percentage': float(self.exact_match_percentage[i]),
+            'matched_skills': self.matched_skills(i),
+            'missing_skills': self.missing_skills(i),
+            'matched_count': int(self.matched_count[i])
+        }
+    
+    def missing_skills(self, i: int) -> List[str]:
+        """Job skills the student lacks for item i"""
+        return self._id_space.names(self._overlap.missing_ids(i))
+
+
 # Example usage
 if __name__ == "__main__":
     matcher = SkillMatcher()
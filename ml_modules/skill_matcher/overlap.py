@@ -0,0 +1,102 @@
+"""
+Skill Overlap Engines
+Exact skill overlap between one skill-id set and many, computed for the whole pool at once
+"""
+
+import numpy as np
+from scipy import sparse
+from typing import List
+
+# Set bits per byte value, used when np.bitwise_count (NumPy >= 2.0) is unavailable
+_BYTE_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def pack_bitsets(id_lists: List[np.ndarray], n_words: int) -> np.ndarray:
+    """Pack skill-id arrays into an (n, n_words) uint64 matrix, bit k set for skill id k"""
+    words = np.zeros((len(id_lists), n_words), dtype=np.uint64)
+    lengths = [len(ids) for ids in id_lists]
+    if sum(lengths):
+        ids = np.concatenate(id_lists).astype(np.uint64)
+        rows = np.repeat(np.arange(len(id_lists)), lengths)
+        bits = np.left_shift(np.uint64(1), ids & np.uint64(63))
+        np.bitwise_or.at(words, (rows, (ids >> np.uint64(6)).astype(np.intp)), bits)
+    return words
+
+
+def popcount(words: np.ndarray) -> np.ndarray:
+    """Number of set bits along the last axis"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+    counts = _BYTE_POPCOUNT[np.ascontiguousarray(words).view(np.uint8)]
+    return counts.sum(axis=-1, dtype=np.int64)
+
+
+def bitset_ids(words: np.ndarray) -> np.ndarray:
+    """Sorted skill ids set in one packed bitset"""
+    bits = np.unpackbits(words.astype('<u8').view(np.uint8), bitorder='little')
+    return np.flatnonzero(bits)
+
+
+class SparseOverlap:
+    """Binary skill-incidence CSR matrix times the query's binary skill vector"""
+
+    def __init__(self, query_ids: np.ndarray, id_lists: List[np.ndarray], width: int, query_is_job: bool):
+        n = len(id_lists)
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum([len(ids) for ids in id_lists], out=indptr[1:])
+        indices = np.concatenate(id_lists) if id_lists else np.zeros(0, dtype=np.int64)
+
+        self._incidence = sparse.csr_matrix(
+            (np.ones(len(indices)), indices, indptr),
+            shape=(n, width)
+        )
+        query_vector = np.zeros(width)
+        query_vector[query_ids] = 1
+        self._matched = self._incidence @ sparse.diags(query_vector)
+        self._matched.eliminate_zeros()
+        self._query_ids = query_ids
+        self._query_is_job = query_is_job
+
+        self.matched_count = np.asarray(self._matched.getnnz(axis=1))
+        # Exact match percentage is relative to the job's distinct canonical skills
+        self.job_sizes = np.full(n, len(query_ids)) if query_is_job else np.diff(indptr)
+
+    def _row(self, matrix, i: int) -> np.ndarray:
+        return np.sort(matrix.indices[matrix.indptr[i]:matrix.indptr[i + 1]])
+
+    def matched_ids(self, i: int) -> np.ndarray:
+        return self._row(self._matched, i)
+
+    def missing_ids(self, i: int) -> np.ndarray:
+        job_ids = self._query_ids if self._query_is_job else self._row(self._incidence, i)
+        return np.setdiff1d(job_ids, self.matched_ids(i), assume_unique=True)
+
+
+class BitsetOverlap:
+    """
+    Every skill list as a fixed-width uint64 bitset; overlap counts for the
+    whole pool are one vectorized AND plus a popcount
+    """
+
+    def __init__(self, query_ids: np.ndarray, id_lists: List[np.ndarray], width: int, query_is_job: bool):
+        n_words = max(1, -(-width // 64))
+        self._rows = pack_bitsets(id_lists, n_words)
+        self._query = pack_bitsets([query_ids], n_words)[0]
+        self._matched = self._rows & self._query
+        self._query_is_job = query_is_job
+
+        self.matched_count = popcount(self._matched)
+        self.job_sizes = np.full(len(id_lists), len(query_ids)) if query_is_job else popcount(self._rows)
+
+    def matched_ids(self, i: int) -> np.ndarray:
+        return bitset_ids(self._matched[i])
+
+    def missing_ids(self, i: int) -> np.ndarray:
+        job = self._query if self._query_is_job else self._rows[i]
+        return bitset_ids(job & ~self._matched[i])
+
+
+OVERLAP_ENGINES = {
+    'sparse': SparseOverlap,
+    'bitset': BitsetOverlap,
+}
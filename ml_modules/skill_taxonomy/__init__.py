@@ -0,0 +1,6 @@
+"""Skill Taxonomy Module"""
+
+from .taxonomy import SkillTaxonomy, SkillIdSpace, DEFAULT_SKILLS, normalize_skill
+from .extractor import SkillExtractor
+
+__all__ = ['SkillTaxonomy', 'SkillIdSpace', 'SkillExtractor', 'DEFAULT_SKILLS', 'normalize_skill']
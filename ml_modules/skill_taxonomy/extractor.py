@@ -0,0 +1,93 @@
+"""
+Skill Extractor
+Finds every dictionary skill in a text with one compiled, trie-shaped regex
+"""
+
+import re
+from typing import Dict, Iterator, List
+from skill_taxonomy.taxonomy import SkillTaxonomy, normalize_skill
+
+# A term must not be glued to a word (or to "." on its left, so "js" is not found in "react.js",
+# or to "+"/"#" on its right, so "c" would not be found in "c++")
+_LEFT_BOUNDARY = r'(?<![\w.])'
+_RIGHT_BOUNDARY = r'(?![\w+#])'
+
+
+def _char_pattern(char: str) -> str:
+    # Any run of whitespace (including line breaks) separates the words of a multi-word skill
+    return r'\s+' if char == ' ' else re.escape(char)
+
+
+def _trie_pattern(node: Dict) -> str:
+    """
+    Regex for a character trie. Shared prefixes are matched once, and a term
+    that is a prefix of a longer one becomes an optional (greedy) tail, so the
+    longest term wins and shorter ones are still tried if the boundary fails
+    """
+    branches = [_char_pattern(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ''
+    alternation = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if '' in node:
+        return '(?:' + alternation + ')?' if len(branches) == 1 else alternation + '?'
+    return alternation
+
+
+def compile_terms(terms) -> re.Pattern:
+    """One case-insensitive pattern matching any of the (normalized) terms"""
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    if not trie:
+        return re.compile(r'(?!x)x')
+    return re.compile(_LEFT_BOUNDARY + '(?:' + _trie_pattern(trie) + ')' + _RIGHT_BOUNDARY, re.IGNORECASE)
+
+
+class SkillExtractor:
+    """
+    Scan text for every taxonomy term (canonical names and aliases) in a single pass
+    Cost grows with the text length, not with the number of skills in the dictionary
+    """
+
+    def __init__(self, taxonomy: SkillTaxonomy = None):
+        self.taxonomy = taxonomy or SkillTaxonomy.default()
+        self._terms = self.taxonomy.terms
+        self.pattern = compile_terms(self._terms)
+
+    def finditer(self, text: str) -> Iterator[Dict]:
+        """Non-overlapping, leftmost-longest skill mentions with their character positions"""
+        for match in self.pattern.finditer(text or ''):
+            term = normalize_skill(match.group())
+            yield {
+                # Case-insensitive matching can accept Unicode case variants that are not dictionary keys
+                'skill': self._terms.get(term) or self.taxonomy.canonicalize(term.casefold()),
+                'term': term,
+                'start': match.start(),
+                'end': match.end()
+            }
+
+    def extract(self, text: str) -> Dict:
+        """
+        Skills found in text, in first-mention order, with mention counts and positions
+        """
+        counts = {}
+        positions = {}
+        for mention in self.finditer(text):
+            skill = mention['skill']
+            counts[skill] = counts.get(skill, 0) + 1
+            positions.setdefault(skill, []).append((mention['start'], mention['end']))
+        return {
+            'skills': list(counts),
+            'counts': counts,
+            'positions': positions
+        }
+
+    def extract_skills(self, text: str) -> List[str]:
+        """Canonical skills mentioned in text, in first-mention order"""
+        seen = {}
+        for mention in self.finditer(text):
+            seen.setdefault(mention['skill'], None)
+        return list(seen)
@@ -0,0 +1,228 @@
+"""
+Skill Taxonomy Module
+Canonical skill dictionary with synonyms/aliases, mapping every skill to a compact integer id
+"""
+
+import hashlib
+import json
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+
+
+# Canonical skill -> aliases that mean the same thing
+DEFAULT_SKILLS = {
+    'python': ['python3', 'python 3'],
+    'java': ['core java'],
+    'javascript': ['js', 'ecmascript', 'es6'],
+    'typescript': [],
+    'c++': ['cpp', 'cplusplus'],
+    'c#': ['csharp', 'c sharp'],
+    'php': [],
+    'ruby': [],
+    'go': ['golang'],
+    'rust': [],
+    'kotlin': [],
+    'swift': [],
+    'scala': [],
+    'html': ['html5'],
+    'css': ['css3'],
+    'react': ['reactjs', 'react.js'],
+    'angular': ['angularjs', 'angular.js'],
+    'vue': ['vuejs', 'vue.js'],
+    'node': ['nodejs', 'node.js'],
+    'express.js': ['expressjs'],
+    'next.js': ['nextjs'],
+    'django': [],
+    'flask': [],
+    'fastapi': [],
+    'spring': ['spring boot', 'springboot'],
+    'sql': [],
+    'nosql': ['no-sql'],
+    'mongodb': ['mongo'],
+    'postgresql': ['postgres'],
+    'mysql': [],
+    'redis': [],
+    'machine learning': ['ml'],
+    'deep learning': [],
+    'ai': ['artificial intelligence'],
+    'data science': [],
+    'nlp': ['natural language processing'],
+    'computer vision': [],
+    'tensorflow': [],
+    'pytorch': ['torch'],
+    'scikit-learn': ['sklearn', 'scikit learn'],
+    'pandas': [],
+    'numpy': [],
+    'docker': [],
+    'kubernetes': ['k8s'],
+    'aws': ['amazon web services'],
+    'azure': ['microsoft azure'],
+    'gcp': ['google cloud', 'google cloud platform'],
+    'devops': [],
+    'ci/cd': ['cicd', 'ci cd'],
+    'git': [],
+    'linux': [],
+    'rest api': ['restful api', 'restful apis', 'rest apis'],
+    'graphql': [],
+    'microservices': ['microservice'],
+    'agile': [],
+    'scrum': [],
+}
+
+_WHITESPACE = re.compile(r'\s+')
+_SEPARATORS = re.compile(r'[\s.\-_]+')
+
+
+def normalize_skill(skill: str) -> str:
+    """Lowercase and collapse whitespace"""
+    return _WHITESPACE.sub(' ', str(skill)).strip().lower()
+
+
+class SkillTaxonomy:
+    """
+    Canonicalize free-text skills and map dictionary skills to stable integer ids
+    (dictionary order). The taxonomy never grows: skills outside the dictionary
+    get ids only within a request-local SkillIdSpace (see id_space())
+    """
+
+    # Raw skill string -> (dictionary id, canonical name) memo; bounded because the keys are free text
+    MAX_CACHED_TERMS = 100000
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, skills: Dict[str, List[str]] = None):
+        """skills: canonical skill -> list of aliases (defaults to DEFAULT_SKILLS)"""
+        skills = DEFAULT_SKILLS if skills is None else skills
+
+        self._ids = {}       # canonical name -> id
+        self._names = []     # id -> canonical name
+        self._aliases = {}   # normalized alias or canonical name -> canonical name
+        self._compact = {}   # alias with separators removed ("react.js" -> "reactjs") -> canonical name
+        self._lookups = {}   # raw skill string -> (id or None, canonical name)
+
+        for canonical, aliases in skills.items():
+            canonical = normalize_skill(canonical)
+            if canonical not in self._ids:
+                self._ids[canonical] = len(self._names)
+                self._names.append(canonical)
+            for term in [canonical] + list(aliases):
+                term = normalize_skill(term)
+                self._aliases.setdefault(term, canonical)
+                self._compact.setdefault(_SEPARATORS.sub('', term), canonical)
+
+        self.dictionary_size = len(self._names)
+        self.version = hashlib.sha256(
+            json.dumps({k: sorted(v) for k, v in skills.items()}, sort_keys=True).encode()
+        ).hexdigest()[:16]
+
+    @classmethod
+    def default(cls) -> 'SkillTaxonomy':
+        """Process-wide taxonomy built from DEFAULT_SKILLS, so ids agree across engines"""
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = cls()
+        return cls._default
+
+    @classmethod
+    def from_json(cls, path: str) -> 'SkillTaxonomy':
+        """Load a {canonical: [aliases]} dictionary from a JSON file"""
+        with open(path) as f:
+            return cls(json.load(f))
+
+    def __len__(self):
+        return self.dictionary_size
+
+    def canonicalize(self, skill: str) -> str:
+        """Canonical name for a skill ("ReactJS", "react.js" -> "react"); unknown skills are just normalized"""
+        normalized = normalize_skill(skill)
+        canonical = self._aliases.get(normalized)
+        if canonical is None:
+            canonical = self._compact.get(_SEPARATORS.sub('', normalized), normalized)
+        return canonical
+
+    def canonicalize_all(self, skills: Iterable[str]) -> List[str]:
+        """Canonical names, de-duplicated, in first-seen order"""
+        seen = {}
+        for skill in skills or []:
+            canonical = self.canonicalize(skill)
+            if canonical:
+                seen.setdefault(canonical, None)
+        return list(seen)
+
+    def lookup(self, skill: str) -> Tuple[Optional[int], str]:
+        """(dictionary id or None for unknown skills, canonical name), memoized per raw string"""
+        found = self._lookups.get(skill)
+        if found is None:
+            canonical = self.canonicalize(skill)
+            found = (self._ids.get(canonical), canonical)
+            if len(self._lookups) < self.MAX_CACHED_TERMS:
+                self._lookups[skill] = found
+        return found
+
+    def skill_id(self, skill: str) -> Optional[int]:
+        """Dictionary id of a skill's canonical form (None for skills outside the dictionary)"""
+        return self.lookup(skill)[0]
+
+    def id_space(self) -> 'SkillIdSpace':
+        """Fresh id space for one batch of skill lists"""
+        return SkillIdSpace(self)
+
+    def name(self, skill_id: int) -> str:
+        """Canonical name for a dictionary id"""
+        return self._names[skill_id]
+
+    def names(self, skill_ids: Iterable[int]) -> List[str]:
+        return [self._names[i] for i in skill_ids]
+
+    @property
+    def terms(self) -> Dict[str, str]:
+        """Every dictionary term (canonical names and aliases) -> canonical name"""
+        return dict(self._aliases)
+
+    @property
+    def known_skills(self) -> List[str]:
+        """Canonical dictionary skills"""
+        return list(self._names)
+
+
+class SkillIdSpace:
+    """
+    Integer ids for one batch of skill lists: dictionary skills keep their
+    taxonomy ids, unknown skills get ids from dictionary_size up in first-seen
+    order. Discarded with the batch, so free-text skills never accumulate
+    """
+
+    def __init__(self, taxonomy: SkillTaxonomy):
+        self.taxonomy = taxonomy
+        self._extra_ids = {}    # unknown canonical name -> id
+        self._extra_names = []  # id - dictionary_size -> unknown canonical name
+
+    def __len__(self):
+        return self.taxonomy.dictionary_size + len(self._extra_names)
+
+    def skill_ids(self, skills: Iterable[str]) -> np.ndarray:
+        """Sorted, unique ids for a skill list"""
+        ids = set()
+        for skill in skills or []:
+            skill_id, canonical = self.taxonomy.lookup(skill)
+            if skill_id is None:
+                if not canonical:
+                    continue
+                skill_id = self._extra_ids.get(canonical)
+                if skill_id is None:
+                    skill_id = len(self)
+                    self._extra_ids[canonical] = skill_id
+                    self._extra_names.append(canonical)
+            ids.add(skill_id)
+        return np.fromiter(sorted(ids), dtype=np.int64, count=len(ids))
+
+    def name(self, skill_id: int) -> str:
+        size = self.taxonomy.dictionary_size
+        return self.taxonomy.name(skill_id) if skill_id < size else self._extra_names[skill_id - size]
+
+    def names(self, skill_ids: Iterable[int]) -> List[str]:
+        return [self.name(i) for i in skill_ids]
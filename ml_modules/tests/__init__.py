@@ -0,0 +1 @@
+"""Unit tests for the ML modules (python -m unittest discover ml_modules/tests)"""
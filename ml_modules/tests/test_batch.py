@@ -0,0 +1,77 @@
+"""
+Test suite for batch resume parsing
+"""
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).parent.parent))
+from resume_parser import batch
+from resume_parser.parser import ResumeParser
+
+FORK = 'fork' in multiprocessing.get_all_start_methods()
+
+
+def crashing_parse(path, parser=None, guard=None):
+    """Kills its worker for 'crash.pdf', like the OS killing an out-of-memory process"""
+    if path.endswith('crash.pdf'):
+        os._exit(1)
+    time.sleep(0.05)
+    return {'path': path, 'ok': True}
+
+
+def hanging_parse_text(self, pdf_path, timings=None):
+    if pdf_path.endswith('hang.pdf'):
+        time.sleep(60)
+    return {'raw_text': 'Python developer', 'cleaned_text': 'Python developer'}
+
+
+@unittest.skipUnless(FORK, 'needs the fork start method to patch worker processes')
+class BatchResumeParserTestCase(unittest.TestCase):
+    """Test that one bad file fails alone"""
+
+    def setUp(self):
+        # Workers would otherwise load the spaCy model, which these tests don't use
+        patcher = mock.patch.object(ResumeParser, 'load_nlp')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def parse(self, paths, **options):
+        parser = batch.BatchResumeParser(max_workers=2, mp_context=multiprocessing.get_context('fork'), **options)
+        return {result['path']: result for result in parser.parse(paths)}
+
+    def test_worker_crash_only_fails_the_crashing_file(self):
+        paths = [f'resume{i}.pdf' for i in range(6)]
+        with mock.patch.object(batch, 'parse_resume', crashing_parse):
+            results = self.parse(paths[:3] + ['crash.pdf'] + paths[3:], max_pool_restarts=1)
+
+        self.assertEqual(len(results), 7)
+        self.assertFalse(results['crash.pdf']['ok'])
+        self.assertIn('Worker crashed', results['crash.pdf']['error'])
+        self.assertTrue(all(results[path]['ok'] for path in paths))
+
+    def test_hanging_file_times_out_under_the_guard(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        hang, ok = (os.path.join(directory.name, name) for name in ('hang.pdf', 'ok.pdf'))
+        for path, content in ((hang, b'%PDF-1.4 hang'), (ok, b'%PDF-1.4 ok')):
+            with open(path, 'wb') as f:
+                f.write(content)
+
+        with mock.patch.object(ResumeParser, 'parse_text', hanging_parse_text):
+            start = time.perf_counter()
+            results = self.parse([hang, ok], timeout=1)
+
+        self.assertLess(time.perf_counter() - start, 30)
+        self.assertEqual(results[hang]['reason'], 'timeout')
+        self.assertFalse(results[hang]['ok'])
+        self.assertTrue(results[ok]['ok'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+Test suite for the benchmark regression check
+"""
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).parent.parent))
+from benchmarks import run
+from benchmarks.harness import compare, save_results
+
+
+def result(name, p50_ms, p99_ms=None, peak_memory_mb=1.0, scale=1000):
+    return {'name': name, 'scale': scale, 'calls': 10, 'items_per_call': 1, 'throughput': 1000 / p50_ms,
+            'p50_ms': p50_ms, 'p99_ms': p99_ms or p50_ms, 'peak_memory_mb': peak_memory_mb}
+
+
+class CompareTestCase(unittest.TestCase):
+    """Latency or memory growth beyond the tolerance is a regression"""
+
+    def test_regressions(self):
+        baseline = [result('rank', 10.0), result('score', 1.0), result('rank', 50.0, scale=10000)]
+        current = [
+            result('rank', 12.0),                       # +20%: within tolerance
+            result('score', 1.0, peak_memory_mb=2.0),   # memory doubled
+            result('rank', 80.0, scale=10000),          # +60% p50 and p99
+            result('new', 5.0),                         # not in the baseline
+        ]
+        regressions = compare(current, baseline, tolerance=0.25)
+        self.assertEqual(
+            [(r['name'], r['scale'], r['metric']) for r in regressions],
+            [('score', 1000, 'peak_memory_mb'), ('rank', 10000, 'p50_ms'), ('rank', 10000, 'p99_ms')]
+        )
+        self.assertEqual(regressions[1]['change'], '+60.0%')
+        self.assertEqual(compare(current, baseline, tolerance=1.5), [])
+
+
+class ExitStatusTestCase(unittest.TestCase):
+    """run.py exits non-zero when a benchmark regresses against the baseline"""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.baseline = os.path.join(directory.name, 'baseline.json')
+        save_results(self.baseline, [result('rank_candidates', 10.0)])
+
+    def main(self, p50_ms):
+        with mock.patch.object(run, 'run_suite', return_value=[result('rank_candidates', p50_ms)]), \
+                mock.patch('builtins.print'):
+            return run.main(['--baseline', self.baseline])
+
+    def test_exit_status(self):
+        self.assertEqual(self.main(11.0), 0)
+        self.assertEqual(self.main(20.0), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+Test suite for the parsed resume cache
+"""
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).parent.parent))
+from benchmarks.generators import generate_resume_text, write_resume_pdf
+from resume_parser.cache import LRUCache, file_digest
+from resume_parser.parser import ResumeParser
+from skill_taxonomy.taxonomy import SkillTaxonomy
+
+
+class LRUCacheTestCase(unittest.TestCase):
+    """Least recently used entries are evicted first"""
+
+    def test_eviction_order(self):
+        cache = LRUCache(max_entries=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)  # 'a' is now the most recently used
+        cache.set('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual((cache.get('a'), cache.get('c'), len(cache)), (1, 3, 2))
+
+        cache.set('a', 10)  # Overwriting also counts as a use
+        cache.set('d', 4)
+        self.assertIsNone(cache.get('c'))
+        self.assertEqual(cache.get('a'), 10)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+class FileDigestTestCase(unittest.TestCase):
+    """The digest depends on the bytes only"""
+
+    def test_digest(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            data = os.urandom(5000)
+            first, second = os.path.join(tmp, 'a.pdf'), os.path.join(tmp, 'renamed.pdf')
+            for path in (first, second):
+                with open(path, 'wb') as f:
+                    f.write(data)
+            expected = hashlib.sha256(data).hexdigest()
+            self.assertEqual(file_digest(first), expected)
+            self.assertEqual(file_digest(second, chunk_size=1000), expected)
+
+
+class ParserCacheTestCase(unittest.TestCase):
+    """extract_skills caches its text and skills stages by content"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = write_resume_pdf(os.path.join(cls.directory.name, 'resume.pdf'), generate_resume_text(4))
+        cls.copy = os.path.join(cls.directory.name, 'same_resume_other_name.pdf')
+        shutil.copy(cls.path, cls.copy)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def parser(self, cache, **options):
+        parser = ResumeParser(cache=cache, **options)
+        parser._nlp_loaded = True  # NER off, so no spaCy model is loaded
+        return parser
+
+    def test_identical_file_with_another_name_hits(self):
+        parser = self.parser(LRUCache())
+        first = parser.extract_skills(self.path)
+        self.assertEqual(first['cache_hits'], {'text': False, 'skills': False})
+
+        with mock.patch.object(parser, 'parse_text') as parse_text, \
+                mock.patch.object(parser, 'parse_skills') as parse_skills:
+            second = parser.extract_skills(self.copy)
+        parse_text.assert_not_called()
+        parse_skills.assert_not_called()
+        self.assertEqual(second['cache_hits'], {'text': True, 'skills': True})
+        self.assertEqual(second['skills'], first['skills'])
+        self.assertEqual(second['content_hash'], first['content_hash'])
+
+    def test_stages_are_reused_independently(self):
+        cache = LRUCache()
+        self.parser(cache).extract_skills(self.path)
+
+        # Another skill dictionary reuses the text but extracts skills again
+        taxonomy = SkillTaxonomy({'python': ['python3'], 'sql': []})
+        result = self.parser(cache, taxonomy=taxonomy).extract_skills(self.path)
+        self.assertEqual(result['cache_hits'], {'text': True, 'skills': False})
+        self.assertTrue(set(result['skills']) <= {'python', 'sql'})
+
+        # Other extraction limits read the text again, and so can't reuse skills found in the old text
+        result = self.parser(cache, max_pages=1, max_chars=100).extract_skills(self.path)
+        self.assertEqual(result['cache_hits'], {'text': False, 'skills': False})
+
+    def test_cache_keys(self):
+        digest = 'abc'
+        keys = self.parser(None)._cache_keys(digest)
+        other_limits = self.parser(None, max_chars=10)._cache_keys(digest)
+        other_model = ResumeParser(spacy_model='en_core_web_lg')._cache_keys(digest)
+
+        self.assertNotEqual(keys['text'], other_limits['text'])
+        self.assertNotEqual(keys['skills'], other_limits['skills'])
+        self.assertEqual(keys['text'], other_model['text'])
+        self.assertNotEqual(keys['skills'], other_model['skills'])
+        self.assertNotEqual(keys['text'], self.parser(None)._cache_keys('abd')['text'])
+
+
+if __name__ == '__main__':
+    unittest.main()
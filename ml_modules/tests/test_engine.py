@@ -0,0 +1,64 @@
+"""
+Test suite for the recommendation engine
+"""
+import random
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from recommender.engine import RecommendationEngine
+from skill_matcher.matcher import SkillMatcher
+
+SKILLS = ['python', 'django', 'sql', 'react', 'aws', 'docker', 'java', 'airflow']
+
+
+class TopKTestCase(unittest.TestCase):
+    """top_n selection returns exactly the head of a full stable sort"""
+
+    def setUp(self):
+        self.rng = random.Random(3)
+        self.engine = RecommendationEngine(SkillMatcher().fit([SKILLS[:4], SKILLS[3:], SKILLS[::2]]))
+
+    def skills(self):
+        # Few skills and small lists, so many items tie on both scores
+        return self.rng.sample(SKILLS, self.rng.randint(0, 3))
+
+    def full_sort(self, rec_scores, match_scores):
+        """Recommendation score (2 decimals), then match score, both descending, then input order"""
+        return sorted(range(len(rec_scores)),
+                      key=lambda i: (-round(float(rec_scores[i]), 2), -match_scores[i], i))
+
+    def test_recommend_jobs_matches_full_sort(self):
+        for _ in range(30):
+            jobs = [{'id': i, 'title': f'Job {i}', 'skills_required': self.skills()}
+                    for i in range(self.rng.randint(0, 60))]
+            student_skills = self.skills()
+            batch = self.engine.matcher.batch_match(
+                student_skills, [job['skills_required'] for job in jobs], query_is_job=False
+            )
+            expected = self.full_sort(self.engine._calculate_job_recommendation_scores(batch), batch.match_score)
+            for top_n in (0, 1, 3, 10, len(jobs), len(jobs) + 5):
+                recommended = self.engine.recommend_jobs({'skills': student_skills}, jobs, top_n=top_n)
+                self.assertEqual([job['id'] for job in recommended], expected[:top_n])
+
+    def test_recommend_candidates_matches_full_sort(self):
+        for _ in range(30):
+            candidates = [{'id': i, 'name': f'Student {i}', 'skills': self.skills()}
+                          for i in range(self.rng.randint(0, 60))]
+            job_skills = self.skills()
+            batch = self.engine.matcher.batch_match(job_skills, [c['skills'] for c in candidates])
+            expected = self.full_sort(
+                self.engine._calculate_candidate_recommendation_scores(batch), batch.match_score
+            )
+            for top_n in (0, 1, 5, 20, len(candidates)):
+                recommended = self.engine.recommend_candidates(
+                    {'skills_required': job_skills}, candidates, top_n=top_n
+                )
+                self.assertEqual([c['id'] for c in recommended], expected[:top_n])
+                scores = [c['recommendation_score'] for c in recommended]
+                self.assertEqual(scores, sorted(scores, reverse=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Test suite for guarded resume parsing
+"""
+import multiprocessing
+import sys
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).parent.parent))
+from resume_parser import guard
+from resume_parser.guard import GuardedResumeParser
+from resume_parser.parser import ResumeParser
+
+FORK = 'fork' in multiprocessing.get_all_start_methods()
+TEXT = 'Python developer with Django and SQL'
+
+
+class StubParser(ResumeParser):
+    """ResumeParser whose text stage is replaced; NER is off so no spaCy model is loaded"""
+
+    def __init__(self, parse_text=None):
+        super().__init__(cache=False)
+        self._nlp_loaded = True
+        self._parse_text = parse_text
+
+    def parse_text(self, pdf_path, timings=None):
+        if self._parse_text:
+            self._parse_text()
+        return {'raw_text': TEXT, 'cleaned_text': TEXT}
+
+
+def allocate():
+    # Far beyond the child's memory limit
+    return bytearray(2 * 2 ** 30)
+
+
+def hang():
+    time.sleep(60)
+
+
+@unittest.skipUnless(FORK, 'needs the fork start method to patch the child process')
+class GuardedResumeParserTestCase(unittest.TestCase):
+    """Each guard limit fails the parse with its own reason instead of taking the caller down"""
+
+    def guarded(self, parse_text=None, **options):
+        options = {'timeout': 10, 'memory_limit_mb': 256, 'max_page_count': 50, **options}
+        return GuardedResumeParser(StubParser(parse_text), mp_context=multiprocessing.get_context('fork'), **options)
+
+    def setUp(self):
+        # The stub never opens the file, so report a page count without reading one
+        patcher = mock.patch.object(guard, 'count_pages', return_value=2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_successful_parse(self):
+        result = self.guarded().extract_skills('resume.pdf')
+        self.assertTrue(result['ok'])
+        self.assertIsNone(result['reason'])
+        self.assertEqual(result['stage'], 'skills')
+        self.assertEqual(result['page_count'], 2)
+        self.assertEqual(result['skills'], ['python', 'django', 'sql'])
+
+    @unittest.skipUnless(guard.resource, 'needs RLIMIT_AS')
+    def test_memory_limit(self):
+        result = self.guarded(allocate).extract_skills('resume.pdf')
+        self.assertFalse(result['ok'])
+        self.assertEqual(result['reason'], guard.MEMORY_LIMIT)
+        self.assertIsNone(result['stage'])
+
+    def test_too_many_pages(self):
+        with mock.patch.object(guard, 'count_pages', return_value=500):
+            result = self.guarded().extract_skills('resume.pdf')
+        self.assertFalse(result['ok'])
+        self.assertEqual(result['reason'], guard.TOO_MANY_PAGES)
+        self.assertEqual(result['page_count'], 500)
+        self.assertIn('limit 50', result['error'])
+        # Rejected before any text was extracted
+        self.assertIsNone(result['stage'])
+
+    def test_timeout(self):
+        start = time.perf_counter()
+        result = self.guarded(hang, timeout=0.5).extract_skills('resume.pdf')
+        self.assertLess(time.perf_counter() - start, 5)
+        self.assertFalse(result['ok'])
+        self.assertEqual(result['reason'], guard.TIMEOUT)
+        self.assertEqual(result['page_count'], 2)
+
+    def test_no_text(self):
+        guarded = self.guarded()
+        with mock.patch.object(StubParser, 'parse_text', return_value={'raw_text': '', 'cleaned_text': ''}):
+            result = guarded.extract_skills('resume.pdf')
+        self.assertFalse(result['ok'])
+        self.assertEqual(result['reason'], guard.NO_TEXT)
+
+
+if __name__ == '__main__':
+    unittest.main()
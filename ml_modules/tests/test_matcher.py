@@ -0,0 +1,48 @@
+"""
+Test suite for the skill matcher
+"""
+import random
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).parent.parent))
+from skill_matcher.matcher import SkillMatcher
+
+# 'machine learning' and 'deep learning' share a term, so some counts are above 1
+SKILLS = ['python', 'django', 'sql', 'react', 'aws', 'docker', 'machine learning', 'deep learning', 'airflow']
+
+
+class BatchMatchTestCase(unittest.TestCase):
+    """batch_match gives every pair the score calculate_match gives it"""
+
+    def check_pairs(self, matcher):
+        rng = random.Random(5)
+        for _ in range(20):
+            pool = [rng.sample(SKILLS, rng.randint(0, 4)) for _ in range(10)]
+            query = rng.sample(SKILLS, rng.randint(0, 4))
+            jobs = matcher.batch_match(query, pool, query_is_job=True)
+            students = matcher.batch_match(query, pool, query_is_job=False)
+            for i, skills in enumerate(pool):
+                self.assertEqual(jobs.match_score[i], matcher.calculate_match(skills, query))
+                self.assertEqual(students.match_score[i], matcher.calculate_match(query, skills))
+
+    def test_unfitted_batch_matches_pairwise_scores(self):
+        self.check_pairs(SkillMatcher())
+
+    def test_unfitted_batch_does_not_refit_per_pair(self):
+        matcher = SkillMatcher()
+        pool = [['python', 'django'], ['sql'], [], ['machine learning', 'python']]
+        expected = [matcher.calculate_match(skills, ['python', 'sql']) for skills in pool]
+        with mock.patch.object(SkillMatcher, 'calculate_match', side_effect=AssertionError('refit per pair')):
+            batch = matcher.batch_match(['python', 'sql'], pool)
+        self.assertEqual(batch.match_score.tolist(), expected)
+
+    def test_fitted_batch_matches_pairwise_scores(self):
+        rng = random.Random(1)
+        self.check_pairs(SkillMatcher().fit([rng.sample(SKILLS, 3) for _ in range(20)]))
+
+
+if __name__ == '__main__':
+    unittest.main()
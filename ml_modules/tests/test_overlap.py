@@ -0,0 +1,58 @@
+"""
+Test suite for the skill overlap engines
+"""
+import random
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+from skill_matcher.matcher import SkillMatcher
+from skill_taxonomy.taxonomy import SkillTaxonomy
+
+
+class OverlapEngineTestCase(unittest.TestCase):
+    """The bitset engine gives exactly the sparse engine's results"""
+
+    def random_skills(self, rng, known):
+        # Dictionary skills, their aliases' spellings, unknown skills, duplicates and empty lists
+        choices = known + ['ReactJS', 'Python3', 'k8s', 'airflow', 'terraform', 'figma', 'Airflow ', '']
+        return [rng.choice(choices) for _ in range(rng.randint(0, 12))]
+
+    def test_engines_agree_on_random_pools(self):
+        rng = random.Random(7)
+        taxonomy = SkillTaxonomy()
+        known = taxonomy.known_skills
+        engines = {name: SkillMatcher(taxonomy, overlap_engine=name) for name in ('sparse', 'bitset')}
+
+        for trial in range(60):
+            pool = [self.random_skills(rng, known) for _ in range(rng.randint(0, 40))]
+            query = self.random_skills(rng, known)
+            query_is_job = trial % 2 == 0
+            sparse, bitset = (engines[name].batch_match(query, pool, query_is_job=query_is_job)
+                              for name in ('sparse', 'bitset'))
+
+            np.testing.assert_array_equal(sparse.matched_count, bitset.matched_count)
+            np.testing.assert_array_equal(sparse._overlap.job_sizes, bitset._overlap.job_sizes)
+            np.testing.assert_array_equal(sparse.exact_match_percentage, bitset.exact_match_percentage)
+            for i in range(len(pool)):
+                np.testing.assert_array_equal(sparse._overlap.matched_ids(i), bitset._overlap.matched_ids(i))
+                np.testing.assert_array_equal(sparse._overlap.missing_ids(i), bitset._overlap.missing_ids(i))
+                self.assertEqual(sparse.details(i), bitset.details(i))
+
+    def test_empty_query_and_pool(self):
+        for name in ('sparse', 'bitset'):
+            matcher = SkillMatcher(overlap_engine=name)
+            batch = matcher.batch_match([], [['python'], []])
+            self.assertEqual(batch.matched_count.tolist(), [0, 0])
+            self.assertEqual(batch.missing_skills(0), [])
+            batch = matcher.batch_match(['python', 'airflow'], [[], ['Airflow']], query_is_job=True)
+            self.assertEqual(batch.missing_skills(0), ['python', 'airflow'])
+            self.assertEqual(batch.matched_skills(1), ['airflow'])
+            self.assertEqual(len(matcher.batch_match(['python'], [])), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+"""
+Test suite for the resume parser
+"""
+import os
+import pickle
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).parent.parent))
+from benchmarks.generators import generate_resumes, write_resume_pdf
+from resume_parser.parser import ResumeParser
+
+# Words the fake NER pipeline tags, with their labels (only ORG and PRODUCT count as skills)
+ENTITIES = {'Kubeflow': 'PRODUCT', 'Snowflake': 'ORG', 'Bangalore': 'GPE'}
+
+
+class FakeNLP:
+    """Stands in for a spaCy pipeline: tags ENTITIES words and records every pipe() call"""
+
+    pipe_names = ['ner']
+
+    def __init__(self):
+        self.pipe_calls = []
+
+    def pipe(self, texts, batch_size=None, n_process=None):
+        texts = list(texts)
+        self.pipe_calls.append({'texts': len(texts), 'batch_size': batch_size, 'n_process': n_process})
+        for text in texts:
+            yield types.SimpleNamespace(ents=[
+                types.SimpleNamespace(text=word, label_=label) for word, label in ENTITIES.items() if word in text
+            ])
+
+
+def fake_spacy(nlp):
+    """A 'spacy' module whose load() returns nlp"""
+    return types.SimpleNamespace(load=mock.Mock(return_value=nlp))
+
+
+class LazyNLPTestCase(unittest.TestCase):
+    """The spaCy model is only loaded when NER first runs"""
+
+    def test_model_is_loaded_on_first_use_only(self):
+        nlp = FakeNLP()
+        spacy = fake_spacy(nlp)
+        with mock.patch.dict(sys.modules, {'spacy': spacy}):
+            parser = ResumeParser(spacy_model='fake_model')
+            spacy.load.assert_not_called()
+
+            self.assertEqual(parser.extract_skills_nlp('Shipped pipelines on Kubeflow'), ['kubeflow'])
+            self.assertIs(parser.nlp, nlp)
+            parser.load_nlp()
+            spacy.load.assert_called_once_with('fake_model', exclude=ResumeParser.NER_EXCLUDED_COMPONENTS)
+
+    def test_missing_model_disables_ner(self):
+        spacy = types.SimpleNamespace(load=mock.Mock(side_effect=OSError('not installed')))
+        with mock.patch.dict(sys.modules, {'spacy': spacy}), mock.patch('builtins.print'):
+            parser = ResumeParser()
+            self.assertIsNone(parser.nlp)
+            self.assertEqual(parser.extract_skills_nlp_batch(['Kubeflow', 'Snowflake']), [[], []])
+            self.assertIsNone(parser.nlp)
+            spacy.load.assert_called_once()
+
+    def test_pickled_parser_reloads_lazily(self):
+        nlp = FakeNLP()
+        with mock.patch.dict(sys.modules, {'spacy': fake_spacy(nlp)}):
+            parser = ResumeParser(cache=False)
+            parser.load_nlp()
+            copy = pickle.loads(pickle.dumps(parser))
+        self.assertIsNone(copy._nlp)
+        self.assertFalse(copy._nlp_loaded)
+
+
+class BatchExtractionTestCase(unittest.TestCase):
+    """extract_skills_batch runs NER once over every file and agrees with extract_skills"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        texts = generate_resumes(5, seed=21)
+        texts = [text + '\nTools: Kubeflow, Snowflake\nLocation: Bangalore' if i % 2 else text
+                 for i, text in enumerate(texts)]
+        cls.paths = [write_resume_pdf(os.path.join(cls.directory.name, f'resume_{i}.pdf'), text)
+                     for i, text in enumerate(texts)]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def parser(self, nlp, **options):
+        parser = ResumeParser(batch_size=4, **options)
+        parser._nlp, parser._nlp_loaded = nlp, True
+        return parser
+
+    def test_batch_matches_per_document_extraction(self):
+        nlp = FakeNLP()
+        single = [self.parser(nlp, cache=False).extract_skills(path) for path in self.paths]
+        self.assertEqual(len(nlp.pipe_calls), len(self.paths))
+
+        nlp = FakeNLP()
+        batch = self.parser(nlp, cache=False).extract_skills_batch(self.paths)
+        self.assertEqual(nlp.pipe_calls, [{'texts': len(self.paths), 'batch_size': 4, 'n_process': 1}])
+
+        for one, many in zip(single, batch):
+            for key in ('cleaned_text', 'skills', 'skill_count', 'skill_mentions', 'content_hash'):
+                self.assertEqual(many[key], one[key])
+        self.assertIn('kubeflow', batch[1]['skills'])
+        self.assertIn('snowflake', batch[1]['skills'])
+        self.assertNotIn('bangalore', batch[1]['skills'])
+        self.assertNotIn('kubeflow', batch[0]['skills'])
+
+    def test_cached_files_skip_ner(self):
+        nlp = FakeNLP()
+        parser = self.parser(nlp)
+        first = parser.extract_skills(self.paths[0])
+        batch = parser.extract_skills_batch(self.paths)
+        self.assertEqual(nlp.pipe_calls[-1]['texts'], len(self.paths) - 1)
+        self.assertEqual(batch[0]['skills'], first['skills'])
+
+
+
+class PageLimitTestCase(unittest.TestCase):
+    """max_pages / max_chars stop reading early, and short text falls back to PyPDF2"""
+
+    PAGES = 6
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        text = '\n'.join(f'page{page} line{line}' for page in range(1, cls.PAGES + 1) for line in range(1, 6))
+        cls.path = write_resume_pdf(os.path.join(cls.directory.name, 'pages.pdf'), text, lines_per_page=5)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_max_pages(self):
+        parser = ResumeParser(cache=False, max_pages=2)
+        for pages in (list(parser.iter_pages_pdfplumber(self.path)), list(parser.iter_pages_pypdf2(self.path))):
+            self.assertEqual(len(pages), 2)
+            self.assertIn('page2 line5', pages[1])
+
+        text = parser.extract_text(self.path)
+        self.assertIn('page2', text)
+        self.assertNotIn('page3', text)
+        self.assertEqual(len(list(ResumeParser(cache=False).iter_pages_pdfplumber(self.path))), self.PAGES)
+
+    def test_max_chars(self):
+        parser = ResumeParser(cache=False, max_chars=30)
+        text = parser.extract_text(self.path)
+        self.assertEqual(len(text), 30)
+        self.assertTrue(text.startswith('page1 line1'))
+
+    def test_join_pages_stops_reading_at_max_chars(self):
+        read = []
+        closed = []
+
+        def pages():
+            try:
+                for page in range(self.PAGES):
+                    read.append(page)
+                    yield 'x' * 40
+            finally:
+                closed.append(True)
+
+        parser = ResumeParser(cache=False, max_chars=100)
+        self.assertEqual(parser.join_pages(pages()), '\n'.join(['x' * 40] * 3)[:100])
+        self.assertEqual(read, [0, 1, 2])
+        self.assertEqual(closed, [True])
+        self.assertEqual(parser.join_pages(['a', '', 'b']), 'a\nb')
+
+    def test_pypdf2_fallback_only_for_short_text(self):
+        parser = ResumeParser(cache=False, min_text_chars=10)
+        with mock.patch.object(parser, 'extract_text_pypdf2') as fallback:
+            parser.extract_text(self.path)
+        fallback.assert_not_called()
+
+        # pdfplumber text is about 360 characters, so this limit triggers the fallback; the longer text wins
+        parser = ResumeParser(cache=False, min_text_chars=1000)
+        with mock.patch.object(parser, 'extract_text_pypdf2', return_value='y' * 500) as fallback:
+            self.assertEqual(parser.extract_text(self.path), 'y' * 500)
+        fallback.assert_called_once_with(self.path)
+        with mock.patch.object(parser, 'extract_text_pypdf2', return_value='short'):
+            self.assertIn('page6 line5', parser.extract_text(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
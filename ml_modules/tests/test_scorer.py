@@ -0,0 +1,114 @@
+"""
+Test suite for the resume scorer
+"""
+import random
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+from benchmarks.generators import generate_resumes
+from resume_scorer.scorer import ResumeScorer
+
+RESUMES = {
+    'complete': {
+        'text': (
+            'John Doe\njohn.doe@email.com | 9876543210 | linkedin.com/in/johndoe | github.com/johndoe\n\n'
+            'EDUCATION\nB.Tech in Computer Science, XYZ University\nCGPA: 8.5/10\nGraduated: 2024\nBranch: CSE\n\n'
+            'EXPERIENCE\nSoftware Engineering Intern, ABC Company (1 year)\n'
+            '- Developed REST APIs using Django\n- Improved application performance by 30%\n'
+            '- Led a team of 4 and designed the deployment pipeline\n\n'
+            'PROJECTS\nBuilt a placement portal; implemented search and created dashboards\n\n'
+            'SKILLS\nPython, Django, JavaScript, React, SQL, Git\n\n'
+            'Strong communication, collaboration and problem-solving; analytical and proactive'
+        ),
+        'skills': ['Python', 'Django', 'JavaScript', 'React', 'SQL', 'Git'],
+    },
+    'empty': {'text': '', 'skills': []},
+    'substrings': {
+        # Keywords count as substrings: "skilled" has "led", "teammates" has "team", "roles" has "role"
+        'text': 'skilled engineer, teammates, several roles; masters of none\n• 5+ clients',
+        'skills': ['python', 'sql', 'git'],
+    },
+    'long': {
+        'text': '\n\n'.join(['Education Experience Skills Projects'] + ['worked on many things every day'] * 180),
+        'skills': [f'skill{i}' for i in range(12)],
+    },
+    'mid_length': {
+        'text': ' '.join(['Word'] * 250) + '\nemail me at someone@example.org or 987-654-3210, gpa 9',
+        'skills': ['python'] * 8,
+    },
+}
+
+# Scores from the original rule-based score_resume (before features were extracted once and
+# scored from a matrix), so stored scores don't shift when the scorer is rewritten
+GOLDEN = {
+    'complete': (82.0, {'skills_score': 70, 'experience_score': 90, 'education_score': 100, 'formatting_score': 100,
+                        'keywords_score': 60, 'length_score': 50, 'contact_score': 100}),
+    'empty': (11.5, {'skills_score': 30, 'experience_score': 0, 'education_score': 0, 'formatting_score': 0,
+                     'keywords_score': 0, 'length_score': 50, 'contact_score': 0}),
+    'substrings': (34.5, {'skills_score': 50, 'experience_score': 40, 'education_score': 40, 'formatting_score': 0,
+                          'keywords_score': 10, 'length_score': 50, 'contact_score': 0}),
+    'long': (51.25, {'skills_score': 100, 'experience_score': 15, 'education_score': 40, 'formatting_score': 95,
+                     'keywords_score': 0, 'length_score': 40, 'contact_score': 0}),
+    'mid_length': (38.75, {'skills_score': 85, 'experience_score': 0, 'education_score': 30, 'formatting_score': 15,
+                           'keywords_score': 0, 'length_score': 80, 'contact_score': 65}),
+}
+
+
+class GoldenScoreTestCase(unittest.TestCase):
+    """score_resume gives the same scores as the original rule-based scorer"""
+
+    def test_golden_scores(self):
+        scorer = ResumeScorer()
+        for name, resume in RESUMES.items():
+            with self.subTest(name):
+                result = scorer.score_resume(resume)
+                overall, breakdown = GOLDEN[name]
+                self.assertEqual(result['overall_score'], overall)
+                self.assertEqual(result['breakdown'], breakdown)
+
+
+class BulkScoreTestCase(unittest.TestCase):
+    """score_many and scoring from stored features agree with score_resume one resume at a time"""
+
+    def setUp(self):
+        rng = random.Random(3)
+        texts = generate_resumes(200, seed=11)
+        # Skill counts across every skills_score band
+        self.cohort = [{'text': text, 'skills': [f'skill{i}' for i in range(rng.randint(0, 12))]} for text in texts]
+        self.cohort += list(RESUMES.values())
+
+    def check_results(self, results, expected):
+        self.assertEqual(len(results), len(expected))
+        self.assertTrue(np.allclose([r['overall_score'] for r in results], [e['overall_score'] for e in expected]))
+        for result, single in zip(results, expected):
+            self.assertEqual(result['breakdown'], single['breakdown'])
+            self.assertEqual(result['recommendations'], single['recommendations'])
+            self.assertEqual(result['features'], single['features'])
+
+    def test_score_many_matches_score_resume(self):
+        scorer = ResumeScorer()
+        expected = [scorer.score_resume(resume) for resume in self.cohort]
+        self.check_results(scorer.score_many(self.cohort), expected)
+
+    def test_stored_features_rescore_with_new_weights(self):
+        scorer = ResumeScorer()
+        stored = [scorer.score_resume(resume)['features'] for resume in self.cohort]
+        scorer.weights = {**scorer.weights, 'skills': 0.10, 'experience': 0.45}
+        expected = [scorer.score_resume(resume) for resume in self.cohort]
+
+        matrix = scorer.features_to_matrix(stored)
+        self.assertEqual(matrix.shape, (len(self.cohort), len(stored[0])))
+        self.check_results(scorer.score_feature_matrix(matrix), expected)
+
+    def test_empty_cohort(self):
+        scorer = ResumeScorer()
+        self.assertEqual(scorer.score_many([]), [])
+        self.assertEqual(scorer.score_feature_matrix(scorer.features_to_matrix([])), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+Test suite for the similar jobs index
+"""
+import random
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from recommender.similarity import SimilarJobsIndex
+from skill_matcher.matcher import SkillMatcher
+
+SKILLS = ['python', 'django', 'flask', 'sql', 'react', 'node', 'aws', 'docker', 'java', 'spring', 'airflow']
+
+
+class SimilarJobsIndexTestCase(unittest.TestCase):
+    """Incremental upserts and removes keep the index identical to a fresh build"""
+
+    def random_job(self, rng, job_id):
+        return {
+            'id': job_id,
+            'title': f'Job {job_id}',
+            'company': rng.choice(['A', 'B']),
+            'skills_required': rng.sample(SKILLS, rng.randint(0, 4))
+        }
+
+    def rebuilt(self, index, matcher):
+        # Same vocabulary, and jobs in the index's insertion order so ties break the same way
+        jobs = [{**index._jobs[job_id], 'skills_required': index._skills[job_id]}
+                for job_id in sorted(index._jobs, key=index._order.get)]
+        return SimilarJobsIndex(matcher, neighbours=index.neighbours).build(jobs)
+
+    def neighbours(self, index, job_id):
+        return [(job['id'], job['similarity_score']) for job in index.similar(job_id, top_n=index.neighbours)]
+
+    def test_incremental_updates_match_a_fresh_build(self):
+        rng = random.Random(11)
+        matcher = SkillMatcher().fit([rng.sample(SKILLS, 3) for _ in range(30)])
+        index = SimilarJobsIndex(matcher, neighbours=4).build([self.random_job(rng, i) for i in range(15)])
+        next_id = 15
+
+        for step in range(150):
+            action = rng.random()
+            if action < 0.4 or not len(index):
+                index.upsert(self.random_job(rng, next_id))
+                next_id += 1
+            elif action < 0.7:
+                index.upsert(self.random_job(rng, rng.choice(list(index._jobs))))
+            else:
+                index.remove(rng.choice(list(index._jobs)))
+
+            expected = self.rebuilt(index, matcher)
+            for job_id in index._jobs:
+                self.assertEqual(self.neighbours(index, job_id), self.neighbours(expected, job_id),
+                                 f'step {step}, job {job_id}')
+
+    def test_removed_job_is_never_returned(self):
+        matcher = SkillMatcher().fit([['python', 'django'], ['python', 'sql']])
+        jobs = [{'id': i, 'title': f'Job {i}', 'company': 'A', 'skills_required': ['python', 'django']}
+                for i in range(3)]
+        index = SimilarJobsIndex(matcher).build(jobs)
+        index.remove(1)
+        self.assertNotIn(1, index)
+        self.assertEqual([job['id'] for job in index.similar(0)], [2])
+        self.assertEqual(index.similar(1), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Test suite for the skill taxonomy
+"""
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from skill_taxonomy.extractor import SkillExtractor
+from skill_taxonomy.taxonomy import SkillTaxonomy
+from skill_matcher.matcher import SkillMatcher
+
+
+class CanonicalizeTestCase(unittest.TestCase):
+    """Test alias and spelling-variant canonicalization"""
+
+    def setUp(self):
+        self.taxonomy = SkillTaxonomy()
+
+    def test_aliases_map_to_canonical_names(self):
+        for raw, canonical in [
+            ('ReactJS', 'react'), ('react.js', 'react'), ('React', 'react'),
+            ('Python3', 'python'), ('python 3', 'python'), ('Node.JS', 'node'), ('NodeJS', 'node'),
+            ('K8s', 'kubernetes'), ('Amazon   Web Services', 'aws'), ('scikit learn', 'scikit-learn'),
+            ('Vue-JS', 'vue'), ('  Spring Boot ', 'spring'),
+        ]:
+            self.assertEqual(self.taxonomy.canonicalize(raw), canonical, raw)
+
+    def test_unknown_skills_are_normalized_only(self):
+        self.assertEqual(self.taxonomy.canonicalize('  Apache   Airflow '), 'apache airflow')
+        self.assertEqual(
+            self.taxonomy.canonicalize_all(['ReactJS', 'react', 'Airflow', '', 'react.js', 'airflow']),
+            ['react', 'airflow']
+        )
+
+    def test_custom_dictionary(self):
+        taxonomy = SkillTaxonomy({'terraform': ['tf'], 'python': []})
+        self.assertEqual(taxonomy.canonicalize('TF'), 'terraform')
+        self.assertEqual(taxonomy.canonicalize('python3'), 'python3')
+        self.assertEqual(len(taxonomy), 2)
+
+
+class SkillIdTestCase(unittest.TestCase):
+    """Test dictionary ids and request-local ids for unknown skills"""
+
+    def test_dictionary_ids_are_stable(self):
+        """Ids follow dictionary order, whatever was looked up before and in any instance"""
+        first = SkillTaxonomy()
+        first.id_space().skill_ids(['zzz', 'airflow', 'rust'])
+        second = SkillTaxonomy()
+        for skill in ['python', 'react', 'scrum', 'ReactJS']:
+            self.assertEqual(first.skill_id(skill), second.skill_id(skill))
+        self.assertEqual(first.skill_id('python'), 0)
+        self.assertEqual(first.skill_id('reactjs'), first.skill_id('react'))
+        self.assertEqual(first.name(first.skill_id('k8s')), 'kubernetes')
+        self.assertEqual(first.known_skills[:2], ['python', 'java'])
+
+    def test_skill_ids_are_sorted_and_unique(self):
+        taxonomy = SkillTaxonomy()
+        ids = taxonomy.id_space().skill_ids(['React', 'python', 'reactjs', 'Python3', ''])
+        self.assertEqual(ids.tolist(), sorted({taxonomy.skill_id('python'), taxonomy.skill_id('react')}))
+
+    def test_unknown_skills_do_not_grow_the_taxonomy(self):
+        taxonomy = SkillTaxonomy()
+        size = len(taxonomy)
+        matcher = SkillMatcher(taxonomy)
+        for index in range(50):
+            batch = matcher.batch_match([f'tool {index}', 'python'], [[f'tool {index}'], ['python3']])
+            self.assertEqual(batch.matched_skills(0), [f'tool {index}'])
+            matcher.calculate_match_detailed([f'framework {index}'], [f'framework {index}'])
+
+        self.assertEqual(len(taxonomy), size)
+        self.assertIsNone(taxonomy.skill_id('tool 0'))
+
+        id_space = taxonomy.id_space()
+        ids = id_space.skill_ids(['tool 0', 'python', 'tool 1'])
+        self.assertEqual(ids.tolist(), [taxonomy.skill_id('python'), size, size + 1])
+        self.assertEqual(id_space.names(ids), ['python', 'tool 0', 'tool 1'])
+
+
+
+class SkillExtractorTestCase(unittest.TestCase):
+    """Test single-pass dictionary skill extraction"""
+
+    def setUp(self):
+        self.extractor = SkillExtractor(SkillTaxonomy())
+
+    def test_aliases_and_multi_word_skills(self):
+        text = 'Built ReactJS apps on Node.js with Python3; Machine\nLearning and Amazon Web Services.'
+        self.assertEqual(
+            self.extractor.extract_skills(text),
+            ['react', 'node', 'python', 'machine learning', 'aws']
+        )
+
+    def test_word_boundaries(self):
+        # "js" is not found inside "react.js", "c" is not a dictionary skill, "golang" is go
+        self.assertEqual(self.extractor.extract_skills('react.js, C++ and golang, not javascripting'),
+                         ['react', 'c++', 'go'])
+        self.assertEqual(self.extractor.extract_skills('Gopher and Rusty'), [])
+
+    def test_counts_and_positions(self):
+        text = 'Python, Django, python3'
+        found = self.extractor.extract(text)
+        self.assertEqual(found['skills'], ['python', 'django'])
+        self.assertEqual(found['counts'], {'python': 2, 'django': 1})
+        self.assertEqual([text[start:end] for start, end in found['positions']['python']], ['Python', 'python3'])
+
+
+if __name__ == '__main__':
+    unittest.main()